@@ -8,6 +8,9 @@ scorecards.
 See: .claude/skills/gz-adr-evaluate/assets/ADR_EVALUATION_FRAMEWORK.md
 """
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
@@ -81,6 +84,19 @@ class AdrEvalResult(BaseModel):
     timestamp: str
 
 
+class AdrPortfolioEval(BaseModel):
+    """Aggregate of one batch evaluation across every ADR package."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    results: list[AdrEvalResult] = Field(..., description="Scorecards in ADR version order")
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="ADR id -> why its package could not be scored"
+    )
+    verdict_counts: dict[str, int] = Field(..., description="Number of ADRs per verdict")
+    timestamp: str
+
+
 # ---------------------------------------------------------------------------
 # ADR dimension weights (must sum to 1.0)
 # ---------------------------------------------------------------------------
@@ -130,12 +146,11 @@ def _word_count(text: str) -> int:
 # ---------------------------------------------------------------------------
 
 
-def resolve_adr_package(project_root: Path, adr_id: str) -> tuple[Path, str, list[Path]]:
-    """Locate ADR file and discover OBPI briefs.
+_ADR_DIR_RE = re.compile(r"^(ADR-(\d+)\.(\d+)\.(\d+))(?:-|$)")
 
-    Returns ``(adr_path, adr_content, obpi_paths)``.
-    Raises ``FileNotFoundError`` when the ADR cannot be found.
-    """
+
+def _design_root(project_root: Path) -> Path:
+    """Return the ADR package root, raising ``FileNotFoundError`` when missing."""
     config_path = project_root / ".gzkit.json"
     if config_path.exists():
         config = GzkitConfig.load(config_path)
@@ -146,34 +161,67 @@ def resolve_adr_package(project_root: Path, adr_id: str) -> tuple[Path, str, lis
     if not design_root.exists():
         msg = f"ADR package root not found: {design_root}"
         raise FileNotFoundError(msg)
+    return design_root
+
+
+def _package_files(adr_dir: Path, adr_id: str) -> tuple[Path, list[Path]]:
+    """Return ``(adr_path, obpi_paths)`` for the package in *adr_dir*."""
+    adr_files = list(adr_dir.glob(f"{adr_id}*.md"))
+    if not adr_files:
+        msg = f"ADR markdown not found in {adr_dir}"
+        raise FileNotFoundError(msg)
+
+    obpi_dir = adr_dir / "obpis"
+    obpi_paths: list[Path] = []
+    if obpi_dir.is_dir():
+        obpi_paths = sorted(obpi_dir.glob("OBPI-*.md"))
+    return adr_files[0], obpi_paths
+
+
+def resolve_adr_package(project_root: Path, adr_id: str) -> tuple[Path, str, list[Path]]:
+    """Locate ADR file and discover OBPI briefs.
+
+    Returns ``(adr_path, adr_content, obpi_paths)``.
+    Raises ``FileNotFoundError`` when the ADR cannot be found.
+    """
+    design_root = _design_root(project_root)
     # Search all buckets for the ADR directory
     candidates: list[Path] = []
     for bucket in design_root.iterdir():
         if not bucket.is_dir():
             continue
         for d in bucket.iterdir():
-            if d.is_dir() and d.name.startswith(adr_id):
+            # Match on a whole id: ADR-0.0.1 must not resolve to ADR-0.0.10-*.
+            if d.is_dir() and (d.name == adr_id or d.name.startswith(f"{adr_id}-")):
                 candidates.append(d)
 
     if not candidates:
         msg = f"ADR package not found for {adr_id}"
         raise FileNotFoundError(msg)
 
-    adr_dir = candidates[0]
-    adr_files = list(adr_dir.glob(f"{adr_id}*.md"))
-    if not adr_files:
-        msg = f"ADR markdown not found in {adr_dir}"
-        raise FileNotFoundError(msg)
-
-    adr_path = adr_files[0]
+    adr_path, obpi_paths = _package_files(candidates[0], adr_id)
     adr_content = adr_path.read_text(encoding="utf-8")
+    return adr_path, adr_content, obpi_paths
 
-    obpi_dir = adr_dir / "obpis"
-    obpi_paths: list[Path] = []
-    if obpi_dir.is_dir():
-        obpi_paths = sorted(obpi_dir.glob("OBPI-*.md"))
 
-    return adr_path, adr_content, obpi_paths
+def discover_adr_packages(project_root: Path) -> list[tuple[str, Path]]:
+    """Enumerate every ADR package directory in one walk of the bucket tree.
+
+    Returns ``(adr_id, adr_dir)`` pairs in ADR version order; when two
+    directories claim the same ADR id the first by name wins.
+    """
+    packages: dict[str, tuple[tuple[int, int, int], Path]] = {}
+    design_root = _design_root(project_root)
+    for bucket in sorted(design_root.iterdir()):
+        if not bucket.is_dir():
+            continue
+        for d in sorted(bucket.iterdir()):
+            match = _ADR_DIR_RE.match(d.name)
+            if match and d.is_dir() and match.group(1) not in packages:
+                version = (int(match.group(2)), int(match.group(3)), int(match.group(4)))
+                packages[match.group(1)] = (version, d)
+    ordered = sorted(packages.items(), key=lambda item: item[1][0])
+    return [(adr_id, adr_dir) for adr_id, (_version, adr_dir) in ordered]
 
 
 # ---------------------------------------------------------------------------
@@ -257,7 +305,19 @@ def evaluate_adr(
     red_team_results: list[RedTeamChallengeResult] | None = None,
 ) -> AdrEvalResult:
     """Run full deterministic evaluation for an ADR package."""
-    adr_path, adr_content, obpi_paths = resolve_adr_package(project_root, adr_id)
+    _adr_path, adr_content, obpi_paths = resolve_adr_package(project_root, adr_id)
+    return _score_package(
+        adr_id, adr_content, obpi_paths, red_team_results, datetime.now(UTC).isoformat()
+    )
+
+
+def _score_package(
+    adr_id: str,
+    adr_content: str,
+    obpi_paths: list[Path],
+    red_team_results: list[RedTeamChallengeResult] | None,
+    timestamp: str,
+) -> AdrEvalResult:
     obpi_contents = [p.read_text(encoding="utf-8") for p in obpi_paths]
 
     adr_dims = score_adr_deterministic(adr_content, len(obpi_paths), obpi_paths, obpi_contents)
@@ -273,7 +333,54 @@ def evaluate_adr(
         red_team_results=red_team_results,
         verdict=verdict,
         action_items=action_items,
-        timestamp=datetime.now(UTC).isoformat(),
+        timestamp=timestamp,
+    )
+
+
+def _evaluate_package_dir(job: tuple[str, str, str]) -> AdrEvalResult | str:
+    """Process-pool worker: score one package, or return why it could not be."""
+    adr_id, adr_dir, timestamp = job
+    try:
+        adr_path, obpi_paths = _package_files(Path(adr_dir), adr_id)
+        adr_content = adr_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError) as exc:
+        return str(exc)
+    return _score_package(adr_id, adr_content, obpi_paths, None, timestamp)
+
+
+def evaluate_adr_packages(
+    packages: list[tuple[str, Path]],
+    *,
+    workers: int | None = None,
+) -> AdrPortfolioEval:
+    """Score many ADR packages on a process pool and aggregate the scorecards.
+
+    *packages* are ``(adr_id, adr_dir)`` pairs as returned by
+    :func:`discover_adr_packages`. ``workers`` defaults to the CPU count;
+    ``1`` scores in-process. The report is deterministic: results keep the
+    input order and share one run timestamp.
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    jobs = [(adr_id, str(adr_dir), timestamp) for adr_id, adr_dir in packages]
+    pool_size = min(workers or os.cpu_count() or 1, len(jobs))
+    if pool_size > 1:
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            outcomes = list(pool.map(_evaluate_package_dir, jobs))
+    else:
+        outcomes = [_evaluate_package_dir(job) for job in jobs]
+
+    results: list[AdrEvalResult] = []
+    errors: dict[str, str] = {}
+    for (adr_id, _dir, _ts), outcome in zip(jobs, outcomes, strict=True):
+        if isinstance(outcome, str):
+            errors[adr_id] = outcome
+        else:
+            results.append(outcome)
+    return AdrPortfolioEval(
+        results=results,
+        errors=errors,
+        verdict_counts={v.value: sum(r.verdict == v for r in results) for v in EvalVerdict},
+        timestamp=timestamp,
     )
 
 
@@ -4,19 +4,20 @@ ARB's long-term value is reducing the *rate* of agent-authored defects
 (first-pass failures), not generating workflow noise. This module reads recent
 receipt JSON files and produces a compact report suitable for a
 human-in-the-loop guardrail tuning loop.
+
+Counters come from the receipt index (``gzkit.arb.index``), so advice over
+months of receipts does not re-parse every receipt file.
 """
 
 from __future__ import annotations
 
-import json
 from collections import Counter
 from pathlib import Path
-from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from gzkit.arb.index import ReceiptIndex
 from gzkit.arb.paths import receipts_root
-from gzkit.arb.ruff_reporter import SCHEMA_ID as LINT_SCHEMA_ID
 
 
 class ArbAdvice(BaseModel):
@@ -32,13 +33,6 @@ class ArbAdvice(BaseModel):
     recommendations: list[str] = Field(default_factory=list)
 
 
-def _iter_receipt_paths(root: Path, *, limit: int) -> list[Path]:
-    paths = sorted(root.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if limit < 0:
-        return paths
-    return paths[:limit]
-
-
 def _rule_category(rule: str) -> str:
     if not rule:
         return "unknown"
@@ -103,54 +97,15 @@ def collect_arb_advice(
 ) -> ArbAdvice:
     """Collect and summarize recent ARB receipts."""
     receipts_dir = root or receipts_root()
-    rule_counts: Counter[str] = Counter()
-    path_counts: Counter[str] = Counter()
-    scanned = 0
-    failed = 0
-    findings_total = 0
-
-    for receipt_path in _iter_receipt_paths(receipts_dir, limit=limit):
-        try:
-            payload: Any = json.loads(receipt_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(payload, dict):
-            continue
-        if payload.get("schema") != LINT_SCHEMA_ID:
-            continue
-        scanned += 1
-        exit_status = int(payload.get("exit_status") or 0)
-        if exit_status != 0:
-            failed += 1
-
-        total = payload.get("findings_total")
-        if isinstance(total, int) and total >= 0:
-            findings_total += total
-        else:
-            findings = payload.get("findings")
-            if isinstance(findings, list):
-                findings_total += len(findings)
-
-        findings = payload.get("findings")
-        if not isinstance(findings, list):
-            continue
-        for item in findings:
-            if not isinstance(item, dict):
-                continue
-            rule = item.get("rule")
-            path = item.get("path")
-            if isinstance(rule, str) and rule:
-                rule_counts[rule] += 1
-            if isinstance(path, str) and path:
-                path_counts[path] += 1
+    rollup = ReceiptIndex.open(receipts_dir).window(limit)
 
     return ArbAdvice(
-        scanned_receipts=scanned,
-        failed_receipts=failed,
-        findings_total=findings_total,
-        top_rules=rule_counts.most_common(10),
-        top_paths=path_counts.most_common(10),
-        recommendations=_recommendations_for_counts(rule_counts),
+        scanned_receipts=rollup.scanned,
+        failed_receipts=rollup.failed,
+        findings_total=rollup.findings_total,
+        top_rules=rollup.rule_counts.most_common(10),
+        top_paths=rollup.path_counts.most_common(10),
+        recommendations=_recommendations_for_counts(rollup.rule_counts),
     )
 
 
@@ -0,0 +1,298 @@
+"""Append-maintained index of ARB receipts with rollup counters.
+
+Advice, pattern extraction and validation used to glob the receipts
+directory and parse every receipt JSON on each call. The index keeps one
+compact record per receipt (run id, timestamp, schema, outcome, rule and
+path counters, file name and stat stamp) in ``.arb-index.jsonl`` beside the
+receipts, so those queries read one small file instead of thousands.
+
+The file is append-only: reporters append a record when they write a
+receipt, and a later line for the same file supersedes earlier ones.
+Opening the index stats the ``*.json`` files (no parsing) to pick up
+receipts that were added, edited or removed behind its back, and compacts
+the file when superseded lines pile up. The index is derived data: delete
+it and it is rebuilt on next use.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from gzkit.arb.ruff_reporter import SCHEMA_ID as LINT_SCHEMA_ID
+
+INDEX_NAME = ".arb-index.jsonl"
+INDEX_SCHEMA = "gzkit.arb.receipt_index.v1"
+
+
+class ReceiptRecord(BaseModel):
+    """Index entry summarizing one receipt file."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    file: str = Field(..., description="Receipt file name within the receipts root")
+    mtime_ns: int = Field(..., description="Receipt file mtime when indexed")
+    size: int = Field(..., description="Receipt file size when indexed")
+    parse_error: str | None = Field(None, description="Why the receipt is not a JSON object")
+    schema_id: Any = Field(None, description="Raw 'schema' field of the receipt")
+    run_id: str | None = None
+    timestamp_utc: str | None = None
+    exit_status: int = Field(0, description="Receipt exit_status (0 when absent)")
+    findings_total: int = Field(0, description="Declared total findings, incl. truncated")
+    rules: dict[str, int] = Field(default_factory=dict, description="Findings per rule")
+    paths: dict[str, int] = Field(default_factory=dict, description="Findings per path")
+    rule_paths: dict[str, list[str]] = Field(
+        default_factory=dict, description="First three distinct paths per rule"
+    )
+    step_name: Any = Field(None, description="step.name for step receipts")
+    step_command: Any = Field(None, description="step.command for step receipts")
+    schema_error: str | None = Field(None, description="Cached JSON-schema error, if any")
+    schema_stamp: list[int] | None = Field(
+        None, description="(mtime_ns, size) of the schema file schema_error was computed with"
+    )
+
+    @property
+    def is_lint(self) -> bool:
+        """True for lint receipts (the ones advice and patterns aggregate)."""
+        return self.parse_error is None and self.schema_id == LINT_SCHEMA_ID
+
+
+class ArbRollup:
+    """Lint-receipt counters over a set of index records."""
+
+    def __init__(self) -> None:
+        self.scanned = 0
+        self.failed = 0
+        self.findings_total = 0
+        self.rule_counts: Counter[str] = Counter()
+        self.path_counts: Counter[str] = Counter()
+
+    def add(self, record: ReceiptRecord) -> None:
+        """Fold one record into the counters (non-lint records are ignored)."""
+        if not record.is_lint:
+            return
+        self.scanned += 1
+        if record.exit_status != 0:
+            self.failed += 1
+        self.findings_total += record.findings_total
+        self.rule_counts.update(record.rules)
+        self.path_counts.update(record.paths)
+
+    @classmethod
+    def of(cls, records: Iterable[ReceiptRecord]) -> ArbRollup:
+        """Fold *records* into a new rollup."""
+        rollup = cls()
+        for record in records:
+            rollup.add(record)
+        return rollup
+
+
+def summarize_receipt(path: Path, st: os.stat_result) -> ReceiptRecord:
+    """Parse one receipt file into an index record."""
+    base: dict[str, Any] = {"file": path.name, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    try:
+        payload: Any = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        return ReceiptRecord(**base, parse_error=f"invalid JSON ({exc.msg})")
+    except ValueError as exc:
+        return ReceiptRecord(**base, parse_error=f"invalid JSON ({exc})")
+    if not isinstance(payload, dict):
+        return ReceiptRecord(**base, parse_error="receipt JSON was not an object")
+    return ReceiptRecord(**base, **_payload_fields(payload))
+
+
+def _exit_status(value: object) -> int:
+    try:
+        return int(value or 0)  # ty: ignore[invalid-argument-type]
+    except (TypeError, ValueError):
+        return 1
+
+
+def _payload_fields(payload: dict[str, Any]) -> dict[str, Any]:
+    rules: Counter[str] = Counter()
+    paths: Counter[str] = Counter()
+    rule_paths: dict[str, list[str]] = {}
+    findings = payload.get("findings")
+    for item in findings if isinstance(findings, list) else []:
+        if not isinstance(item, dict):
+            continue
+        rule = item.get("rule")
+        path = item.get("path")
+        valid_path = isinstance(path, str) and bool(path)
+        if isinstance(rule, str) and rule:
+            rules[rule] += 1
+            samples = rule_paths.setdefault(rule, [])
+            if valid_path and len(samples) < 3 and path not in samples:
+                samples.append(path)
+        if valid_path:
+            paths[path] += 1
+
+    declared = payload.get("findings_total")
+    if isinstance(declared, int) and declared >= 0:
+        findings_total = declared
+    else:
+        findings_total = len(findings) if isinstance(findings, list) else 0
+
+    step = payload.get("step")
+    step = step if isinstance(step, dict) else {}
+    run_id = payload.get("run_id")
+    timestamp = payload.get("timestamp_utc")
+    return {
+        "schema_id": payload.get("schema"),
+        "run_id": run_id if isinstance(run_id, str) else None,
+        "timestamp_utc": timestamp if isinstance(timestamp, str) else None,
+        "exit_status": _exit_status(payload.get("exit_status")),
+        "findings_total": findings_total,
+        "rules": dict(rules),
+        "paths": dict(paths),
+        "rule_paths": {rule: samples for rule, samples in rule_paths.items() if samples},
+        "step_name": step.get("name"),
+        "step_command": step.get("command"),
+    }
+
+
+class ReceiptIndex:
+    """Receipt records for one receipts directory, kept in sync with the files."""
+
+    def __init__(self, receipts_dir: Path) -> None:
+        self.receipts_dir = receipts_dir
+        self.path = receipts_dir / INDEX_NAME
+        self._records: dict[str, ReceiptRecord] = {}
+        self._lines = 0
+        self._header_ok = False
+        self._totals: ArbRollup | None = None
+
+    @classmethod
+    def open(cls, receipts_dir: Path) -> ReceiptIndex:
+        """Load the index and reconcile it with the receipt files on disk."""
+        index = cls(receipts_dir)
+        index._load()
+        index._reconcile()
+        return index
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        if not lines or lines[0] != json.dumps({"schema": INDEX_SCHEMA}):
+            return
+        self._header_ok = True
+        for line in lines[1:]:
+            try:
+                record = ReceiptRecord.model_validate_json(line)
+            except ValidationError:
+                continue
+            self._records[record.file] = record
+            self._lines += 1
+
+    def _reconcile(self) -> None:
+        seen: set[str] = set()
+        fresh: list[ReceiptRecord] = []
+        with os.scandir(self.receipts_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                st = entry.stat()
+                known = self._records.get(entry.name)
+                if known is None or (known.mtime_ns, known.size) != (st.st_mtime_ns, st.st_size):
+                    fresh.append(summarize_receipt(Path(entry.path), st))
+        removed = set(self._records) - seen
+        for name in removed:
+            del self._records[name]
+        for record in fresh:
+            self._records[record.file] = record
+        if removed or not self._header_ok or self._lines > 2 * max(len(self._records), 1):
+            self._rewrite()
+        elif fresh:
+            self._append(fresh)
+
+    def _append(self, records: list[ReceiptRecord]) -> None:
+        if not self._header_ok:
+            self._rewrite()
+            return
+        text = "".join(record.model_dump_json() + "\n" for record in records)
+        try:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(text)
+        except OSError:
+            return
+        self._lines += len(records)
+
+    def _rewrite(self) -> None:
+        lines = [json.dumps({"schema": INDEX_SCHEMA})]
+        lines.extend(record.model_dump_json() for record in self.recent(-1))
+        tmp = self.path.with_name(f"{INDEX_NAME}.tmp")
+        try:
+            tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self._header_ok = True
+        self._lines = len(self._records)
+
+    def update(self, record: ReceiptRecord) -> None:
+        """Replace the record for ``record.file`` and append it to the index file."""
+        previous = self._records.get(record.file)
+        self._records[record.file] = record
+        if self._totals is not None:
+            if previous is None:
+                self._totals.add(record)
+            else:
+                self._totals = None
+        self._append([record])
+
+    def recent(self, limit: int) -> list[ReceiptRecord]:
+        """Return the *limit* most recently modified records (all when negative)."""
+        ordered = sorted(self._records.values(), key=lambda r: (-r.mtime_ns, r.file))
+        return ordered if limit < 0 else ordered[:limit]
+
+    @property
+    def totals(self) -> ArbRollup:
+        """Rollup over every indexed receipt, maintained as records are added."""
+        if self._totals is None:
+            self._totals = ArbRollup.of(self._records.values())
+        return self._totals
+
+    def window(self, limit: int) -> ArbRollup:
+        """Rollup over the *limit* most recent receipts."""
+        if limit < 0 or limit >= len(self._records):
+            return self.totals
+        return ArbRollup.of(self.recent(limit))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def index_receipt(receipt_path: Path) -> None:
+    """Append a freshly written receipt to its directory's index, if one exists.
+
+    Reporters call this after writing a receipt. When there is no index yet
+    nothing is done: the first query builds it from the files.
+    """
+    index_path = receipt_path.parent / INDEX_NAME
+    if not index_path.exists():
+        return
+    try:
+        record = summarize_receipt(receipt_path, receipt_path.stat())
+        with index_path.open("a", encoding="utf-8") as handle:
+            handle.write(record.model_dump_json() + "\n")
+    except OSError:
+        return
+
+
+__all__ = [
+    "INDEX_NAME",
+    "ArbRollup",
+    "ReceiptIndex",
+    "ReceiptRecord",
+    "index_receipt",
+    "summarize_receipt",
+]
@@ -7,15 +7,13 @@ documents.
 
 from __future__ import annotations
 
-import json
 from collections import Counter
 from pathlib import Path
-from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from gzkit.arb.index import ReceiptIndex
 from gzkit.arb.paths import receipts_root
-from gzkit.arb.ruff_reporter import SCHEMA_ID as LINT_SCHEMA_ID
 
 # Map ruff rules to agent-actionable guidance.
 # Key: rule code (or prefix), Value: (anti-pattern description, correct approach)
@@ -103,13 +101,6 @@ class PatternReport(BaseModel):
     candidates: list[PatternCandidate] = Field(default_factory=list)
 
 
-def _iter_receipt_paths(root: Path, *, limit: int) -> list[Path]:
-    paths = sorted(root.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if limit < 0:
-        return paths
-    return paths[:limit]
-
-
 def _get_guidance(rule: str) -> tuple[str, str]:
     """Return guidance for a rule, preferring exact match then prefix."""
     if rule in RULE_GUIDANCE:
@@ -132,33 +123,17 @@ def collect_patterns(
     scanned = 0
     total_findings = 0
 
-    for receipt_path in _iter_receipt_paths(receipts_dir, limit=limit):
-        try:
-            payload: Any = json.loads(receipt_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(payload, dict):
-            continue
-        if payload.get("schema") != LINT_SCHEMA_ID:
+    for record in ReceiptIndex.open(receipts_dir).recent(limit):
+        if not record.is_lint:
             continue
         scanned += 1
-
-        findings = payload.get("findings")
-        if not isinstance(findings, list):
-            continue
-
-        for item in findings:
-            if not isinstance(item, dict):
-                continue
-            rule = item.get("rule")
-            path = item.get("path")
-            if isinstance(rule, str) and rule:
-                rule_counts[rule] += 1
-                total_findings += 1
-                if isinstance(path, str) and path:
-                    samples = rule_paths.setdefault(rule, [])
-                    if len(samples) < 3 and path not in samples:
-                        samples.append(path)
+        rule_counts.update(record.rules)
+        total_findings += sum(record.rules.values())
+        for rule, paths in record.rule_paths.items():
+            samples = rule_paths.setdefault(rule, [])
+            for path in paths:
+                if len(samples) < 3 and path not in samples:
+                    samples.append(path)
 
     candidates: list[PatternCandidate] = []
     for rule, count in rule_counts.most_common(20):
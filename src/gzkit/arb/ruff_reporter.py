@@ -135,10 +135,13 @@ def _parse_findings(raw: str, stderr: str) -> list[dict[str, object]]:
 
 
 def _write_receipt(receipt: dict[str, object]) -> Path:
+    from gzkit.arb.index import index_receipt  # noqa: PLC0415 -- index imports SCHEMA_ID
+
     out_dir = receipts_root()
     path = out_dir / f"{receipt['run_id']}.json"
     text = _canonical(receipt)
     path.write_text(text, encoding="utf-8")
+    index_receipt(path)
     return path
 
 
@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from gzkit.arb.index import index_receipt
 from gzkit.arb.paths import receipts_root
 from gzkit.arb.ruff_reporter import _git_context
 
@@ -34,6 +35,7 @@ def _write_receipt(receipt: dict[str, object]) -> Path:
     out_dir = receipts_root()
     path = out_dir / f"{receipt['run_id']}.json"
     path.write_text(_canonical(receipt), encoding="utf-8")
+    index_receipt(path)
     return path
 
 
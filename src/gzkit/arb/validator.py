@@ -10,14 +10,15 @@ import json
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 from pydantic import BaseModel, ConfigDict, Field
 
+from gzkit.arb.index import ReceiptIndex, ReceiptRecord
 from gzkit.arb.paths import receipts_root
 from gzkit.arb.ruff_reporter import SCHEMA_ID as LINT_SCHEMA_ID
 from gzkit.arb.step_reporter import SCHEMA_ID as STEP_SCHEMA_ID
 from gzkit.commands.common import get_project_root
+from gzkit.schemas import schema_file_validator
 
 
 class ArbReceiptValidationResult(BaseModel):
@@ -66,15 +67,28 @@ def _schema_path_for_id(schema_id: str) -> Path | None:
     return None
 
 
-def _load_schema(schema_path: Path) -> dict[str, Any]:
-    return json.loads(schema_path.read_text(encoding="utf-8"))
+def _schema_error(index: ReceiptIndex, record: ReceiptRecord, schema_path: Path) -> str | None:
+    """Return the JSON-schema error for *record*, reusing the index's cached verdict.
 
-
-def _iter_receipt_paths(root: Path, *, limit: int) -> list[Path]:
-    paths = sorted(root.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if limit < 0:
-        return paths
-    return paths[:limit]
+    The verdict is recomputed (and re-appended to the index) only when the
+    receipt or its schema file changed since it was recorded.
+    """
+    try:
+        st = schema_path.stat()
+    except OSError:
+        st = None
+    stamp = [st.st_mtime_ns, st.st_size] if st is not None else None
+    if stamp is not None and record.schema_stamp == stamp:
+        return record.schema_error
+    payload = json.loads((index.receipts_dir / record.file).read_text(encoding="utf-8"))
+    try:
+        schema_file_validator(schema_path).validate(payload)
+        error = None
+    except ValidationError as exc:
+        error = exc.message
+    if stamp is not None:
+        index.update(record.model_copy(update={"schema_error": error, "schema_stamp": stamp}))
+    return error
 
 
 def validate_receipts(
@@ -84,6 +98,9 @@ def validate_receipts(
 ) -> ArbReceiptValidationResult:
     """Validate recent ARB receipts.
 
+    Receipts are read through the receipt index; only receipts (or schemas)
+    that changed since their last validation are parsed and re-validated.
+
     Args:
         limit: Maximum number of most-recent receipts to validate.
         root: Override receipts directory (primarily for tests).
@@ -99,52 +116,39 @@ def validate_receipts(
     non_canonical = 0
     errors: list[str] = []
 
-    schema_validators: dict[str, Any] = {}
-
-    for receipt_path in _iter_receipt_paths(receipts_dir, limit=limit):
+    index = ReceiptIndex.open(receipts_dir)
+    for record in index.recent(limit):
         scanned += 1
-        try:
-            payload = json.loads(receipt_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+        if record.parse_error is not None:
             invalid += 1
-            errors.append(f"{receipt_path.name}: invalid JSON ({exc.msg})")
+            errors.append(f"{record.file}: {record.parse_error}")
             continue
 
-        if not isinstance(payload, dict):
-            invalid += 1
-            errors.append(f"{receipt_path.name}: receipt JSON was not an object")
-            continue
-
-        schema_id = payload.get("schema")
+        schema_id = record.schema_id
         if not isinstance(schema_id, str) or not schema_id:
             invalid += 1
-            errors.append(f"{receipt_path.name}: missing/invalid schema field")
+            errors.append(f"{record.file}: missing/invalid schema field")
             continue
 
         schema_path = _schema_path_for_id(schema_id)
         if schema_path is None:
             unknown += 1
             invalid += 1
-            errors.append(f"{receipt_path.name}: unknown schema '{schema_id}'")
+            errors.append(f"{record.file}: unknown schema '{schema_id}'")
             continue
 
-        if schema_id not in schema_validators:
-            schema = _load_schema(schema_path)
-            schema_validators[schema_id] = Draft202012Validator(schema)
-
-        validator = schema_validators[schema_id]
-        try:
-            validator.validate(payload)
-        except ValidationError as exc:
+        schema_error = _schema_error(index, record, schema_path)
+        if schema_error is not None:
             invalid += 1
-            errors.append(f"{receipt_path.name}: {exc.message}")
+            errors.append(f"{record.file}: {schema_error}")
             continue
 
-        provenance_error = _provenance_error(payload)
+        step = {"name": record.step_name, "command": record.step_command}
+        provenance_error = _provenance_error({"step": step})
         if provenance_error is not None:
             invalid += 1
             non_canonical += 1
-            errors.append(f"{receipt_path.name}: {provenance_error}")
+            errors.append(f"{record.file}: {provenance_error}")
             continue
 
         valid += 1
@@ -0,0 +1 @@
+"""Performance benchmarks and regression guardrails for the gz CLI."""
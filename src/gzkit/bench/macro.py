@@ -0,0 +1,194 @@
+"""Macro benchmarks — gz command wall clock against synthetic repos at scale.
+
+Startup benchmarks (``gzkit.bench.startup``) catch cold-path regressions on
+this repository. Macro benchmarks answer the other question: how does each
+governance command behave as ADRs, OBPIs, ledger history and skills grow?
+Each size tier generates a synthetic project (``gzkit.bench.synthetic``)
+scaled from this repository's own shape, then times the commands operators
+and hooks run most, including the ``gz check`` subcomponents that are
+governance-only (lint/type/test are excluded: they time the toolchain, not
+gzkit).
+
+Results are written as JSON so runs can be diffed across commits::
+
+    python -m gzkit.bench.macro --tiers 1x,10x --output bench-macro.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from gzkit.bench.startup import CommandSample, measure_command
+from gzkit.bench.synthetic import (
+    SIZE_TIERS,
+    SyntheticSummary,
+    generate_synthetic_project,
+    scaled_spec,
+)
+
+MACRO_REPORT_SCHEMA = "gzkit.macro_benchmark.v1"
+
+MACRO_COMMANDS: dict[str, tuple[str, ...]] = {
+    "status_json": ("status", "--json"),
+    "validate": ("validate",),
+    "drift_json": ("drift", "--json"),
+    "covers_json": ("covers", "--json"),
+    "agent_sync_control_surfaces": ("agent", "sync", "control-surfaces"),
+    "skill_audit": ("skill", "audit"),
+    # gz check governance subcomponents (see gzkit.quality.run_all_checks)
+    "check_parity": ("parity", "check"),
+    "check_readiness_audit": ("readiness", "audit"),
+    "check_cli_audit": ("cli", "audit"),
+    "check_preflight": ("preflight",),
+}
+
+# ---------------------------------------------------------------------------
+# Models
+# ---------------------------------------------------------------------------
+
+
+class TierResult(BaseModel):
+    """Generation cost and command timings for one size tier."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    tier: str = Field(..., description="Tier label, e.g. '10x'")
+    multiplier: int = Field(..., description="Scale factor applied to the base spec")
+    generation_ms: float = Field(..., description="Time to generate the synthetic project")
+    summary: SyntheticSummary = Field(..., description="Generated artifact counts")
+    commands: list[CommandSample] = Field(default_factory=list)
+    failures: list[str] = Field(
+        default_factory=list,
+        description="Commands that exited non-zero; their timings are not a full run",
+    )
+
+
+class MacroReport(BaseModel):
+    """Full macro benchmark run across tiers."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
+    schema_: str = Field(MACRO_REPORT_SCHEMA, alias="schema")
+    recorded_at: str = Field(..., description="ISO-8601 timestamp of the run")
+    python: str = Field(..., description="Interpreter version used")
+    platform: str = Field(..., description="Platform the run executed on")
+    runs: int = Field(..., description="Repetitions per command (best-of)")
+    tiers: list[TierResult] = Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def run_tier(
+    tier: str,
+    workdir: Path,
+    *,
+    runs: int = 1,
+    commands: dict[str, tuple[str, ...]] | None = None,
+    src_root: Path | None = None,
+) -> TierResult:
+    """Generate the synthetic project for *tier* under *workdir* and time commands.
+
+    Every command is expected to exit 0 on the generated tree; a non-zero exit
+    usually means a crash or an early return, so the sample is listed in
+    ``TierResult.failures`` rather than silently reported as a timing.
+    """
+    multiplier = SIZE_TIERS[tier]
+    root = workdir / f"synthetic-{tier}"
+    start = time.perf_counter()
+    summary = generate_synthetic_project(root, scaled_spec(multiplier))
+    generation_ms = round((time.perf_counter() - start) * 1000, 3)
+    targets = MACRO_COMMANDS if commands is None else commands
+    samples = [
+        measure_command(name, argv, cwd=root, runs=runs, src_root=src_root)
+        for name, argv in targets.items()
+    ]
+    return TierResult(
+        tier=tier,
+        multiplier=multiplier,
+        generation_ms=generation_ms,
+        summary=summary,
+        commands=samples,
+        failures=[sample.name for sample in samples if sample.exit_code != 0],
+    )
+
+
+def run_macro_benchmarks(
+    tiers: Sequence[str],
+    workdir: Path,
+    *,
+    runs: int = 1,
+    commands: dict[str, tuple[str, ...]] | None = None,
+    src_root: Path | None = None,
+) -> MacroReport:
+    """Run :func:`run_tier` for each tier label, in the order given."""
+    unknown = [t for t in tiers if t not in SIZE_TIERS]
+    if unknown:
+        msg = f"Unknown tier(s) {unknown}; expected one of {sorted(SIZE_TIERS)}"
+        raise ValueError(msg)
+    return MacroReport(
+        recorded_at=datetime.now(UTC).isoformat(),
+        python=platform.python_version(),
+        platform=platform.platform(terse=True),
+        runs=runs,
+        tiers=[
+            run_tier(t, workdir, runs=runs, commands=commands, src_root=src_root) for t in tiers
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run macro benchmarks and emit a JSON report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m gzkit.bench.macro",
+        description="Time gz commands against synthetic governance repos at scale.",
+    )
+    parser.add_argument("--tiers", default="1x", help="Comma-separated tiers (1x,10x,100x)")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON report here")
+    parser.add_argument(
+        "--workdir", type=Path, default=None, help="Keep generated repos here (default: tmp)"
+    )
+    args = parser.parse_args(argv)
+
+    tiers = [t.strip() for t in args.tiers.split(",") if t.strip()]
+    if args.workdir is not None:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        report = run_macro_benchmarks(tiers, args.workdir, runs=args.runs)
+    else:
+        with tempfile.TemporaryDirectory(prefix="gz-macro-") as tmp:
+            report = run_macro_benchmarks(tiers, Path(tmp), runs=args.runs)
+
+    payload = json.dumps(report.model_dump(by_alias=True), indent=2) + "\n"
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(payload, encoding="utf-8")
+    else:
+        print(payload, end="")  # noqa: T201
+
+    failed = [f"{t.tier}:{name}" for t in report.tiers for name in t.failures]
+    if failed:
+        print(f"Commands exited non-zero: {', '.join(failed)}", file=sys.stderr)  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,353 @@
+"""Startup benchmarks — import-time budget and cold-start wall clock for gz.
+
+Every hook-triggered ``gz`` call pays interpreter start, module import, and
+parser construction before doing any work. This module measures those costs
+in fresh subprocesses:
+
+* import cost per entry module via ``python -X importtime`` (cumulative µs
+  of the top-level import), and
+* wall clock per representative command (``gz --help``, ``gz status --json``,
+  ``gz validate``).
+
+Results are compared against a stored baseline in
+``data/benchmarks/startup_baseline.json``. A sample regresses when it exceeds
+``baseline * tolerance + slack_ms``; the multiplicative tolerance and the
+absolute slack keep machine noise from tripping the gate while still catching
+a heavy dependency creeping into the cold path. Baselines are updated only
+explicitly (``python -m gzkit.bench.startup --update-baseline``) on a supported
+interpreter; see ``docs/developer/benchmarks.md``. Console output is confined
+to :func:`main`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+STARTUP_BASELINE_SCHEMA = "gzkit.startup_baseline.v1"
+DEFAULT_BASELINE_PATH = Path("data") / "benchmarks" / "startup_baseline.json"
+
+# Entry modules on the cold path: the CLI itself plus the modules the
+# generated Claude/Copilot hook scripts import on every tool call.
+IMPORT_TARGETS: tuple[str, ...] = (
+    "gzkit.cli.main",
+    "gzkit.ledger",
+    "gzkit.hooks.core",
+    "gzkit.pipeline_runtime",
+)
+
+COMMAND_TARGETS: dict[str, tuple[str, ...]] = {
+    "help": ("--help",),
+    "status_json": ("status", "--json"),
+    "validate": ("validate",),
+}
+
+_GZ_BOOTSTRAP = "import sys; from gzkit.cli import main; sys.exit(main())"
+
+# ---------------------------------------------------------------------------
+# Models
+# ---------------------------------------------------------------------------
+
+
+class ImportSample(BaseModel):
+    """Best-of-N import cost for one entry module."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    module: str = Field(..., description="Dotted module name imported")
+    cumulative_ms: float = Field(..., description="Cumulative import time (ms), best run")
+    modules_loaded: int = Field(..., description="Modules imported transitively")
+
+
+class CommandSample(BaseModel):
+    """Best-of-N wall clock for one gz invocation."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str = Field(..., description="Benchmark name")
+    argv: list[str] = Field(..., description="Arguments passed to gz")
+    wall_ms: float = Field(..., description="Process wall clock (ms), best run")
+    exit_code: int = Field(..., description="Exit code of the last run")
+
+
+class StartupReport(BaseModel):
+    """One full startup measurement."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    imports: list[ImportSample] = Field(default_factory=list)
+    commands: list[CommandSample] = Field(default_factory=list)
+
+
+class StartupBaseline(BaseModel):
+    """Stored startup baseline and its regression thresholds."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
+    schema_: str = Field(STARTUP_BASELINE_SCHEMA, alias="schema")
+    recorded_at: str = Field(..., description="ISO-8601 timestamp of recording")
+    python: str = Field(..., description="Interpreter version used")
+    platform: str = Field(..., description="Platform the baseline was recorded on")
+    tolerance: float = Field(2.0, description="Allowed multiple of the baseline")
+    slack_ms: float = Field(100.0, description="Absolute allowance added to each budget")
+    imports: dict[str, float] = Field(default_factory=dict, description="module -> ms")
+    commands: dict[str, float] = Field(default_factory=dict, description="command -> ms")
+
+
+class StartupRegression(BaseModel):
+    """A sample that exceeded its budget."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    kind: str = Field(..., description="'import' or 'command'")
+    name: str = Field(..., description="Module or command benchmark name")
+    baseline_ms: float = Field(...)
+    current_ms: float = Field(...)
+    budget_ms: float = Field(..., description="baseline * tolerance + slack")
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse ``-X importtime`` output into module -> cumulative microseconds.
+
+    Lines look like ``import time:  self [us] | cumulative | imported package``;
+    the header line and any non-importtime stderr output are ignored.
+    """
+    timings: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        timings[parts[2].strip()] = int(parts[1].strip())
+    return timings
+
+
+def _subprocess_env(src_root: Path | None) -> dict[str, str]:
+    env = dict(os.environ)
+    if src_root is not None:
+        existing = env.get("PYTHONPATH")
+        env["PYTHONPATH"] = (
+            str(src_root) if not existing else os.pathsep.join([str(src_root), existing])
+        )
+    return env
+
+
+def measure_import(
+    module: str,
+    *,
+    runs: int = 3,
+    python: str = sys.executable,
+    src_root: Path | None = None,
+) -> ImportSample:
+    """Measure the cold import cost of *module* in fresh interpreters."""
+    best_us: int | None = None
+    loaded = 0
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            env=_subprocess_env(src_root),
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"import {module} failed: {result.stderr.strip().splitlines()[-1:]}"
+            raise RuntimeError(msg)
+        timings = parse_importtime(result.stderr)
+        cumulative = timings.get(module, 0)
+        loaded = len(timings)
+        best_us = cumulative if best_us is None else min(best_us, cumulative)
+    return ImportSample(
+        module=module, cumulative_ms=round((best_us or 0) / 1000, 3), modules_loaded=loaded
+    )
+
+
+def measure_command(
+    name: str,
+    argv: Sequence[str],
+    *,
+    cwd: Path,
+    runs: int = 3,
+    python: str = sys.executable,
+    src_root: Path | None = None,
+) -> CommandSample:
+    """Measure the wall clock of ``gz <argv>`` run from *cwd*.
+
+    The exit code is recorded but not judged: ``gz validate`` may legitimately
+    report findings; only startup-plus-execution time is being tracked.
+    """
+    best: float | None = None
+    exit_code = 0
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [python, "-c", _GZ_BOOTSTRAP, *argv],
+            cwd=cwd,
+            capture_output=True,
+            env=_subprocess_env(src_root),
+            check=False,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        exit_code = result.returncode
+        best = elapsed if best is None else min(best, elapsed)
+    return CommandSample(
+        name=name, argv=list(argv), wall_ms=round(best or 0.0, 3), exit_code=exit_code
+    )
+
+
+def run_startup_benchmarks(
+    project_root: Path,
+    *,
+    runs: int = 3,
+    imports: Sequence[str] = IMPORT_TARGETS,
+    commands: dict[str, tuple[str, ...]] | None = None,
+    src_root: Path | None = None,
+) -> StartupReport:
+    """Measure every import target and command target."""
+    command_targets = COMMAND_TARGETS if commands is None else commands
+    return StartupReport(
+        imports=[measure_import(m, runs=runs, src_root=src_root) for m in imports],
+        commands=[
+            measure_command(name, argv, cwd=project_root, runs=runs, src_root=src_root)
+            for name, argv in command_targets.items()
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Baseline store and comparison
+# ---------------------------------------------------------------------------
+
+
+def load_startup_baseline(path: Path) -> StartupBaseline | None:
+    """Load the stored baseline, or ``None`` when none has been recorded."""
+    if not path.exists():
+        return None
+    return StartupBaseline.model_validate(json.loads(path.read_text(encoding="utf-8")))
+
+
+def save_startup_baseline(
+    report: StartupReport,
+    path: Path,
+    *,
+    tolerance: float = 2.0,
+    slack_ms: float = 100.0,
+) -> StartupBaseline:
+    """Record *report* as the new baseline (explicit only, never automatic)."""
+    baseline = StartupBaseline(
+        recorded_at=datetime.now(UTC).isoformat(),
+        python=platform.python_version(),
+        platform=platform.platform(terse=True),
+        tolerance=tolerance,
+        slack_ms=slack_ms,
+        imports={s.module: s.cumulative_ms for s in report.imports},
+        commands={s.name: s.wall_ms for s in report.commands},
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(baseline.model_dump(by_alias=True), indent=2) + "\n", encoding="utf-8"
+    )
+    return baseline
+
+
+def compare_startup(report: StartupReport, baseline: StartupBaseline) -> list[StartupRegression]:
+    """Return every sample whose time exceeds its baseline budget.
+
+    Samples without a baseline entry are skipped (first run for that target).
+    """
+    regressions: list[StartupRegression] = []
+    pairs: list[tuple[str, str, float, float | None]] = [
+        ("import", s.module, s.cumulative_ms, baseline.imports.get(s.module))
+        for s in report.imports
+    ]
+    pairs.extend(
+        ("command", s.name, s.wall_ms, baseline.commands.get(s.name)) for s in report.commands
+    )
+    for kind, name, current, reference in pairs:
+        if reference is None:
+            continue
+        budget = reference * baseline.tolerance + baseline.slack_ms
+        if current > budget:
+            regressions.append(
+                StartupRegression(
+                    kind=kind,
+                    name=name,
+                    baseline_ms=reference,
+                    current_ms=current,
+                    budget_ms=round(budget, 3),
+                )
+            )
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run startup benchmarks; exit 3 (policy breach) on regression."""
+    parser = argparse.ArgumentParser(
+        prog="python -m gzkit.bench.startup",
+        description="Measure gz import time and command startup against a baseline.",
+    )
+    parser.add_argument("--project-root", type=Path, default=Path.cwd())
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", dest="as_json", action="store_true")
+    args = parser.parse_args(argv)
+
+    project_root = args.project_root.resolve()
+    baseline_path = args.baseline or project_root / DEFAULT_BASELINE_PATH
+    report = run_startup_benchmarks(project_root, runs=args.runs)
+
+    if args.update_baseline:
+        save_startup_baseline(report, baseline_path)
+        print(f"Baseline written: {baseline_path}")  # noqa: T201
+        return 0
+
+    baseline = load_startup_baseline(baseline_path)
+    regressions = compare_startup(report, baseline) if baseline else []
+    if args.as_json:
+        payload = {
+            "report": report.model_dump(),
+            "baseline_found": baseline is not None,
+            "regressions": [r.model_dump() for r in regressions],
+            "passed": not regressions,
+        }
+        print(json.dumps(payload, indent=2))  # noqa: T201
+    else:
+        for s in report.imports:
+            print(f"import  {s.module:<28} {s.cumulative_ms:>9.1f} ms")  # noqa: T201
+        for c in report.commands:
+            print(f"command {c.name:<28} {c.wall_ms:>9.1f} ms")  # noqa: T201
+        if baseline is None:
+            print(f"No baseline at {baseline_path}; run with --update-baseline.")  # noqa: T201
+        for r in regressions:
+            print(  # noqa: T201
+                f"REGRESSION {r.kind} {r.name}: {r.current_ms:.1f} ms > "
+                f"budget {r.budget_ms:.1f} ms (baseline {r.baseline_ms:.1f} ms)"
+            )
+    return 3 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,568 @@
+"""Synthetic governance-repo generator for scale benchmarks.
+
+Produces a realistic gzkit project on disk — ADR packages with OBPI briefs
+carrying REQ acceptance criteria, a ledger with creation, rename, receipt,
+gate, task and edit-noise events, tests linked through ``@covers``, and
+canonical skills with vendor mirrors, synced agent control surfaces and the
+command docs the readiness and CLI audits inspect — so commands can be timed
+at multiples of this repository's own size and run to completion rather than
+exiting early on a missing surface.
+
+Artifacts are rendered through the same templates, event factories and
+scaffolding helpers the CLI uses, so the synthetic tree exercises the real
+parsing paths rather than a simplified fixture format. Generation is
+deterministic for a given spec.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from gzkit.config import GzkitConfig, PathConfig
+from gzkit.events import TaskCompletedEvent, TaskStartedEvent
+from gzkit.ledger import (
+    LEDGER_SCHEMA,
+    Ledger,
+    LedgerEvent,
+    adr_created_event,
+    artifact_edited_event,
+    artifact_renamed_event,
+    attested_event,
+    gate_checked_event,
+    obpi_created_event,
+    obpi_receipt_emitted_event,
+    prd_created_event,
+    project_init_event,
+)
+from gzkit.skills import CORE_SKILLS, scaffold_core_skills, scaffold_skill
+from gzkit.sync_surfaces import (
+    generate_manifest,
+    sync_all,
+    sync_copilot_instructions,
+    write_manifest,
+)
+from gzkit.templates import load_template, render_template
+
+SYNTHETIC_PROJECT_NAME = "benchproject"
+SYNTHETIC_PRD_ID = "PRD-BENCH-1.0.0"
+DESIGN_ROOT = "docs/design"
+
+# ---------------------------------------------------------------------------
+# Specs and size tiers
+# ---------------------------------------------------------------------------
+
+
+class SyntheticSpec(BaseModel):
+    """Shape of a synthetic governance repository."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    adrs: int = Field(..., ge=1, description="ADR packages to generate")
+    obpis_per_adr: int = Field(4, ge=1, description="OBPI briefs per ADR")
+    reqs_per_obpi: int = Field(4, ge=1, description="REQ acceptance criteria per OBPI")
+    renamed_adrs: int = Field(0, ge=0, description="ADRs first registered under a short id")
+    completed_ratio: float = Field(0.6, ge=0.0, le=1.0, description="OBPIs with receipts")
+    tasks_per_obpi: int = Field(1, ge=0, description="Started+completed TASK pairs per OBPI")
+    edit_events: int = Field(0, ge=0, description="artifact_edited noise events")
+    skills: int = Field(len(CORE_SKILLS), ge=0, description="Canonical skills in total")
+
+
+# One "1x" tier approximates this repository: ~110 ADRs, ~460 OBPIs,
+# ~3.4k ledger lines, ~56 canonical skills. TASK events are left out: they are
+# rare in real history and the ledger schema ``gz validate`` checks does not
+# declare them, so they would turn every validate sample into a failure.
+BASE_SPEC = SyntheticSpec(
+    adrs=110,
+    obpis_per_adr=4,
+    reqs_per_obpi=4,
+    renamed_adrs=48,
+    completed_ratio=0.6,
+    tasks_per_obpi=0,
+    edit_events=1500,
+    skills=56,
+)
+
+SIZE_TIERS: dict[str, int] = {"1x": 1, "10x": 10, "100x": 100}
+
+
+def scaled_spec(multiplier: int, base: SyntheticSpec = BASE_SPEC) -> SyntheticSpec:
+    """Scale the artifact counts of *base*; per-artifact shape stays fixed.
+
+    Skills are capped at 10x the base: skill catalogs do not grow with
+    delivered work the way ADRs and ledger history do.
+    """
+    return base.model_copy(
+        update={
+            "adrs": base.adrs * multiplier,
+            "renamed_adrs": base.renamed_adrs * multiplier,
+            "edit_events": base.edit_events * multiplier,
+            "skills": base.skills * min(multiplier, 10),
+        }
+    )
+
+
+class SyntheticSummary(BaseModel):
+    """Counts of what a generation run produced."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    root: str = Field(..., description="Generated project root")
+    adrs: int = Field(0)
+    obpis: int = Field(0)
+    reqs: int = Field(0)
+    ledger_events: int = Field(0)
+    test_files: int = Field(0)
+    skills: int = Field(0)
+
+
+# ---------------------------------------------------------------------------
+# Artifact rendering
+# ---------------------------------------------------------------------------
+
+
+def _semver(index: int) -> str:
+    return f"0.{index + 1}.0"
+
+
+def _adr_id(index: int) -> str:
+    return f"ADR-{_semver(index)}-bench-{index:05d}"
+
+
+def _obpi_id(adr_index: int, item: int) -> str:
+    return f"OBPI-{_semver(adr_index)}-{item:02d}-bench-item"
+
+
+def _req_id(adr_index: int, item: int, criterion: int) -> str:
+    return f"REQ-{_semver(adr_index)}-{item:02d}-{criterion:02d}"
+
+
+def _bucket(index: int) -> str:
+    return "foundation" if index % 10 == 0 else "pre-release"
+
+
+def _adr_dir(root: Path, index: int) -> Path:
+    return root / DESIGN_ROOT / "adr" / _bucket(index) / _adr_id(index)
+
+
+def _obpi_completed(index: int, item: int, spec: SyntheticSpec) -> bool:
+    """Whether an OBPI gets a completion receipt: the first ``completed_ratio`` of them do."""
+    budget = int(spec.adrs * spec.obpis_per_adr * spec.completed_ratio)
+    return index * spec.obpis_per_adr + item - 1 < budget
+
+
+def _adr_completed(index: int, spec: SyntheticSpec) -> bool:
+    return _obpi_completed(index, spec.obpis_per_adr, spec)
+
+
+def _render_adr(index: int, spec: SyntheticSpec) -> str:
+    semver = _semver(index)
+    checklist = "\n".join(
+        f"- [ ] OBPI-{semver}-{item:02d}: Deliver synthetic capability {item}"
+        for item in range(1, spec.obpis_per_adr + 1)
+    )
+    return render_template(
+        "adr",
+        id=_adr_id(index),
+        title=f"Synthetic Benchmark ADR {index:05d}",
+        semver=semver,
+        lane="heavy" if index % 3 == 0 else "lite",
+        parent=SYNTHETIC_PRD_ID,
+        status="Completed" if _adr_completed(index, spec) else "Proposed",
+        intent=f"Exercise governance tooling at scale (ADR {index}).",
+        decision="Generate deterministic synthetic scope for benchmarking.",
+        checklist=checklist,
+        decomposition_scorecard="",
+        positive_consequences="- Benchmarks cover realistic artifact volume.",
+        negative_consequences="- None; synthetic content only.",
+        alternatives="- Hand-written fixtures (do not scale).",
+        persona="main-session",
+        qa_transcript="",
+    )
+
+
+def _render_obpi(root: Path, index: int, item: int, spec: SyntheticSpec) -> str:
+    adr_dir = _adr_dir(root, index)
+    criteria = "\n".join(
+        f"- [ ] {_req_id(index, item, criterion)}: Given synthetic input {criterion}, "
+        f"when the capability runs, then output {criterion} matches the contract"
+        for criterion in range(1, spec.reqs_per_obpi + 1)
+    )
+    rendered = render_template(
+        "obpi",
+        id=_obpi_id(index, item),
+        title=f"Synthetic Capability {item}",
+        parent_adr=_adr_id(index),
+        parent_adr_path=str((adr_dir / f"{_adr_id(index)}.md").relative_to(root).as_posix()),
+        item_number=str(item),
+        checklist_item_text=f"OBPI-{_semver(index)}-{item:02d}: Deliver synthetic capability",
+        lane="Lite",
+        lane_rationale="This OBPI remains internal to the synthetic ADR scope.",
+        objective=f"Deliver synthetic capability {item} for ADR {index}.",
+        acceptance_criteria_seed=criteria,
+        allowed_paths_md=f"- `src/{SYNTHETIC_PROJECT_NAME}/mod_{index:05d}.py` - scope",
+        denied_paths_md="- New dependencies",
+        requirements_md="1. REQUIREMENT: Synthetic behavior MUST be deterministic.",
+        prerequisites_md=f"- [ ] `src/{SYNTHETIC_PROJECT_NAME}/__init__.py`",
+        existing_code_md="- [ ] Pattern to follow: synthetic module layout",
+        verification_specific_md=f"uv run -m unittest tests.test_bench_{index:05d}",
+    )
+    if _obpi_completed(index, item, spec):
+        # The template pins ``status: Draft``; receipted briefs must agree with the ledger.
+        rendered = rendered.replace("status: Draft", "status: Completed", 1)
+    return rendered
+
+
+def _render_test_module(index: int, spec: SyntheticSpec) -> str:
+    lines = [
+        f'"""Synthetic coverage for {_adr_id(index)}."""',
+        "",
+        "import unittest",
+        "",
+        "from gzkit.traceability import covers",
+        "",
+        "",
+        f"class TestBench{index:05d}(unittest.TestCase):",
+    ]
+    for item in range(1, spec.obpis_per_adr + 1):
+        for criterion in range(1, spec.reqs_per_obpi + 1):
+            lines.extend(
+                [
+                    f'    @covers("{_req_id(index, item, criterion)}")',
+                    f"    def test_item_{item:02d}_criterion_{criterion:02d}(self) -> None:",
+                    "        self.assertTrue(True)",
+                    "",
+                ]
+            )
+    return "\n".join(lines).rstrip() + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Ledger history
+# ---------------------------------------------------------------------------
+
+
+def _task_events(adr_id: str, obpi_id: str, count: int) -> list[LedgerEvent]:
+    events: list[LedgerEvent] = []
+    version = obpi_id.split("-")[1]
+    item = obpi_id.split("-")[2]
+    for seq in range(1, count + 1):
+        task_id = f"TASK-{version}-{item}-01-{seq:02d}"
+        common = {"id": task_id, "schema_": LEDGER_SCHEMA, "task_id": task_id}
+        started = TaskStartedEvent(
+            event="task_started", obpi_id=obpi_id, adr_id=adr_id, agent="bench", **common
+        )
+        completed = TaskCompletedEvent(
+            event="task_completed", obpi_id=obpi_id, adr_id=adr_id, agent="bench", **common
+        )
+        events.extend(
+            LedgerEvent.model_validate(json.loads(e.model_dump_json()))
+            for e in (started, completed)
+        )
+    return events
+
+
+def _ledger_history(root: Path, spec: SyntheticSpec) -> list[LedgerEvent]:
+    events: list[LedgerEvent] = [
+        project_init_event(SYNTHETIC_PROJECT_NAME, "lite"),
+        prd_created_event(SYNTHETIC_PRD_ID),
+    ]
+    for index in range(spec.adrs):
+        adr_id = _adr_id(index)
+        lane = "heavy" if index % 3 == 0 else "lite"
+        if index < spec.renamed_adrs:
+            short_id = f"ADR-{_semver(index)}"
+            events.append(adr_created_event(short_id, SYNTHETIC_PRD_ID, lane))
+            events.append(artifact_renamed_event(short_id, adr_id, "semver_minor_sequence"))
+        else:
+            events.append(adr_created_event(adr_id, SYNTHETIC_PRD_ID, lane))
+        for item in range(1, spec.obpis_per_adr + 1):
+            obpi_id = _obpi_id(index, item)
+            events.append(obpi_created_event(obpi_id, adr_id))
+            events.extend(_task_events(adr_id, obpi_id, spec.tasks_per_obpi))
+            if _obpi_completed(index, item, spec):
+                events.append(
+                    obpi_receipt_emitted_event(
+                        obpi_id,
+                        "completed",
+                        "bench",
+                        evidence={"value_narrative": "synthetic", "key_proof": "synthetic"},
+                        parent_adr=adr_id,
+                        obpi_completion="completed",
+                    )
+                )
+        for gate in (1, 2):
+            events.append(gate_checked_event(adr_id, gate, "pass", "uv run -m unittest", 0))
+        if _adr_completed(index, spec):
+            events.append(attested_event(adr_id, "completed", "bench"))
+    for seq in range(spec.edit_events):
+        index = seq % spec.adrs
+        path = (_adr_dir(root, index) / f"{_adr_id(index)}.md").relative_to(root)
+        events.append(artifact_edited_event(path.as_posix(), session=f"bench-{seq // 50}"))
+    return events
+
+
+# ---------------------------------------------------------------------------
+# Control and documentation surfaces
+# ---------------------------------------------------------------------------
+
+# Commands given a manpage, an index entry and a doc-coverage obligation, so
+# ``gz cli audit`` and ``gz readiness audit`` check real surfaces.
+DOCUMENTED_COMMANDS: tuple[str, ...] = (
+    "status",
+    "validate",
+    "drift",
+    "covers",
+    "check",
+    "parity check",
+    "readiness audit",
+    "skill audit",
+    "cli audit",
+    "preflight",
+)
+
+_CANONICAL_RULES: dict[str, tuple[str, str]] = {
+    "bench-python": ("src/**/*.py", "Synthetic source conventions"),
+    "bench-tests": ("tests/**/*.py", "Synthetic test conventions"),
+}
+
+_README = f"""# {SYNTHETIC_PROJECT_NAME}
+
+Synthetic governance project. Work follows the gzkit development covenant:
+agents implement, and every ADR closes on human attestation.
+
+## Quick Start
+
+```bash
+gz status
+gz check
+gz readiness audit
+```
+"""
+
+_AGENT_DISCIPLINES = """# Agent Input Disciplines
+
+Prompt craft, context engineering, intent engineering and specification
+engineering, applied to this project's governance surfaces.
+"""
+
+
+def _manpage_slug(command: str) -> str:
+    return command.replace(" ", "-")
+
+
+def _write_rules(root: Path) -> None:
+    rules_dir = root / ".gzkit" / "rules"
+    rules_dir.mkdir(parents=True, exist_ok=True)
+    for rule_id, (glob, description) in _CANONICAL_RULES.items():
+        (rules_dir / f"{rule_id}.md").write_text(
+            f'---\nid: {rule_id}\npaths:\n  - "{glob}"\ndescription: {description}\n---\n\n'
+            f"# {description}\n\nALWAYS keep synthetic content deterministic.\n",
+            encoding="utf-8",
+        )
+
+
+def _write_command_docs(root: Path) -> None:
+    commands_dir = root / "docs" / "user" / "commands"
+    commands_dir.mkdir(parents=True, exist_ok=True)
+    index = ["# Commands", ""]
+    obligations: dict[str, object] = {}
+    for command in DOCUMENTED_COMMANDS:
+        slug = _manpage_slug(command)
+        (commands_dir / f"{slug}.md").write_text(
+            f"# gz {command}\n\nSynthetic manpage for `gz {command}`.\n", encoding="utf-8"
+        )
+        index.append(f"- [`gz {command}`]({slug}.md)")
+        obligations[command] = {
+            "surfaces": {
+                "manpage": True,
+                "index_entry": True,
+                "operator_runbook": False,
+                "governance_runbook": False,
+                "docstring": False,
+            },
+            "governance_relevant": False,
+        }
+    (commands_dir / "index.md").write_text("\n".join(index) + "\n", encoding="utf-8")
+    config_dir = root / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "version": "1.0.0",
+        "description": "Synthetic documentation obligation manifest",
+        "commands": obligations,
+    }
+    (config_dir / "doc-coverage.json").write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def _write_surfaces(root: Path, config: GzkitConfig) -> None:
+    """Write the docs, templates and rules the audits require, then sync agents.
+
+    ``gz readiness audit`` reads the OBPI and ADR templates from
+    ``src/gzkit/templates/``; they are copied verbatim from the installed
+    package. Control surfaces (AGENTS.md, CLAUDE.md, Copilot instructions,
+    discovery index, ``.claude/rules/``) come from the same sync ``gz init``
+    runs.
+    """
+    docs = {
+        "README.md": _README,
+        "docs/user/reference/agent-input-disciplines.md": _AGENT_DISCIPLINES,
+        "docs/user/concepts/lanes.md": "# Lanes\n\nLite and heavy lanes.\n",
+        "docs/governance/governance_runbook.md": "# Governance Runbook\n",
+        "docs/governance/GovZero/audits/AUDIT-TEMPLATE-agent-readiness.md": (
+            "# Agent Readiness Audit\n"
+        ),
+        "src/gzkit/templates/obpi.md": load_template("obpi"),
+        "src/gzkit/templates/adr.md": load_template("adr"),
+        "tests/test_sync.py": '"""Synthetic sync checks."""\n',
+        "tests/test_cli_parser.py": '"""Synthetic parser checks."""\n',
+    }
+    for rel_path, content in docs.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    _write_command_docs(root)
+    _write_rules(root)
+    sync_all(root, config)
+    # With canonical rules present, sync renders ``.github/instructions/``
+    # instead; the readiness audit still requires the top-level file.
+    sync_copilot_instructions(root, config)
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+
+def _write_config(root: Path) -> GzkitConfig:
+    config = GzkitConfig(
+        mode="lite",
+        project_name=SYNTHETIC_PROJECT_NAME,
+        paths=PathConfig(
+            design_root=DESIGN_ROOT,
+            prd=f"{DESIGN_ROOT}/prd",
+            constitutions=f"{DESIGN_ROOT}/constitutions",
+            obpis=f"{DESIGN_ROOT}/adr",
+            adrs=f"{DESIGN_ROOT}/adr",
+            source_root="src",
+            tests_root="tests",
+            docs_root="docs",
+        ),
+    )
+    (root / config.paths.gzkit_dir).mkdir(parents=True, exist_ok=True)
+    config.save(root / ".gzkit.json")
+    write_manifest(root, generate_manifest(root, config))
+    return config
+
+
+def _write_skills(root: Path, config: GzkitConfig, total: int) -> int:
+    written = len(scaffold_core_skills(root, config))
+    for seq in range(max(0, total - written)):
+        scaffold_skill(
+            root,
+            f"bench-skill-{seq:04d}",
+            config.paths.skills,
+            skill_description=f"Synthetic benchmark skill {seq}.",
+        )
+        written += 1
+    return written
+
+
+def _git_commit_all(root: Path) -> None:
+    for args in (
+        ["git", "init", "-q", "-b", "main"],
+        ["git", "add", "-A"],
+        [
+            "git",
+            "-c",
+            "user.name=bench",
+            "-c",
+            "user.email=bench@example.invalid",
+            "commit",
+            "-q",
+            "-m",
+            "synthetic governance tree",
+        ],
+    ):
+        subprocess.run(args, cwd=root, check=True, capture_output=True)
+
+
+def generate_synthetic_project(
+    root: Path, spec: SyntheticSpec, *, git: bool = True
+) -> SyntheticSummary:
+    """Write a synthetic governance project described by *spec* into *root*.
+
+    Args:
+        root: Target directory (created if missing; should be empty).
+        spec: Artifact counts and shape.
+        git: Initialize a git repository and commit the tree so git probes
+            (status, drift, covers) see a realistic clean checkout.
+
+    Returns:
+        Counts of generated artifacts.
+
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    config = _write_config(root)
+
+    prd_dir = root / config.paths.prd
+    prd_dir.mkdir(parents=True, exist_ok=True)
+    (prd_dir / f"{SYNTHETIC_PRD_ID}.md").write_text(
+        render_template(
+            "prd",
+            id=SYNTHETIC_PRD_ID,
+            title="Synthetic Benchmark PRD",
+            semver="1.0.0",
+            status="Approved",
+            problem_statement="Governance tooling must stay fast as history grows.",
+            north_star="Every gz command scales linearly with artifact count.",
+            invariants="- Generated content is deterministic.",
+            qa_transcript="",
+        ),
+        encoding="utf-8",
+    )
+
+    tests_dir = root / config.paths.tests_root
+    src_pkg = root / config.paths.source_root / SYNTHETIC_PROJECT_NAME
+    tests_dir.mkdir(parents=True, exist_ok=True)
+    src_pkg.mkdir(parents=True, exist_ok=True)
+    (tests_dir / "__init__.py").write_text("", encoding="utf-8")
+    (src_pkg / "__init__.py").write_text('"""Synthetic package."""\n', encoding="utf-8")
+
+    for index in range(spec.adrs):
+        adr_dir = _adr_dir(root, index)
+        (adr_dir / "obpis").mkdir(parents=True, exist_ok=True)
+        (adr_dir / f"{_adr_id(index)}.md").write_text(_render_adr(index, spec), encoding="utf-8")
+        for item in range(1, spec.obpis_per_adr + 1):
+            (adr_dir / "obpis" / f"{_obpi_id(index, item)}.md").write_text(
+                _render_obpi(root, index, item, spec), encoding="utf-8"
+            )
+        (tests_dir / f"test_bench_{index:05d}.py").write_text(
+            _render_test_module(index, spec), encoding="utf-8"
+        )
+        (src_pkg / f"mod_{index:05d}.py").write_text(
+            f'"""Synthetic module {index}."""\n\nVALUE = {index}\n', encoding="utf-8"
+        )
+
+    skills = _write_skills(root, config, spec.skills)
+    _write_surfaces(root, config)
+
+    ledger = Ledger(root / config.paths.ledger)
+    ledger_events = ledger.append_many(_ledger_history(root, spec))
+
+    if git:
+        _git_commit_all(root)
+
+    return SyntheticSummary(
+        root=str(root),
+        adrs=spec.adrs,
+        obpis=spec.adrs * spec.obpis_per_adr,
+        reqs=spec.adrs * spec.obpis_per_adr * spec.reqs_per_obpi,
+        ledger_events=ledger_events,
+        test_files=spec.adrs,
+        skills=skills,
+    )
@@ -0,0 +1,59 @@
+"""Disposable local caches under ``.gzkit/cache/``.
+
+Caches hold derived data only — anything here can be deleted at any time and
+is rebuilt on the next run. Each cache file is a JSON object tagged with a
+schema string; a file that is missing, unreadable, corrupt or tagged with a
+different schema reads as ``None`` so callers simply recompute. Writes are
+atomic (temp file + ``os.replace``) and never raise: a read-only checkout
+just runs without a warm cache.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_ROOT = Path(".gzkit") / "cache"
+
+
+def cache_file(project_root: Path, *parts: str) -> Path:
+    """Return the path of a cache file below ``<project_root>/.gzkit/cache``."""
+    return project_root.joinpath(CACHE_ROOT, *parts)
+
+
+def stat_key(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or ``None`` when it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_json_cache(path: Path, schema: str) -> dict[str, Any] | None:
+    """Load a cache file written by :func:`write_json_cache` for *schema*."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("schema") != schema:
+        return None
+    payload = data.get("data")
+    return payload if isinstance(payload, dict) else None
+
+
+def write_json_cache(path: Path, schema: str, payload: dict[str, Any]) -> None:
+    """Atomically replace the cache file at *path*; failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"schema": schema, "data": payload}, handle, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        return
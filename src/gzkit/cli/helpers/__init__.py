@@ -7,6 +7,7 @@ from gzkit.cli.helpers.standard_options import (
     add_dry_run_flag,
     add_force_flag,
     add_json_flag,
+    add_json_output_flags,
     add_table_flag,
 )
 
@@ -17,5 +18,6 @@ __all__ = [
     "add_dry_run_flag",
     "add_force_flag",
     "add_json_flag",
+    "add_json_output_flags",
     "add_table_flag",
 ]
@@ -1,7 +1,7 @@
 """Common CLI flags for gzkit commands.
 
-Provides ``add_common_flags`` to register --quiet, --verbose, and --debug
-on any ArgumentParser with idempotency guards.
+Provides ``add_common_flags`` to register --quiet, --verbose, --debug and the
+--profile family on any ArgumentParser with idempotency guards.
 """
 
 import argparse
@@ -11,6 +11,9 @@ from gzkit.cli.helpers.standard_options import _option_exists
 _QUIET_HELP = "Suppress non-error output"
 _VERBOSE_HELP = "Enable verbose output"
 _DEBUG_HELP = "Enable debug mode with full tracebacks"
+_PROFILE_HELP = "Record per-phase timings and print a JSON timing tree to stderr"
+_PROFILE_OUTPUT_HELP = "Write the --profile timing tree to PATH instead of stderr"
+_PROFILE_CPROFILE_HELP = "Also dump cProfile stats for the command to PATH"
 
 
 def add_common_flags(
@@ -20,10 +23,11 @@ def add_common_flags(
     verbose_help: str | None = None,
     debug_help: str | None = None,
 ) -> argparse.ArgumentParser:
-    """Register --quiet/-q, --verbose/-v, and --debug on *parser*.
+    """Register --quiet/-q, --verbose/-v, --debug and the profile flags on *parser*.
 
     ``--quiet`` and ``--verbose`` are mutually exclusive.  ``--debug``
-    enables full tracebacks and DEBUG-level logging.
+    enables full tracebacks and DEBUG-level logging.  See
+    :func:`add_profile_flags` for ``--profile``.
 
     Calling this function more than once on the same parser is safe; any
     flags already registered are silently skipped.
@@ -69,4 +73,41 @@ def add_common_flags(
             help=debug_help if debug_help is not None else _DEBUG_HELP,
         )
 
+    add_profile_flags(parser)
+
+    return parser
+
+
+def add_profile_flags(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Register --profile, --profile-output and --profile-cprofile on *parser*.
+
+    Defaults are suppressed so a subcommand parser does not reset a value given
+    before the command token: ``gz --profile status`` and
+    ``gz status --profile`` behave the same. Read with
+    ``getattr(args, "profile", False)``.
+    """
+    if not _option_exists(parser, "--profile"):
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            dest="profile",
+            default=argparse.SUPPRESS,
+            help=_PROFILE_HELP,
+        )
+    if not _option_exists(parser, "--profile-output"):
+        parser.add_argument(
+            "--profile-output",
+            dest="profile_output",
+            metavar="PATH",
+            default=argparse.SUPPRESS,
+            help=_PROFILE_OUTPUT_HELP,
+        )
+    if not _option_exists(parser, "--profile-cprofile"):
+        parser.add_argument(
+            "--profile-cprofile",
+            dest="profile_cprofile",
+            metavar="PATH",
+            default=argparse.SUPPRESS,
+            help=_PROFILE_CPROFILE_HELP,
+        )
     return parser
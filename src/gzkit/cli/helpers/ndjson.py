@@ -0,0 +1,24 @@
+"""Newline-delimited JSON output for ``--ndjson`` report streams.
+
+Each record is one compact JSON object on its own line, tagged with a
+``record`` kind (``adr``, ``obpi``, ``error``, ``req``, ...) and flushed as
+soon as it is written, so consumers see results while the command is still
+running. Every stream ends with exactly one ``summary`` record.
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+
+def emit_record(kind: str, payload: Mapping[str, Any]) -> None:
+    """Write one ``{"record": kind, ...payload}`` line to stdout and flush."""
+    line = json.dumps({"record": kind, **payload}, separators=(",", ":"), default=str)
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def emit_summary(payload: Mapping[str, Any]) -> None:
+    """Write the closing ``summary`` record of a stream."""
+    emit_record("summary", payload)
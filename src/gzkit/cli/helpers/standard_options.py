@@ -47,6 +47,45 @@ def add_json_flag(
     return parser
 
 
+def add_json_output_flags(
+    parser: argparse.ArgumentParser,
+    *,
+    json_help: str | None = None,
+    ndjson_help: str | None = None,
+) -> argparse.ArgumentParser:
+    """Register ``--json`` (dest="as_json") and ``--ndjson`` (dest="as_ndjson") on *parser*.
+
+    The two output modes are mutually exclusive. As with ``--quiet``/``--verbose``,
+    the group is only created when neither flag is registered yet.
+
+    Args:
+        parser: The ArgumentParser to configure.
+        json_help: Optional replacement help text for ``--json``.
+        ndjson_help: Optional replacement help text for ``--ndjson``.
+
+    Returns:
+        The same *parser* for chaining.
+
+    """
+    if not _option_exists(parser, "--json") and not _option_exists(parser, "--ndjson"):
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument(
+            "--json",
+            dest="as_json",
+            action="store_true",
+            help=json_help if json_help is not None else "Output as JSON",
+        )
+        group.add_argument(
+            "--ndjson",
+            dest="as_ndjson",
+            action="store_true",
+            help=ndjson_help
+            if ndjson_help is not None
+            else "Stream one JSON record per line, ending with a summary record",
+        )
+    return parser
+
+
 def add_adr_option(
     parser: argparse.ArgumentParser,
     *,
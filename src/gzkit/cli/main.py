@@ -4,13 +4,14 @@ A Development Covenant for Human-AI Collaboration.
 """
 
 import argparse
+import sys
 from importlib import import_module
-from typing import Any
+from typing import Any, cast
 
 from gzkit import __version__
 from gzkit.cli.helpers import add_common_flags
 from gzkit.cli.helpers.exit_codes import exit_code_for
-from gzkit.cli.parser import StableArgumentParser
+from gzkit.cli.parser import SelectiveSubParsers, StableArgumentParser
 from gzkit.cli.parser_arb import register_arb_parsers
 from gzkit.cli.parser_artifacts import register_artifact_parsers
 from gzkit.cli.parser_governance import register_governance_parsers
@@ -53,8 +54,14 @@ def __getattr__(name: str) -> Any:
     return value
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    """Build argparse parser tree for gz CLI."""
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build argparse parser tree for gz CLI.
+
+    With *command* set, only that top-level command's subtree is materialized
+    (the other registrations run against inert stand-ins). An unregistered
+    *command* falls back to the full tree so argparse can report the
+    ``invalid choice`` with every valid command listed.
+    """
     parser = StableArgumentParser(
         prog="gz",
         description="gzkit: A Development Covenant for Human-AI Collaboration.",
@@ -69,10 +76,16 @@ def _build_parser() -> argparse.ArgumentParser:
     commands = parser.add_subparsers(dest="command")
     commands.required = True
 
-    register_governance_parsers(commands)
-    register_artifact_parsers(commands)
-    register_maintenance_parsers(commands)
-    register_arb_parsers(commands)
+    selective = SelectiveSubParsers(commands, command) if command is not None else None
+    target = cast(argparse._SubParsersAction, selective or commands)
+
+    register_governance_parsers(target)
+    register_artifact_parsers(target)
+    register_maintenance_parsers(target)
+    register_arb_parsers(target)
+
+    if selective is not None and not selective.matched:
+        return _build_parser()
 
     # Register common flags on every subcommand so users can write
     # ``gz status --verbose`` (not only ``gz --verbose status``).
@@ -91,17 +104,56 @@ def _propagate_common_flags(parser: argparse.ArgumentParser) -> None:
                     _propagate_common_flags(subparser)
 
 
+# Root-level flags that may precede the command token (``gz -v status``).
+_ROOT_FLAGS = frozenset({"--quiet", "-q", "--verbose", "-v", "--debug", "--profile"})
+# Root-level flags that consume the following token as their value.
+_ROOT_VALUE_FLAGS = frozenset({"--profile-output", "--profile-cprofile"})
+
 _cached_parser: argparse.ArgumentParser | None = None
+_cached_command_parsers: dict[str, argparse.ArgumentParser] = {}
 
 
 def _get_parser() -> argparse.ArgumentParser:
-    """Return a cached argument parser (built once, reused)."""
+    """Return the cached full argument parser (built once, reused)."""
     global _cached_parser  # noqa: PLW0603
     if _cached_parser is None:
         _cached_parser = _build_parser()
     return _cached_parser
 
 
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the command token of *argv*, or ``None`` when the full tree is needed.
+
+    Skips root-level common flags; any other leading option (``--help``,
+    ``--version``, an unknown flag) or an empty command line routes to the
+    full parser so top-level help and diagnostics stay complete.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _ROOT_FLAGS or token.partition("=")[0] in _ROOT_VALUE_FLAGS:
+            if token in _ROOT_VALUE_FLAGS:
+                next(tokens, None)
+            continue
+        if token.startswith("-"):
+            return None
+        return token
+    return None
+
+
+def _get_parser_for(argv: list[str]) -> argparse.ArgumentParser:
+    """Return a parser that can handle *argv*, building only what it needs.
+
+    Stage one peeks at the command token; stage two builds just that command's
+    subtree. Root-level help and bare ``gz`` fall back to ``_get_parser``.
+    """
+    command = _peek_command(argv)
+    if command is None:
+        return _get_parser()
+    if command not in _cached_command_parsers:
+        _cached_command_parsers[command] = _build_parser(command)
+    return _cached_command_parsers[command]
+
+
 def _apply_debug_mode() -> None:
     """Enable DEBUG-level logging and full tracebacks."""
     import logging
@@ -109,10 +161,61 @@ def _apply_debug_mode() -> None:
     logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(name)s: %(message)s")
 
 
+def _profile_path(args: argparse.Namespace, dest: str) -> str | None:
+    value = getattr(args, dest, None)
+    return value if isinstance(value, str) and value else None
+
+
+def _profiling_requested(args: argparse.Namespace) -> bool:
+    # Identity/type checks, not truthiness: only argparse-produced values count.
+    return (
+        getattr(args, "profile", False) is True
+        or _profile_path(args, "profile_output") is not None
+        or _profile_path(args, "profile_cprofile") is not None
+    )
+
+
+def _run_profiled(handler: Any, args: argparse.Namespace) -> None:
+    """Run *handler* under the phase profiler (and cProfile when requested).
+
+    The timing tree is emitted even when the handler fails, so a slow command
+    that then errors still shows where its time went.
+    """
+    import json  # noqa: PLC0415
+
+    from gzkit import profiling  # noqa: PLC0415
+    from gzkit.cli.logging import bind_correlation_id  # noqa: PLC0415
+
+    correlation_id = bind_correlation_id()
+    command = f"gz {getattr(args, 'command', '') or ''}".strip()
+    profiler = profiling.start_profiling(correlation_id, command=command)
+    cprofile_path = _profile_path(args, "profile_cprofile")
+    cprofiler = None
+    cprofile_dump = ""
+    if cprofile_path:
+        import cProfile  # noqa: PLC0415
+
+        cprofile_dump = cprofile_path
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    try:
+        handler(args)
+    finally:
+        if cprofiler is not None:
+            cprofiler.disable()
+            cprofiler.dump_stats(cprofile_dump)
+        profiling.stop_profiling()
+        report = json.dumps(profiler.report(), indent=2)
+        output = _profile_path(args, "profile_output")
+        if output:
+            with open(output, "w", encoding="utf-8") as handle:
+                handle.write(report + "\n")
+        else:
+            print(report, file=sys.stderr)  # noqa: T201
+
+
 def _ensure_utf8_console() -> None:
     """Reconfigure stdout/stderr to UTF-8 on Windows to avoid cp1252 crashes from Rich."""
-    import sys  # noqa: PLC0415
-
     for stream_name in ("stdout", "stderr"):
         stream = getattr(sys, stream_name, None)
         if stream is not None and hasattr(stream, "reconfigure"):
@@ -122,7 +225,9 @@ def _ensure_utf8_console() -> None:
 def main(argv: list[str] | None = None) -> int:
     """argparse-based gz entrypoint."""
     _ensure_utf8_console()
-    parser = _get_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _get_parser_for(argv)
     try:
         args = parser.parse_args(argv)
     except SystemExit as exc:
@@ -137,12 +242,14 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     try:
-        handler(args)
+        if _profiling_requested(args):
+            _run_profiled(handler, args)
+        else:
+            handler(args)
     except GzkitError as exc:
         from gzkit.commands.common import console  # noqa: PLC0415
 
         if getattr(args, "debug", False):
-            import sys  # noqa: PLC0415
             import traceback  # noqa: PLC0415
 
             traceback.print_exc(file=sys.stderr)
@@ -159,7 +266,6 @@ def main(argv: list[str] | None = None) -> int:
         from gzkit.commands.common import console  # noqa: PLC0415
 
         if getattr(args, "debug", False):
-            import sys  # noqa: PLC0415
             import traceback  # noqa: PLC0415
 
             traceback.print_exc(file=sys.stderr)
@@ -50,3 +50,44 @@ class StableArgumentParser(argparse.ArgumentParser):
         """Print a structured error and exit with code 2."""
         sys.stderr.write(f"BLOCKERS: {self.prog}: error: {message}\n")
         raise SystemExit(2)
+
+
+class _NullParser:
+    """Inert stand-in for a parser whose subtree is not being built.
+
+    Every method call (``add_argument``, ``add_subparsers``, ``set_defaults``,
+    ...) is accepted and returns another inert object, so registration code
+    runs unchanged without constructing argparse actions. The empty option
+    table keeps ``_option_exists``-style idempotency probes working.
+    """
+
+    _actions: tuple[()] = ()
+    _option_string_actions: dict[str, argparse.Action] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return self._ignore
+
+    def _ignore(self, *args: Any, **kwargs: Any) -> "_NullParser":
+        return self
+
+
+class SelectiveSubParsers:
+    """Subparser-action proxy that only materializes one top-level command.
+
+    Wraps the root ``_SubParsersAction`` during a targeted build: the command
+    named *target* is registered for real (with its full subtree); every other
+    ``add_parser`` call yields a ``_NullParser`` so its arguments are skipped.
+    """
+
+    def __init__(self, commands: argparse._SubParsersAction, target: str) -> None:
+        """Wrap *commands*, keeping only the subtree rooted at *target*."""
+        self._commands = commands
+        self._target = target
+        self.matched = False
+
+    def add_parser(self, name: str, **kwargs: Any) -> Any:
+        """Register *name* for real when it is the target, else return a null parser."""
+        if name != self._target and self._target not in kwargs.get("aliases", ()):
+            return _NullParser()
+        self.matched = True
+        return self._commands.add_parser(name, **kwargs)
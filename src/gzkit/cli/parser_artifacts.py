@@ -222,10 +222,23 @@ def _register_adr_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz adr evaluate ADR-0.1.0",
                 "gz adr evaluate ADR-0.1.0 --json",
                 "gz adr evaluate ADR-0.1.0 --no-scorecard",
+                "gz adr evaluate --all --json",
             ]
         ),
     )
-    p_adr_eval.add_argument("adr_id", help="ADR identifier (e.g., ADR-0.19.0)")
+    p_adr_eval.add_argument("adr_id", nargs="?", help="ADR identifier (e.g., ADR-0.19.0)")
+    p_adr_eval.add_argument(
+        "--all",
+        dest="all_adrs",
+        action="store_true",
+        help="Evaluate every ADR package and print an aggregate report",
+    )
+    p_adr_eval.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --all (default: CPU count)",
+    )
     add_json_flag(p_adr_eval)
     p_adr_eval.add_argument(
         "--no-scorecard",
@@ -239,6 +252,8 @@ def _register_adr_parsers(commands: argparse._SubParsersAction) -> None:
             adr_id=a.adr_id,
             as_json=a.as_json,
             write_scorecard=a.write_scorecard,
+            all_adrs=a.all_adrs,
+            jobs=a.jobs,
         )
     )
 
@@ -654,6 +669,7 @@ def _register_obpi_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz obpi lock claim OBPI-0.1.0-01",
                 "gz obpi lock claim OBPI-0.1.0-01 --ttl 240",
                 "gz obpi lock claim OBPI-0.1.0-01 --agent my-agent --json",
+                "gz obpi lock claim OBPI-0.1.0-01 --renew",
             ]
         ),
     )
@@ -668,10 +684,19 @@ def _register_obpi_parsers(commands: argparse._SubParsersAction) -> None:
     p_lock_claim.add_argument(
         "--agent", dest="agent", default=None, help="Override auto-detected agent identity"
     )
+    p_lock_claim.add_argument(
+        "--renew",
+        action="store_true",
+        help="Refresh the heartbeat of a lock you already hold instead of claiming",
+    )
     add_json_flag(p_lock_claim)
     p_lock_claim.set_defaults(
         func=lambda a: _lazy("obpi_lock_claim_cmd")(
-            obpi_id=a.obpi, ttl_minutes=a.ttl_minutes, as_json=a.as_json, agent=a.agent
+            obpi_id=a.obpi,
+            ttl_minutes=a.ttl_minutes,
+            as_json=a.as_json,
+            agent=a.agent,
+            renew=a.renew,
         )
     )
 
@@ -21,6 +21,7 @@ from gzkit.cli.helpers import (
     add_dry_run_flag,
     add_force_flag,
     add_json_flag,
+    add_json_output_flags,
     add_table_flag,
     build_epilog,
 )
@@ -93,7 +94,9 @@ def _closeout_dispatch(a: argparse.Namespace) -> None:
             ceremony_restart=a.ceremony_restart,
         )
     else:
-        _lazy("closeout_cmd")(adr=a.adr, as_json=a.as_json, dry_run=a.dry_run)
+        _lazy("closeout_cmd")(
+            adr=a.adr, as_json=a.as_json, dry_run=a.dry_run, rerun_gates=a.rerun_gates
+        )
 
 
 def register_governance_parsers(commands: argparse._SubParsersAction) -> None:  # noqa: PLR0915
@@ -365,10 +368,12 @@ def register_governance_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz status --table",
                 "gz status --json",
                 "gz status --show-gates",
+                "gz status --watch",
+                "gz status --ndjson",
             ]
         ),
     )
-    add_json_flag(p_status)
+    add_json_output_flags(p_status)
     add_table_flag(
         p_status, help_override="Show a tabular ADR summary (ADR, lifecycle, lane, OBPI, QC)."
     )
@@ -377,8 +382,26 @@ def register_governance_parsers(commands: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Show detailed gate-level QC breakdown (internal diagnostics).",
     )
+    p_status.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay resident and redraw the ADRs affected by ledger or design-doc changes.",
+    )
+    p_status.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between change checks in --watch mode (default: 1.0).",
+    )
     p_status.set_defaults(
-        func=lambda a: _lazy("status")(as_json=a.as_json, show_gates=a.show_gates, as_table=a.table)
+        func=lambda a: _lazy("status")(
+            as_json=a.as_json,
+            show_gates=a.show_gates,
+            as_table=a.table,
+            watch=a.watch,
+            interval=a.interval,
+            as_ndjson=a.as_ndjson,
+        )
     )
 
     p_closeout = commands.add_parser(
@@ -390,6 +413,7 @@ def register_governance_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz closeout ADR-0.1.0",
                 "gz closeout ADR-0.1.0 --dry-run",
                 "gz closeout ADR-0.1.0 --json",
+                "gz closeout ADR-0.1.0 --rerun-gates",
                 "gz closeout ADR-0.1.0 --ceremony",
                 "gz closeout ADR-0.1.0 --ceremony --next",
                 'gz closeout ADR-0.1.0 --ceremony --attest "Completed"',
@@ -399,6 +423,12 @@ def register_governance_parsers(commands: argparse._SubParsersAction) -> None:
     p_closeout.add_argument("adr", help="ADR identifier to close out (e.g. ADR-0.0.4)")
     add_json_flag(p_closeout)
     add_dry_run_flag(p_closeout)
+    p_closeout.add_argument(
+        "--rerun-gates",
+        action="store_true",
+        default=False,
+        help="Re-run every quality gate even if it already passed on the identical tree",
+    )
     p_closeout.add_argument(
         "--ceremony",
         action="store_true",
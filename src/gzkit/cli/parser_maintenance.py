@@ -20,6 +20,7 @@ from typing import Any
 from gzkit.cli.helpers import (
     add_dry_run_flag,
     add_json_flag,
+    add_json_output_flags,
     build_epilog,
 )
 from gzkit.skills import DEFAULT_MAX_REVIEW_AGE_DAYS
@@ -185,11 +186,12 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz drift",
                 "gz drift --json",
                 "gz drift --plain",
+                "gz drift --ndjson",
                 "gz drift --adr-dir path/to/adrs",
             ]
         ),
     )
-    add_json_flag(p_drift)
+    add_json_output_flags(p_drift)
     p_drift.add_argument(
         "--plain", action="store_true", default=False, help="One record per line (grep-friendly)"
     )
@@ -201,7 +203,11 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
     )
     p_drift.set_defaults(
         func=lambda a: _lazy("drift_cmd")(
-            as_json=a.as_json, plain=a.plain, adr_dir=a.adr_dir, test_dir=a.test_dir
+            as_json=a.as_json,
+            plain=a.plain,
+            adr_dir=a.adr_dir,
+            test_dir=a.test_dir,
+            as_ndjson=a.as_ndjson,
         )
     )
 
@@ -216,6 +222,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz covers OBPI-0.20.0-01",
                 "gz covers --json",
                 "gz covers ADR-0.20.0 --plain",
+                "gz covers --ndjson",
                 "gz covers ADR-0.9.0 --include-doc",
             ]
         ),
@@ -223,7 +230,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
     p_covers.add_argument(
         "target", nargs="?", default=None, help="ADR-X.Y.Z or OBPI-X.Y.Z-NN to filter (all)"
     )
-    add_json_flag(p_covers)
+    add_json_output_flags(p_covers)
     p_covers.add_argument(
         "--plain", action="store_true", default=False, help="One record per line (grep-friendly)"
     )
@@ -254,6 +261,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
             test_dir=a.test_dir,
             features_dir=a.features_dir,
             include_doc=a.include_doc,
+            as_ndjson=a.as_ndjson,
         )
     )
 
@@ -266,6 +274,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
                 "gz validate --manifest --ledger",
                 "gz validate --documents --surfaces",
                 "gz validate --briefs --json",
+                "gz validate --audits --ndjson",
             ]
         ),
     )
@@ -440,7 +449,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Flag if no reconcile event since HEAD (grace: 24h)",
     )
-    add_json_flag(p_validate)
+    add_json_output_flags(p_validate)
     p_validate.set_defaults(
         func=lambda a: _lazy("validate")(
             check_manifest=a.check_manifest,
@@ -471,6 +480,7 @@ def _register_quality_parsers(commands: argparse._SubParsersAction) -> None:
             check_advisory_scorecard=a.check_advisory_scorecard,
             check_reconcile_freshness=a.check_reconcile_freshness,
             as_json=a.as_json,
+            as_ndjson=a.as_ndjson,
             frontmatter_adr=a.frontmatter_adr,
             frontmatter_explain=a.frontmatter_explain,
         )
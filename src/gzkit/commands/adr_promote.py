@@ -181,20 +181,21 @@ def _apply_adr_promotion(ledger: Ledger, promotion_plan: dict[str, Any]) -> None
     for plan in cast(list[dict[str, Any]], promotion_plan["obpi_plans"]):
         cast(Path, plan["obpi_file"]).write_text(cast(str, plan["content"]), encoding="utf-8")
     pool_file.write_text(cast(str, promotion_plan["updated_pool_content"]), encoding="utf-8")
-    ledger.append(
+    events = [
         artifact_renamed_event(
             old_id=cast(str, promotion_plan["pool_adr_id"]),
             new_id=cast(str, promotion_plan["target_adr_id"]),
             reason="pool_promotion",
         )
-    )
-    for plan in cast(list[dict[str, Any]], promotion_plan["obpi_plans"]):
-        ledger.append(
-            obpi_created_event(
-                cast(str, plan["obpi_id"]),
-                cast(str, promotion_plan["target_adr_id"]),
-            )
+    ]
+    events.extend(
+        obpi_created_event(
+            cast(str, plan["obpi_id"]),
+            cast(str, promotion_plan["target_adr_id"]),
         )
+        for plan in cast(list[dict[str, Any]], promotion_plan["obpi_plans"])
+    )
+    ledger.append_many(events)
 
 
 def _print_adr_promotion_applied(project_root: Path, promotion_plan: dict[str, Any]) -> None:
@@ -224,12 +225,12 @@ def _check_scaffold_obpis(
 
     validator = ObpiValidator(project_root)
     obpi_plans = cast(list[dict[str, Any]], promotion_plan["obpi_plans"])
+    obpi_paths = [cast(Path, plan["obpi_file"]) for plan in obpi_plans]
+    warnings_by_path = validator.validate_files(obpi_paths)
     scaffold_count = 0
     structure_errors: list[str] = []
-    for plan in obpi_plans:
-        obpi_path = cast(Path, plan["obpi_file"])
-        warnings = validator.validate_file(obpi_path)
-        if warnings:
+    for obpi_path in obpi_paths:
+        if warnings_by_path[obpi_path]:
             scaffold_count += 1
         errors = _validate_brief_structure(project_root, obpi_path)
         for err in errors:
@@ -322,7 +323,13 @@ def adr_promote_cmd(
             raise SystemExit(3)
 
 
-def adr_eval_cmd(adr_id: str, as_json: bool, write_scorecard: bool) -> None:
+def adr_eval_cmd(
+    adr_id: str | None,
+    as_json: bool,
+    write_scorecard: bool,
+    all_adrs: bool = False,
+    jobs: int | None = None,
+) -> None:
     """Evaluate ADR/OBPI quality with deterministic structural checks."""
     from gzkit.adr_eval import (  # noqa: PLC0415
         EvalVerdict,
@@ -334,6 +341,13 @@ def adr_eval_cmd(adr_id: str, as_json: bool, write_scorecard: bool) -> None:
 
     config = ensure_initialized()
     project_root = get_project_root()
+    if all_adrs == (adr_id is not None):
+        msg = "Provide exactly one of an ADR identifier or --all."
+        raise GzCliError(msg)
+    if all_adrs:
+        _adr_eval_all(project_root, config, as_json, write_scorecard, jobs)
+        return
+    adr_id = cast(str, adr_id)
     adr_input = adr_id if adr_id.startswith("ADR-") else f"ADR-{adr_id}"
 
     result = evaluate_adr(project_root, adr_input)
@@ -367,3 +381,56 @@ def adr_eval_cmd(adr_id: str, as_json: bool, write_scorecard: bool) -> None:
 
     if result.verdict != EvalVerdict.GO:
         raise SystemExit(3)
+
+
+def _adr_eval_all(
+    project_root: Path,
+    config: Any,
+    as_json: bool,
+    write_scorecard: bool,
+    jobs: int | None,
+) -> None:
+    """Score every ADR package in one batch and print the aggregate report."""
+    from gzkit.adr_eval import (  # noqa: PLC0415
+        EvalVerdict,
+        discover_adr_packages,
+        evaluate_adr_packages,
+        render_scorecard_markdown,
+    )
+    from gzkit.ledger import adr_eval_completed_event  # noqa: PLC0415
+
+    packages = discover_adr_packages(project_root)
+    report = evaluate_adr_packages(packages, workers=jobs)
+
+    if write_scorecard:
+        adr_dirs = dict(packages)
+        for result in report.results:
+            scorecard_path = adr_dirs[result.adr_id] / "EVALUATION_SCORECARD.md"
+            scorecard_path.write_text(render_scorecard_markdown(result), encoding="utf-8")
+
+    Ledger(project_root / config.paths.ledger).append_many(
+        adr_eval_completed_event(
+            adr_id=result.adr_id,
+            verdict=result.verdict.value,
+            adr_weighted_total=result.adr_weighted_total,
+            obpi_count=len(result.obpi_scores),
+            action_item_count=len(result.action_items),
+        )
+        for result in report.results
+    )
+
+    if as_json:
+        print(json.dumps(report.model_dump(), indent=2))  # noqa: T201
+    else:
+        for result in report.results:
+            console.print(
+                f"{result.adr_id} -- {result.verdict.replace('_', ' ')} "
+                f"({result.adr_weighted_total:.2f}/4.0, {len(result.obpi_scores)} OBPIs)"
+            )
+        for adr_id, reason in report.errors.items():
+            console.print(f"{adr_id} -- ERROR: {reason}")
+        counts = ", ".join(f"{v.replace('_', ' ')}: {n}" for v, n in report.verdict_counts.items())
+        console.print(f"ADR Eval: {len(report.results)} ADRs scored ({counts})")
+
+    if report.errors or any(r.verdict != EvalVerdict.GO for r in report.results):
+        raise SystemExit(3)
@@ -20,6 +20,7 @@ CHORE_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 ALLOWED_LANES = {"lite", "medium", "heavy"}
 SHELL_OPERATORS_RE = re.compile(r"&&|\|\||[|<>]")
 LANE_TIMEOUTS: dict[str, int] = {"lite": 120, "medium": 300, "heavy": 900}
+MAX_PARALLEL_CRITERIA = 4
 
 
 class AcceptanceCriterion(BaseModel):
@@ -34,6 +35,7 @@ class AcceptanceCriterion(BaseModel):
     not_contains: str | None = None
     contains: str | None = None
     description: str | None = None
+    independent: bool = False
 
 
 class ChoreDefinition(BaseModel):
@@ -86,7 +88,7 @@ _CRITERION_TYPES = frozenset(
 # are defined to avoid circular-import issues.
 # ---------------------------------------------------------------------------
 from gzkit.commands.chores_exec import (  # noqa: E402
-    _evaluate_criterion,
+    _evaluate_criteria,
     _log_path,
     _parse_chore_pointer,
     _write_chore_log,
@@ -273,20 +275,19 @@ def chores_advise(slug: str) -> None:
     console.print(f"  Lane: {chore.lane}  |  Version: {chore.version}")
     console.print()
 
-    all_pass = True
-    for idx, criterion in enumerate(chore.criteria, start=1):
-        result = _evaluate_criterion(
-            criterion,
-            project_root,
-            chore.timeout_seconds,
-        )
+    results = _evaluate_criteria(
+        chore.criteria,
+        project_root,
+        chore.timeout_seconds,
+        fail_fast=False,
+    )
+    for idx, result in enumerate(results, start=1):
         mark = "[green]PASS[/green]" if result.passed else "[red]FAIL[/red]"
         console.print(
-            f"  {idx}. {mark}  `{criterion.command}` "
+            f"  {idx}. {mark}  `{result.criterion.command}` "
             f"({result.duration_seconds:.1f}s) -- {result.detail}"
         )
-        if not result.passed:
-            all_pass = False
+    all_pass = all(result.passed for result in results)
 
     console.print()
     if all_pass:
@@ -306,32 +307,28 @@ def chores_run(slug: str) -> None:
     """Execute one chore's acceptance criteria and log results."""
     project_root = get_project_root()
     _registry_path, chore = _resolve_chore(slug)
-    results: list[CriterionResult] = []
-
-    for criterion in chore.criteria:
-        result = _evaluate_criterion(
-            criterion,
+    results = _evaluate_criteria(
+        chore.criteria,
+        project_root,
+        chore.timeout_seconds,
+    )
+    failed = next((result for result in results if not result.passed), None)
+    if failed is not None:
+        log_path = _write_chore_log(
             project_root,
-            chore.timeout_seconds,
+            chore,
+            "FAIL",
+            results,
         )
-        results.append(result)
-
-        if not result.passed:
-            log_path = _write_chore_log(
-                project_root,
-                chore,
-                "FAIL",
-                results,
-            )
-            msg = (
-                "Chore criterion failed:\n"
-                f"- chore: {chore.slug}\n"
-                f"- criterion: {result.criterion.command}\n"
-                f"- detail: {result.detail}\n"
-                f"- log: "
-                f"{log_path.relative_to(project_root).as_posix()}"
-            )
-            raise GzCliError(msg)  # noqa: TRY003
+        msg = (
+            "Chore criterion failed:\n"
+            f"- chore: {chore.slug}\n"
+            f"- criterion: {failed.criterion.command}\n"
+            f"- detail: {failed.detail}\n"
+            f"- log: "
+            f"{log_path.relative_to(project_root).as_posix()}"
+        )
+        raise GzCliError(msg)  # noqa: TRY003
 
     log_path = _write_chore_log(project_root, chore, "PASS", results)
     console.print(
@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import shlex
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
@@ -18,6 +19,7 @@ from typing import cast
 
 from gzkit.commands.chores import (
     _CRITERION_TYPES,
+    MAX_PARALLEL_CRITERIA,
     SHELL_OPERATORS_RE,
     AcceptanceCriterion,
     ChoreDefinition,
@@ -81,6 +83,11 @@ def _parse_criterion(
     desc_raw = data.get("description")
     description = desc_raw.strip() if isinstance(desc_raw, str) else None
 
+    independent = data.get("independent", False)
+    if not isinstance(independent, bool):
+        blockers.append(f"{context}.independent must be a boolean.")
+        return None
+
     if criterion_type == "exitCodeEquals":
         expected_raw = data.get("expected")
         if not isinstance(expected_raw, int):
@@ -110,6 +117,7 @@ def _parse_criterion(
         not_contains=not_contains,
         contains=contains,
         description=description,
+        independent=independent,
     )
 
 
@@ -325,6 +333,78 @@ def _evaluate_criterion(
     )
 
 
+def _criterion_batches(
+    criteria: tuple[AcceptanceCriterion, ...],
+) -> list[list[int]]:
+    """Group criterion indexes into batches that may run concurrently.
+
+    Consecutive ``independent`` criteria share a batch; every other criterion
+    runs alone, so it still sees the side effects of everything declared
+    before it and its successors still see its own.
+    """
+    batches: list[list[int]] = []
+    for idx, criterion in enumerate(criteria):
+        if criterion.independent and batches and criteria[batches[-1][0]].independent:
+            batches[-1].append(idx)
+        else:
+            batches.append([idx])
+    return batches
+
+
+def _run_batch(
+    criteria: tuple[AcceptanceCriterion, ...],
+    batch: list[int],
+    project_root: Path,
+    timeout: int,
+    fail_fast: bool,
+) -> dict[int, CriterionResult]:
+    """Run one batch on a bounded thread pool; return results by criterion index."""
+    if len(batch) == 1:
+        idx = batch[0]
+        return {idx: _evaluate_criterion(criteria[idx], project_root, timeout)}
+
+    results: dict[int, CriterionResult] = {}
+    with ThreadPoolExecutor(max_workers=min(len(batch), MAX_PARALLEL_CRITERIA)) as pool:
+        pending: dict[Future[CriterionResult], int] = {
+            pool.submit(_evaluate_criterion, criteria[idx], project_root, timeout): idx
+            for idx in batch
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = pending.pop(future)
+                if future.cancelled():
+                    continue
+                results[idx] = future.result()
+            if fail_fast and any(not r.passed for r in results.values()):
+                for future in pending:
+                    future.cancel()
+    return results
+
+
+def _evaluate_criteria(
+    criteria: tuple[AcceptanceCriterion, ...],
+    project_root: Path,
+    timeout: int,
+    *,
+    fail_fast: bool = True,
+) -> list[CriterionResult]:
+    """Evaluate a chore's criteria, running ``independent`` ones concurrently.
+
+    Results come back in declaration order regardless of completion order.
+    With *fail_fast*, the first failure stops further batches and cancels
+    queued criteria of its own batch (criteria already running finish within
+    their timeout); only criteria that actually ran are returned.
+    """
+    results: dict[int, CriterionResult] = {}
+    for batch in _criterion_batches(criteria):
+        batch_results = _run_batch(criteria, batch, project_root, timeout, fail_fast)
+        results.update(batch_results)
+        if fail_fast and any(not r.passed for r in batch_results.values()):
+            break
+    return [results[idx] for idx in sorted(results)]
+
+
 # ---------------------------------------------------------------------------
 # Chore log writing
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from datetime import date
 from pathlib import Path
 from typing import Any, cast
 
+from gzkit.commands.closeout_gates import GateResultCache
 from gzkit.commands.common import (
     GzCliError,
     _canonical_attestation_term,
@@ -344,13 +345,35 @@ def _run_closeout_quality_gates(
     ledger: Ledger,
     verification_steps: list[tuple[str, str]],
     as_json: bool,
+    rerun_gates: bool = False,
 ) -> list[dict[str, Any]]:
+    gate_cache = GateResultCache(project_root)
     gate_results: list[dict[str, Any]] = []
     for label, command in verification_steps:
+        gate_num = _closeout_gate_number(label)
+        reused = None if rerun_gates else gate_cache.lookup(command)
+        if reused is not None:
+            gate_results.append(
+                {
+                    "label": label,
+                    "command": command,
+                    "returncode": 0,
+                    "success": True,
+                    "reused": True,
+                }
+            )
+            ledger.append(
+                gate_checked_event(
+                    adr_id, gate_num, "pass", command, 0, evidence=f"reused {reused[:12]}"
+                )
+            )
+            if not as_json:
+                console.print(f"  {label}: [green]PASS[/green] [dim](reused, tree unchanged)[/dim]")
+            continue
+
         if not as_json:
             console.print(f"  Running {label}...", end=" ")
         qr = _cli_main().run_command(command, cwd=project_root)
-        gate_num = _closeout_gate_number(label)
         gate_status = "pass" if qr.success else "fail"
         gate_results.append(
             {
@@ -378,6 +401,7 @@ def _run_closeout_quality_gates(
                 if output_snippet:
                     console.print(f"    {output_snippet}")
         if qr.success:
+            gate_cache.record_pass(command, qr.returncode)
             continue
 
         fail_result = {
@@ -514,12 +538,13 @@ def _complete_closeout_pipeline(
     console.print(f"  ADR status: {to_state}")
 
 
-def closeout_cmd(adr: str, as_json: bool, dry_run: bool) -> None:
+def closeout_cmd(adr: str, as_json: bool, dry_run: bool, rerun_gates: bool = False) -> None:
     """Run the end-to-end closeout pipeline for an ADR.
 
     Executes quality gates inline, prompts for human attestation, bumps the
     project version, and marks the ADR as Completed -- all within a single
-    command invocation.
+    command invocation. Gates that already passed on the identical tree are
+    reused unless *rerun_gates* is set.
     """
     config = ensure_initialized()
     project_root = get_project_root()
@@ -655,6 +680,7 @@ def closeout_cmd(adr: str, as_json: bool, dry_run: bool) -> None:
         ledger=ledger,
         verification_steps=verification_steps,
         as_json=as_json,
+        rerun_gates=rerun_gates,
     )
     _complete_closeout_pipeline(
         project_root=project_root,
@@ -0,0 +1,110 @@
+"""Proven-gate reuse for ``gz closeout``.
+
+A closeout attempt that is aborted after its quality gates passed (at the
+attestation prompt, say) used to re-run every verification command on the
+next attempt. Passing gate results are now recorded in
+``.gzkit/cache/closeout_gates.json`` under a fingerprint of their inputs:
+
+* ``HEAD`` and a content hash of every path that differs from it (staged,
+  unstaged or untracked, excluding the ledger and caches closeout itself
+  writes; canonical sources under ``.gzkit/`` such as skills, rules and
+  schemas are included),
+* the exact command string,
+* the tool version: the gzkit version plus the resolved launcher executable
+  and its stat stamp (project tools run through ``uv run`` are pinned by the
+  lockfile, which the tree hash already covers).
+
+A gate whose fingerprint matches a recorded pass is reused instead of
+executed. Outside a git work tree nothing is fingerprinted and every gate
+runs.
+"""
+
+import hashlib
+import shlex
+import shutil
+from pathlib import Path
+
+from gzkit import __version__
+from gzkit.cache import cache_file, read_json_cache, stat_key, write_json_cache
+from gzkit.utils import git_cmd
+
+GATE_CACHE_SCHEMA = "gzkit.closeout_gates.v1"
+
+# State closeout writes between an aborted attempt and its retry. Everything
+# else under ``.gzkit/`` is tracked source and part of the fingerprint.
+_CLOSEOUT_STATE = (".gzkit/ledger.jsonl", ".gzkit/cache/")
+
+# Recorded passes kept per project; older ones are dropped first.
+_MAX_RECORDS = 64
+
+
+def tree_fingerprint(project_root: Path) -> str | None:
+    """Hash ``HEAD`` plus the contents of every path that differs from it.
+
+    Returns ``None`` when the project is not a git work tree with a commit.
+    """
+    rc, head, _err = git_cmd(project_root, "rev-parse", "HEAD")
+    if rc != 0 or not head:
+        return None
+    rc_diff, diff, _ = git_cmd(project_root, "diff", "--name-only", "-z", "HEAD")
+    rc_new, untracked, _ = git_cmd(project_root, "ls-files", "--others", "--exclude-standard", "-z")
+    if rc_diff != 0 or rc_new != 0:
+        return None
+    digest = hashlib.sha256(head.encode("utf-8"))
+    dirty = {
+        p for p in (diff + "\0" + untracked).split("\0") if p and not p.startswith(_CLOSEOUT_STATE)
+    }
+    for rel in sorted(dirty):
+        digest.update(b"\0" + rel.encode("utf-8") + b"\0")
+        try:
+            digest.update(hashlib.sha256((project_root / rel).read_bytes()).digest())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def tool_version(command: str) -> str:
+    """Describe the tool that runs *command*: gzkit version plus launcher identity."""
+    try:
+        launcher = shlex.split(command)[0]
+    except (ValueError, IndexError):
+        return __version__
+    resolved = shutil.which(launcher)
+    stamp = stat_key(Path(resolved)) if resolved else None
+    return f"{__version__}|{resolved or launcher}|{stamp}"
+
+
+class GateResultCache:
+    """Recorded passing gate results for one project, keyed by input fingerprint."""
+
+    def __init__(self, project_root: Path) -> None:
+        self._path = cache_file(project_root, "closeout_gates.json")
+        self._tree = tree_fingerprint(project_root)
+        payload = read_json_cache(self._path, GATE_CACHE_SCHEMA) or {}
+        records = payload.get("passed")
+        self._passed: dict[str, dict] = records if isinstance(records, dict) else {}
+
+    def fingerprint(self, command: str) -> str | None:
+        """Return the fingerprint for *command* on the current tree, if one exists."""
+        if self._tree is None:
+            return None
+        parts = (self._tree, command, tool_version(command))
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, command: str) -> str | None:
+        """Return the fingerprint of a recorded pass for *command*, or ``None``."""
+        fingerprint = self.fingerprint(command)
+        if fingerprint is None or fingerprint not in self._passed:
+            return None
+        return fingerprint
+
+    def record_pass(self, command: str, returncode: int) -> None:
+        """Remember that *command* passed on the current tree and persist it."""
+        fingerprint = self.fingerprint(command)
+        if fingerprint is None:
+            return
+        self._passed.pop(fingerprint, None)
+        self._passed[fingerprint] = {"command": command, "returncode": returncode}
+        while len(self._passed) > _MAX_RECORDS:
+            self._passed.pop(next(iter(self._passed)))
+        write_json_cache(self._path, GATE_CACHE_SCHEMA, {"passed": self._passed})
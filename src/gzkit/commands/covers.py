@@ -2,8 +2,8 @@
 
 Exposes requirement coverage reporting at three granularity levels:
 all (`gz covers`), by ADR (`gz covers ADR-X.Y.Z`), or by OBPI
-(`gz covers OBPI-X.Y.Z-NN`).  Supports human-readable, JSON, and
-plain output modes.
+(`gz covers OBPI-X.Y.Z-NN`).  Supports human-readable, JSON, NDJSON,
+and plain output modes.
 
 @covers ADR-0.21.0-tests-for-spec
 @covers OBPI-0.21.0-03-gz-covers-cli
@@ -14,6 +14,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+from gzkit.cli.helpers.ndjson import emit_record, emit_summary
 from gzkit.commands.common import console, get_project_root
 from gzkit.traceability import (
     CoverageReport,
@@ -145,6 +146,17 @@ def _format_plain(report: CoverageReport) -> str:
     return "\n".join(lines)
 
 
+def _emit_ndjson(report: CoverageReport) -> None:
+    """Stream REQ entries and rollups as NDJSON records, then the summary."""
+    for entry in report.entries:
+        emit_record("req", entry.model_dump())
+    for rollup in report.by_obpi:
+        emit_record("obpi", rollup.model_dump())
+    for rollup in report.by_adr:
+        emit_record("adr", rollup.model_dump())
+    emit_summary(report.summary.model_dump())
+
+
 def covers_cmd(
     target: str | None = None,
     as_json: bool = False,
@@ -153,6 +165,7 @@ def covers_cmd(
     test_dir: str | None = None,
     features_dir: str | None = None,
     include_doc: bool = False,
+    as_ndjson: bool = False,
 ) -> None:
     """Report requirement coverage from @covers annotations and @REQ scenario tags.
 
@@ -177,7 +190,9 @@ def covers_cmd(
     if target:
         report = _filter_report(report, target)
 
-    if as_json:
+    if as_ndjson:
+        _emit_ndjson(report)
+    elif as_json:
         sys.stdout.write(report.model_dump_json(indent=2) + "\n")
     elif plain:
         output = _format_plain(report)
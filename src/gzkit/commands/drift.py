@@ -14,6 +14,7 @@ import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
+from gzkit.cli.helpers.ndjson import emit_record, emit_summary
 from gzkit.commands.common import console, get_project_root
 from gzkit.traceability import find_covers_in_source
 from gzkit.triangle import (
@@ -144,17 +145,29 @@ def _format_plain(report: DriftReport) -> str:
     return "\n".join(lines)
 
 
+def _emit_ndjson(report: DriftReport) -> None:
+    """Stream drift findings as NDJSON records, then the summary."""
+    for req_id in report.unlinked_specs:
+        emit_record("finding", {"kind": "unlinked", "id": req_id})
+    for req_id in report.orphan_tests:
+        emit_record("finding", {"kind": "orphan", "id": req_id})
+    for code_id in report.unjustified_code_changes:
+        emit_record("finding", {"kind": "unjustified", "id": code_id})
+    emit_summary({"scan_timestamp": report.scan_timestamp, **report.summary.model_dump()})
+
+
 def drift_cmd(
     as_json: bool = False,
     plain: bool = False,
     adr_dir: str | None = None,
     test_dir: str | None = None,
+    as_ndjson: bool = False,
 ) -> None:
     """Run drift detection across the spec-test-code triangle.
 
     Scans OBPI briefs for REQ entities, test files for @covers
     references, and the repository change set for unjustified
-    code changes. Reports findings in human, JSON, or plain mode.
+    code changes. Reports findings in human, JSON, NDJSON, or plain mode.
     """
     project_root = get_project_root()
     briefs_dir = Path(adr_dir) if adr_dir else project_root / "docs" / "design" / "adr"
@@ -170,7 +183,9 @@ def drift_cmd(
     timestamp = datetime.now(UTC).isoformat()
     report = detect_drift(reqs, linkages, changed_vertices, timestamp)
 
-    if as_json:
+    if as_ndjson:
+        _emit_ndjson(report)
+    elif as_json:
         sys.stdout.write(report.model_dump_json(indent=2) + "\n")
     elif plain:
         output = _format_plain(report)
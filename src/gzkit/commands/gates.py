@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Any, Literal
 
+from gzkit.cache import cache_file
 from gzkit.cli.helpers.exit_codes import EXIT_POLICY_BREACH, EXIT_USER_ERROR
 from gzkit.commands.common import (
     GzCliError,
@@ -287,7 +288,9 @@ def _run_eval_delta(
         return True
 
     try:
-        current = run_eval_suite(data_dir=data_dir)
+        current = run_eval_suite(
+            data_dir=data_dir, cache_path=cache_file(project_root, "eval_cases.json")
+        )
     except (OSError, ValueError, KeyError, json.JSONDecodeError) as exc:
         console.print(f"  [red]❌[/red] Eval delta: ERROR ({exc})")
         _record_gate_result(ledger, adr_id, 2, "fail", "eval-delta", 1, str(exc))
@@ -4,7 +4,9 @@ import json
 import re
 import subprocess
 import sys
+import tempfile
 from datetime import UTC, datetime
+from fnmatch import fnmatch
 from pathlib import Path
 
 from gzkit.commands.common import console
@@ -61,11 +63,8 @@ def _audit_all_for_adr(project_root: Path, adr_id: str, as_json: bool) -> None:
         prior = _read_prior_audits(adr_dir)
         _print_prior_state(prior, project_root)
 
-    results = []
-    for brief in sorted(obpis_dir.glob("OBPI-*.md")):
-        oid = _extract_obpi_id(brief)
-        if oid:
-            results.append(_audit_single(project_root, oid))
+    obpi_ids = [oid for oid in map(_extract_obpi_id, sorted(obpis_dir.glob("OBPI-*.md"))) if oid]
+    results = _audit_obpis(project_root, adr_id, obpi_ids)
 
     if as_json:
         print(json.dumps({"adr_id": adr_id, "audits": results}, indent=2))
@@ -77,39 +76,45 @@ def _audit_all_for_adr(project_root: Path, adr_id: str, as_json: bool) -> None:
 
 def _audit_single(project_root: Path, obpi_id: str) -> dict:
     """Audit a single OBPI and append ledger entry."""
-    adr_id = _derive_adr_id(obpi_id)
-    adr_dir = _find_adr_dir(project_root, adr_id) if adr_id else None
+    return _audit_obpis(project_root, _derive_adr_id(obpi_id), [obpi_id])[0]
 
-    brief_path = _find_brief(adr_dir, obpi_id) if adr_dir else None
-    brief_status = "unknown"
-    lane = "Lite"
-    if brief_path:
-        brief_status, lane = _read_brief_meta(brief_path)
-
-    tests_found = _find_tests(project_root, adr_id or "", obpi_id)
-    tests_passed, test_count = _run_tests(project_root, tests_found)
-    coverage_pct = _measure_coverage(project_root, tests_found)
-    covers_tags = _find_covers_tags(project_root, adr_id or "")
-
-    criteria = _build_criteria(tests_found, tests_passed, test_count, coverage_pct)
-
-    entry = _build_entry(
-        obpi_id,
-        adr_id,
-        brief_status,
-        lane,
-        tests_found,
-        tests_passed,
-        test_count,
-        coverage_pct,
-        covers_tags,
-        criteria,
-    )
 
-    if adr_dir:
-        _append_ledger(adr_dir, entry)
+def _audit_obpis(project_root: Path, adr_id: str | None, obpi_ids: list[str]) -> list[dict]:
+    """Audit OBPIs of one ADR from a single test-tree walk and a single test run."""
+    adr_dir = _find_adr_dir(project_root, adr_id) if adr_id else None
+    tests_by_obpi, covers_tags = _scan_tests(project_root, adr_id or "", obpi_ids)
+    outcomes = _run_tests_with_coverage(project_root, tests_by_obpi)
+
+    entries: list[dict] = []
+    for obpi_id in obpi_ids:
+        brief_path = _find_brief(adr_dir, obpi_id) if adr_dir else None
+        brief_status = "unknown"
+        lane = "Lite"
+        if brief_path:
+            brief_status, lane = _read_brief_meta(brief_path)
+
+        tests_found = tests_by_obpi[obpi_id]
+        tests_passed, test_count, coverage_pct = outcomes[obpi_id]
+        criteria = _build_criteria(tests_found, tests_passed, test_count, coverage_pct)
+
+        entry = _build_entry(
+            obpi_id,
+            adr_id,
+            brief_status,
+            lane,
+            tests_found,
+            tests_passed,
+            test_count,
+            coverage_pct,
+            covers_tags,
+            criteria,
+        )
+
+        if adr_dir:
+            _append_ledger(adr_dir, entry)
+        entries.append(entry)
 
-    return entry
+    return entries
 
 
 def _build_criteria(
@@ -245,96 +250,88 @@ def _read_brief_meta(brief_path: Path) -> tuple[str, str]:
     return status, lane
 
 
-def _find_tests(project_root: Path, adr_id: str, obpi_id: str) -> list[Path]:
-    """Find test files via @covers tag or OBPI reference."""
+def _scan_tests(
+    project_root: Path, adr_id: str, obpi_ids: list[str]
+) -> tuple[dict[str, list[Path]], list[str]]:
+    """Walk ``tests/`` once for per-OBPI test files and the ADR's @covers lines.
+
+    A ``test_*.py`` file belongs to an OBPI when it mentions the ADR or the
+    OBPI identifier.
+    """
+    tests_by_obpi: dict[str, list[Path]] = {obpi_id: [] for obpi_id in obpi_ids}
+    covers_tags: list[str] = []
     tests_dir = project_root / "tests"
     if not tests_dir.exists():
-        return []
-    found: list[Path] = []
-    for test_file in tests_dir.rglob("test_*.py"):
+        return tests_by_obpi, covers_tags
+    for py_file in tests_dir.rglob("*.py"):
         try:
-            content = test_file.read_text(encoding="utf-8")
-            if adr_id in content or obpi_id in content:
-                found.append(test_file.relative_to(project_root))
+            content = py_file.read_text(encoding="utf-8")
         except OSError:
             continue
-    return found
-
+        if adr_id:
+            covers_tags.extend(
+                line.strip()
+                for line in content.splitlines()
+                if "@covers" in line and adr_id in line
+            )
+        if not fnmatch(py_file.name, "test_*.py"):
+            continue
+        for obpi_id, found in tests_by_obpi.items():
+            if adr_id in content or obpi_id in content:
+                found.append(py_file.relative_to(project_root))
+    return tests_by_obpi, covers_tags
 
-def _run_tests(project_root: Path, test_files: list[Path]) -> tuple[bool, int]:
-    """Run discovered tests and return (passed, count)."""
-    if not test_files:
-        return False, 0
-    try:
-        result = subprocess.run(
-            ["uv", "run", "-m", "unittest", "-q"] + [str(f) for f in test_files],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            cwd=str(project_root),
-            timeout=120,
-        )
-        import contextlib
-
-        count = 0
-        for line in result.stderr.splitlines():
-            if "Ran " in line and " test" in line:
-                with contextlib.suppress(ValueError, IndexError):
-                    count = int(line.split("Ran ")[1].split(" test")[0])
-        return result.returncode == 0, count
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False, 0
 
+def _test_module(test_file: Path) -> str:
+    """Return the dotted module name unittest derives from a test file path."""
+    return ".".join(test_file.with_suffix("").parts)
 
-def _measure_coverage(project_root: Path, test_files: list[Path]) -> float | None:
-    """Measure coverage for test files."""
-    if not test_files:
-        return None
-    try:
-        subprocess.run(
-            ["uv", "run", "coverage", "run", "--source=src", "-m", "unittest", "-q"]
-            + [str(f) for f in test_files],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            cwd=str(project_root),
-            timeout=120,
-        )
-        result = subprocess.run(
-            ["uv", "run", "coverage", "report", "--format=total"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            cwd=str(project_root),
-            timeout=30,
-        )
-        if result.returncode == 0:
-            try:
-                return float(result.stdout.strip())
-            except ValueError:
-                return None
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-    return None
 
+def _run_tests_with_coverage(
+    project_root: Path, tests_by_obpi: dict[str, list[Path]]
+) -> dict[str, tuple[bool, int, float | None]]:
+    """Run the union of the OBPIs' tests once and split results per OBPI.
 
-def _find_covers_tags(project_root: Path, adr_id: str) -> list[str]:
-    """Find @covers decorators referencing this ADR."""
-    if not adr_id:
-        return []
-    found: list[str] = []
-    tests_dir = project_root / "tests"
-    if not tests_dir.exists():
-        return found
-    for test_file in tests_dir.rglob("*.py"):
+    Returns ``(passed, test_count, coverage_percent)`` per OBPI. The run
+    happens in one ``uv run`` of :mod:`gzkit.commands.obpi_audit_runner`,
+    which records coverage with per-test contexts.
+    """
+    outcomes: dict[str, tuple[bool, int, float | None]] = dict.fromkeys(
+        tests_by_obpi, (False, 0, None)
+    )
+    groups = {
+        obpi_id: sorted({_test_module(f) for f in files})
+        for obpi_id, files in tests_by_obpi.items()
+        if files
+    }
+    if not groups:
+        return outcomes
+
+    runner = Path(__file__).with_name("obpi_audit_runner.py")
+    with tempfile.TemporaryDirectory(prefix="gz-obpi-audit-") as tmp:
+        spec_path = Path(tmp) / "spec.json"
+        out_path = Path(tmp) / "result.json"
+        spec_path.write_text(json.dumps({"groups": groups}), encoding="utf-8")
         try:
-            content = test_file.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if "@covers" in line and adr_id in line:
-                    found.append(line.strip())
-        except OSError:
-            continue
-    return found
+            subprocess.run(
+                ["uv", "run", "python", str(runner), str(spec_path), str(out_path)],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                cwd=str(project_root),
+                timeout=600,
+            )
+            payload = json.loads(out_path.read_text(encoding="utf-8"))
+        except (subprocess.SubprocessError, FileNotFoundError, OSError, ValueError):
+            return outcomes
+
+    module_results: dict[str, dict] = payload.get("modules", {})
+    coverage: dict[str, float | None] = payload.get("coverage", {})
+    for obpi_id, modules in groups.items():
+        runs = [module_results.get(m, {"run": 0, "ok": False}) for m in modules]
+        passed = all(r.get("ok") is True for r in runs)
+        outcomes[obpi_id] = (passed, sum(int(r.get("run", 0)) for r in runs), coverage.get(obpi_id))
+    return outcomes
 
 
 def _append_ledger(adr_dir: Path, entry: dict) -> None:
@@ -0,0 +1,73 @@
+"""Single-process test and coverage run backing ``gz obpi audit``.
+
+Executed as a script inside the project environment (``uv run python
+<this file> SPEC OUT``), so it imports only the standard library and, when
+available, ``coverage``. SPEC is a JSON file ``{"groups": {obpi_id:
+[test_module, ...]}}``; the union of the modules is loaded and run once,
+module by module, under coverage with ``test_function`` dynamic contexts.
+
+OUT receives ``{"modules": {module: {"run": int, "ok": bool}}, "coverage":
+{obpi_id: percent | null}}``. Each OBPI's percentage is the total over
+``src`` restricted to the contexts of its own test modules plus the empty
+context, which holds import-time and fixture lines shared by every test.
+"""
+
+import io
+import json
+import os
+import re
+import sys
+import unittest
+from typing import Any
+
+
+def _run_module(module: str) -> dict[str, Any]:
+    stream = io.StringIO()
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromName(module)
+    except Exception:  # noqa: BLE001 -- an unimportable module is a failed module
+        return {"run": 0, "ok": False}
+    result = unittest.TextTestRunner(stream=stream, verbosity=0).run(suite)
+    return {"run": result.testsRun, "ok": result.wasSuccessful()}
+
+
+def _coverage_for(cov: Any, modules: list[str]) -> float | None:
+    pattern = "^(?:" + "|".join(re.escape(m) for m in modules) + r")\.|^$"
+    try:
+        return round(cov.report(contexts=[pattern], file=io.StringIO()), 2)
+    except Exception:  # noqa: BLE001 -- coverage raises NoDataError and friends
+        return None
+
+
+def main(spec_path: str, out_path: str) -> int:
+    """Run the spec's test modules once and write per-module/per-OBPI results."""
+    sys.path.insert(0, os.getcwd())
+    with open(spec_path, encoding="utf-8") as handle:
+        groups: dict[str, list[str]] = json.load(handle)["groups"]
+    modules = sorted({m for members in groups.values() for m in members})
+
+    try:
+        import coverage  # noqa: PLC0415 -- optional in the project environment
+    except ImportError:
+        cov = None
+    else:
+        cov = coverage.Coverage(source=["src"], data_file=None)
+        cov.set_option("run:dynamic_context", "test_function")
+        cov.start()
+    try:
+        results = {module: _run_module(module) for module in modules}
+    finally:
+        if cov is not None:
+            cov.stop()
+
+    percents = {
+        obpi_id: _coverage_for(cov, members) if cov is not None and members else None
+        for obpi_id, members in groups.items()
+    }
+    with open(out_path, "w", encoding="utf-8") as handle:
+        json.dump({"modules": results, "coverage": percents}, handle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1], sys.argv[2]))
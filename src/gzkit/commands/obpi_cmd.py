@@ -403,10 +403,11 @@ def _obpi_validate_batch(
         console.print(f"[red]No OBPI briefs found in {obpi_dir}[/red]")
         raise SystemExit(1)
 
+    completion = validator.validate_files(briefs, require_authored=authored)
     total_errors = 0
     for brief_path in briefs:
         structure_errors = _validate_brief_structure(project_root, brief_path)
-        completion_errors = validator.validate_file(brief_path, require_authored=authored)
+        completion_errors = completion[brief_path]
         all_errors = structure_errors + completion_errors
         if all_errors:
             total_errors += 1
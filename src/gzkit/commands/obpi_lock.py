@@ -9,20 +9,22 @@ from __future__ import annotations
 
 import json
 import sys
+from pathlib import Path
 
 from gzkit.commands.common import console, ensure_initialized, get_project_root
 from gzkit.ledger import Ledger
 from gzkit.ledger_events import obpi_lock_claimed_event, obpi_lock_released_event
 from gzkit.lock_manager import (
     LockData,
+    claim_lock,
     current_branch,
     delete_lock,
     list_locks,
     read_lock,
     reap_expired_locks,
+    renew_lock,
     resolve_agent,
     resolve_session_id,
-    write_lock,
 )
 
 
@@ -31,24 +33,20 @@ def obpi_lock_claim_cmd(
     ttl_minutes: int,
     as_json: bool,
     agent: str | None = None,
+    renew: bool = False,
 ) -> None:
-    """Claim an OBPI work lock with ledger accounting."""
+    """Claim an OBPI work lock with ledger accounting.
+
+    With ``renew``, only refresh the heartbeat of a lock the agent already
+    holds; no ledger event is emitted.
+    """
     config = ensure_initialized()
     project_root = get_project_root()
 
     resolved_agent = resolve_agent(agent)
-    existing = read_lock(project_root, obpi_id)
-
-    if existing is not None and not existing.is_expired and existing.agent != resolved_agent:
-        if as_json:
-            print(json.dumps({"status": "conflict", "holder": existing.model_dump()}))
-        else:
-            console.print(
-                f"[red]CONFLICT:[/red] {obpi_id} locked by {existing.agent} "
-                f"at {existing.claimed_at} (TTL {existing.ttl_minutes}m, "
-                f"{existing.elapsed_minutes:.0f}m elapsed)"
-            )
-        sys.exit(1)
+    if renew:
+        _renew(project_root, obpi_id, resolved_agent, as_json)
+        return
 
     import os  # noqa: PLC0415
 
@@ -61,7 +59,17 @@ def obpi_lock_claim_cmd(
         branch=current_branch(),
         ttl_minutes=ttl_minutes,
     )
-    write_lock(project_root, lock_data)
+    existing = claim_lock(project_root, lock_data)
+    if existing is not None:
+        if as_json:
+            print(json.dumps({"status": "conflict", "holder": existing.model_dump()}))
+        else:
+            console.print(
+                f"[red]CONFLICT:[/red] {obpi_id} locked by {existing.agent} "
+                f"at {existing.claimed_at} (TTL {existing.ttl_minutes}m, "
+                f"{existing.elapsed_minutes:.0f}m elapsed)"
+            )
+        sys.exit(1)
 
     ledger = Ledger(project_root / config.paths.ledger)
     ledger.append(
@@ -89,6 +97,31 @@ def obpi_lock_claim_cmd(
         )
 
 
+def _renew(project_root: Path, obpi_id: str, agent: str, as_json: bool) -> None:
+    """Refresh the heartbeat of *agent*'s lock on *obpi_id*; exit 1 if not held."""
+    renewed = renew_lock(project_root, obpi_id, agent)
+    if renewed is None:
+        if as_json:
+            print(json.dumps({"status": "not_held", "obpi_id": obpi_id, "requester": agent}))
+        else:
+            console.print(
+                f"[red]NOT HELD:[/red] {obpi_id} has no live lock held by {agent}. "
+                "Claim it without --renew."
+            )
+        sys.exit(1)
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "status": "renewed",
+                    "lock": renewed.model_dump(exclude={"is_expired", "elapsed_minutes"}),
+                }
+            )
+        )
+    else:
+        console.print(f"[green]Renewed:[/green] {obpi_id} (heartbeat={renewed.heartbeat_at})")
+
+
 def obpi_lock_release_cmd(
     obpi_id: str,
     as_json: bool,
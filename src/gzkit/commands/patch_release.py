@@ -184,25 +184,35 @@ def _discover_ghis(project_root: Path, since_date: str | None) -> list[GhiRecord
     return records
 
 
-def _ghi_has_src_commits(project_root: Path, ghi_number: int) -> bool:
-    """Check whether any commits referencing *ghi_number* modified ``src/gzkit/``."""
+_GHI_REF_RE = re.compile(r"#(\d+)\b")
+
+
+def _src_commit_ghi_refs(project_root: Path) -> set[int]:
+    """Return every ``#N`` referenced by a commit message that modified ``src/gzkit/``.
+
+    One ``git log`` pass over all refs replaces a log walk per GHI; callers
+    classify GHIs against the returned set in memory.
+    """
     rc, stdout, _err = git_cmd(
         project_root,
         "log",
         "--all",
-        "--grep",
-        f"#{ghi_number}",
-        "--format=%H",
+        "--format=%H%x00%B",
         "--",
         "src/gzkit/",
     )
-    return rc == 0 and bool(stdout.strip())
+    if rc != 0:
+        return set()
+    return {int(number) for number in _GHI_REF_RE.findall(stdout)}
+
 
+def _classify_ghi(ghi: GhiRecord, src_refs: set[int]) -> GhiQualification:
+    """Classify a GHI by cross-validating runtime label and src diff.
 
-def _classify_ghi(project_root: Path, ghi: GhiRecord) -> GhiQualification:
-    """Classify a GHI by cross-validating runtime label and src diff."""
+    *src_refs* is the set of GHI numbers from :func:`_src_commit_ghi_refs`.
+    """
     has_label = "runtime" in ghi.labels
-    has_diff = _ghi_has_src_commits(project_root, ghi.number)
+    has_diff = ghi.number in src_refs
 
     if has_label and has_diff:
         status: GhiStatus = "qualified"
@@ -520,7 +530,8 @@ def patch_release_cmd(*, dry_run: bool, as_json: bool, full: bool = False) -> No
 
     tag, tag_date = _get_latest_tag(project_root)
     ghis = _discover_ghis(project_root, tag_date)
-    qualifications = [_classify_ghi(project_root, ghi) for ghi in ghis]
+    src_refs = _src_commit_ghi_refs(project_root) if ghis else set()
+    qualifications = [_classify_ghi(ghi, src_refs) for ghi in ghis]
 
     current_version = _read_current_project_version(project_root)
     proposed_version = compute_patch_increment(current_version) if current_version else None
@@ -116,7 +116,7 @@ def persona_drift_cmd(*, persona: str | None = None, as_json: bool = False) -> N
     Exit code 0 when no drift detected, exit code 3 on policy breach.
     """
     from gzkit.cli.helpers.exit_codes import EXIT_POLICY_BREACH  # noqa: PLC0415
-    from gzkit.personas import evaluate_persona_drift  # noqa: PLC0415
+    from gzkit.persona_drift import evaluate_persona_drift  # noqa: PLC0415
 
     project_root = get_project_root()
     report = evaluate_persona_drift(project_root, persona_name=persona)
@@ -1,36 +1,89 @@
 """Readiness audit and eval command implementations."""
 
 import json
+import os
+import stat
 from pathlib import Path
 from typing import Any, cast
 
 from rich.table import Table
 
 from gzkit.commands.common import console, get_project_root
+from gzkit.commands.readiness_cache import ReadinessCheckCache
+
+
+class _ReadinessProbe:
+    """Per-run memo of the file system facts readiness checks look at.
+
+    Every path is stat'ed at most once and every markers file is read and
+    lower-cased at most once, however many checks reference it.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self._stats: dict[str, os.stat_result | None] = {}
+        self._lowered: dict[str, str | None] = {}
+
+    def _stat(self, rel_path: str) -> os.stat_result | None:
+        if rel_path not in self._stats:
+            try:
+                self._stats[rel_path] = (self.project_root / rel_path).stat()
+            except OSError:
+                self._stats[rel_path] = None
+        return self._stats[rel_path]
+
+    def is_dir(self, rel_path: str) -> bool:
+        """Return whether *rel_path* is a directory."""
+        st = self._stat(rel_path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def is_file(self, rel_path: str) -> bool:
+        """Return whether *rel_path* is a regular file."""
+        st = self._stat(rel_path)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    def lowered(self, rel_path: str) -> str | None:
+        """Return the lower-cased content of file *rel_path*, or ``None`` when unreadable."""
+        if rel_path not in self._lowered:
+            content: str | None = None
+            if self.is_file(rel_path):
+                try:
+                    content = (self.project_root / rel_path).read_text(encoding="utf-8").lower()
+                except OSError:
+                    content = None
+            self._lowered[rel_path] = content
+        return self._lowered[rel_path]
+
+    def stamps(self) -> dict[str, list[int] | None]:
+        """Return ``[mtime_ns, size]`` (or ``None`` when absent) for every path looked at."""
+        return {
+            rel_path: None if st is None else [st.st_mtime_ns, st.st_size]
+            for rel_path, st in self._stats.items()
+        }
 
 
-def _readiness_collect_markers(path: Path, markers: tuple[str, ...]) -> list[str]:
+def _readiness_collect_markers(
+    probe: _ReadinessProbe, rel_path: str, markers: tuple[str, ...]
+) -> list[str]:
     """Return marker strings that are missing from file content."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except OSError:
+    lowered = probe.lowered(rel_path)
+    if lowered is None:
         return list(markers)
-    lowered = content.lower()
     return [marker for marker in markers if marker.lower() not in lowered]
 
 
-def _readiness_check_exists(project_root: Path, rel_path: str, *, expect_dir: bool) -> bool:
+def _readiness_check_exists(probe: _ReadinessProbe, rel_path: str, *, expect_dir: bool) -> bool:
     """Return whether a project-relative file/directory exists with expected type."""
-    path = project_root / rel_path
-    return path.is_dir() if expect_dir else path.is_file()
+    return probe.is_dir(rel_path) if expect_dir else probe.is_file(rel_path)
 
 
-def _readiness_check_markers(project_root: Path, rel_path: str, markers: tuple[str, ...]) -> bool:
+def _readiness_check_markers(
+    probe: _ReadinessProbe, rel_path: str, markers: tuple[str, ...]
+) -> bool:
     """Return whether all required marker strings exist in one file."""
-    path = project_root / rel_path
-    if not path.is_file():
+    if not probe.is_file(rel_path):
         return False
-    return not _readiness_collect_markers(path, markers)
+    return not _readiness_collect_markers(probe, rel_path, markers)
 
 
 def _readiness_group_score(passed: int, total: int) -> float:
@@ -40,42 +93,40 @@ def _readiness_group_score(passed: int, total: int) -> float:
     return round((passed / total) * 3, 2)
 
 
-def _readiness_check_any_of(project_root: Path, candidates: list[dict[str, str]]) -> bool:
+def _readiness_check_any_of(probe: _ReadinessProbe, candidates: list[dict[str, str]]) -> bool:
     """Return True if any candidate file/dir exists under project_root."""
     for candidate in candidates:
         candidate_kind = candidate.get("kind", "file")
         rel_path = candidate["path"]
-        if candidate_kind == "dir" and _readiness_check_exists(
-            project_root, rel_path, expect_dir=True
-        ):
+        if candidate_kind == "dir" and _readiness_check_exists(probe, rel_path, expect_dir=True):
             return True
-        if candidate_kind == "file" and _readiness_check_exists(
-            project_root, rel_path, expect_dir=False
-        ):
+        if candidate_kind == "file" and _readiness_check_exists(probe, rel_path, expect_dir=False):
             return True
     return False
 
 
-def _readiness_check_ok(project_root: Path, check: dict[str, Any]) -> bool:
+def _readiness_check_ok(
+    project_root: Path, check: dict[str, Any], probe: _ReadinessProbe | None = None
+) -> bool:
     """Evaluate one readiness check definition."""
+    if probe is None:
+        probe = _ReadinessProbe(project_root)
     kind = str(check["kind"])
     if kind == "any_of":
-        return _readiness_check_any_of(
-            project_root, cast(list[dict[str, str]], check["candidates"])
-        )
+        return _readiness_check_any_of(probe, cast(list[dict[str, str]], check["candidates"]))
     rel_path = str(check["path"])
     if kind == "dir":
-        return _readiness_check_exists(project_root, rel_path, expect_dir=True)
+        return _readiness_check_exists(probe, rel_path, expect_dir=True)
     if kind == "file":
-        return _readiness_check_exists(project_root, rel_path, expect_dir=False)
+        return _readiness_check_exists(probe, rel_path, expect_dir=False)
     if kind == "markers":
         markers = cast(tuple[str, ...], check["markers"])
-        return _readiness_check_markers(project_root, rel_path, markers)
+        return _readiness_check_markers(probe, rel_path, markers)
     return False
 
 
 def _readiness_score_disciplines(
-    project_root: Path, discipline_checks: dict[str, list[dict[str, Any]]]
+    probe: _ReadinessProbe, discipline_checks: dict[str, list[dict[str, Any]]]
 ) -> tuple[dict[str, dict[str, Any]], list[dict[str, str]], list[dict[str, str]]]:
     """Score all readiness disciplines and collect failures."""
     discipline_scores: dict[str, dict[str, Any]] = {}
@@ -85,7 +136,7 @@ def _readiness_score_disciplines(
     for discipline, checks in discipline_checks.items():
         passed = 0
         for check in checks:
-            if _readiness_check_ok(project_root, check):
+            if _readiness_check_ok(probe.project_root, check, probe):
                 passed += 1
                 continue
 
@@ -110,12 +161,12 @@ def _readiness_score_disciplines(
 
 
 def _readiness_score_primitives(
-    project_root: Path, primitive_checks: dict[str, list[dict[str, Any]]]
+    probe: _ReadinessProbe, primitive_checks: dict[str, list[dict[str, Any]]]
 ) -> dict[str, dict[str, Any]]:
     """Score all specification primitives."""
     primitive_scores: dict[str, dict[str, Any]] = {}
     for primitive, checks in primitive_checks.items():
-        passed = sum(1 for check in checks if _readiness_check_ok(project_root, check))
+        passed = sum(1 for check in checks if _readiness_check_ok(probe.project_root, check, probe))
         total = len(checks)
         primitive_scores[primitive] = {
             "score": _readiness_group_score(passed, total),
@@ -126,6 +177,33 @@ def _readiness_score_primitives(
     return primitive_scores
 
 
+def _readiness_score_checks(
+    project_root: Path,
+    discipline_checks: dict[str, list[dict[str, Any]]],
+    primitive_checks: dict[str, list[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Score disciplines and primitives, reusing recorded results for an unchanged tree."""
+    cache = ReadinessCheckCache(
+        project_root, {"disciplines": discipline_checks, "primitives": primitive_checks}
+    )
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
+
+    probe = _ReadinessProbe(project_root)
+    discipline_scores, issues, required_failures = _readiness_score_disciplines(
+        probe, discipline_checks
+    )
+    results = {
+        "disciplines": discipline_scores,
+        "primitives": _readiness_score_primitives(probe, primitive_checks),
+        "issues": issues,
+        "required_failures": required_failures,
+    }
+    cache.store(probe.stamps(), results)
+    return results
+
+
 def _readiness_overall_score(discipline_scores: dict[str, dict[str, Any]]) -> float:
     """Compute overall readiness score from discipline scores."""
     return round(
@@ -387,10 +465,11 @@ def readiness_audit_cmd(as_json: bool) -> None:
         ],
     }
 
-    discipline_scores, issues, required_failures = _readiness_score_disciplines(
-        project_root, discipline_checks
-    )
-    primitive_scores = _readiness_score_primitives(project_root, primitive_checks)
+    scored = _readiness_score_checks(project_root, discipline_checks, primitive_checks)
+    discipline_scores: dict[str, dict[str, Any]] = scored["disciplines"]
+    primitive_scores: dict[str, dict[str, Any]] = scored["primitives"]
+    issues: list[dict[str, str]] = scored["issues"]
+    required_failures: list[dict[str, str]] = scored["required_failures"]
     overall_score = _readiness_overall_score(discipline_scores)
 
     # Run instruction eval suite for dimension-based scoring
@@ -0,0 +1,65 @@
+"""Persisted structural check results for ``gz readiness audit``.
+
+Agents run the readiness audit as a preflight, usually against a tree that has
+not changed since the last run. The discipline and primitive check results are
+recorded in ``.gzkit/cache/readiness_audit.json`` together with:
+
+* a digest of the check definitions and the gzkit version, so editing a check
+  or upgrading gzkit invalidates the record,
+* the ``(mtime_ns, size)`` stamp (or absence) of every path the recording run
+  looked at. ``any_of`` checks stop at the first candidate that exists, so the
+  candidates after it are not stamped: they cannot change the outcome while
+  the stamped ones are unchanged.
+
+A record is reused only when the digest and every stamp still match. The
+instruction eval suite is not cached here: its audits scan whole surface
+trees whose inputs are not enumerable up front.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from gzkit import __version__
+from gzkit.cache import cache_file, read_json_cache, stat_key, write_json_cache
+
+READINESS_CACHE_SCHEMA = "gzkit.readiness_audit.v1"
+
+
+def checks_digest(checks: dict[str, Any]) -> str:
+    """Hash the check definitions together with the gzkit version."""
+    encoded = json.dumps(checks, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{__version__}\0{encoded}".encode()).hexdigest()
+
+
+class ReadinessCheckCache:
+    """Recorded readiness check results for one project and one check set."""
+
+    def __init__(self, project_root: Path, checks: dict[str, Any]) -> None:
+        self._root = project_root
+        self._path = cache_file(project_root, "readiness_audit.json")
+        self._digest = checks_digest(checks)
+
+    def lookup(self) -> dict[str, Any] | None:
+        """Return the recorded results when no stamped path changed, else ``None``."""
+        payload = read_json_cache(self._path, READINESS_CACHE_SCHEMA)
+        if payload is None or payload.get("digest") != self._digest:
+            return None
+        stamps = payload.get("stamps")
+        results = payload.get("results")
+        if not isinstance(stamps, dict) or not isinstance(results, dict):
+            return None
+        for rel_path, recorded in stamps.items():
+            current = stat_key(self._root / rel_path)
+            if (list(current) if current is not None else None) != recorded:
+                return None
+        return results
+
+    def store(self, stamps: dict[str, list[int] | None], results: dict[str, Any]) -> None:
+        """Record *results* as valid while every path in *stamps* is unchanged."""
+        write_json_cache(
+            self._path,
+            READINESS_CACHE_SCHEMA,
+            {"digest": self._digest, "stamps": stamps, "results": results},
+        )
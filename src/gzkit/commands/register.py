@@ -126,15 +126,16 @@ def migrate_semver(dry_run: bool) -> None:
             console.print(f"  Would append artifact_renamed: {old_id} -> {new_id}")
         return
 
-    for old_id, new_id in pending:
-        ledger.append(
-            artifact_renamed_event(
-                old_id=old_id,
-                new_id=new_id,
-                reason="semver_minor_sequence_migration",
+    with ledger.transaction() as txn:
+        for old_id, new_id in pending:
+            txn.append(
+                artifact_renamed_event(
+                    old_id=old_id,
+                    new_id=new_id,
+                    reason="semver_minor_sequence_migration",
+                )
             )
-        )
-        console.print(f"Renamed {old_id} -> {new_id}")
+            console.print(f"Renamed {old_id} -> {new_id}")
 
     console.print(
         f"\n[green]SemVer migration complete:[/green] {len(pending)} rename event(s) recorded."
@@ -384,16 +385,17 @@ def register_adrs(
             console.print(f"  Would append obpi_created: {obpi_id} (parent: {parent})")
         return
 
-    for adr_id, parent, adr_lane in to_register:
-        ledger.append(adr_created_event(adr_id, parent, adr_lane))
-        known_adrs.add(ledger.canonicalize_id(adr_id))
-        parent_display = parent or "(none)"
-        console.print(f"Registered ADR: {adr_id} (parent: {parent_display}, lane: {adr_lane})")
+    with ledger.transaction() as txn:
+        for adr_id, parent, adr_lane in to_register:
+            txn.append(adr_created_event(adr_id, parent, adr_lane))
+            known_adrs.add(ledger.canonicalize_id(adr_id))
+            parent_display = parent or "(none)"
+            console.print(f"Registered ADR: {adr_id} (parent: {parent_display}, lane: {adr_lane})")
 
-    for obpi_id, parent in to_register_obpis:
-        ledger.append(obpi_created_event(obpi_id, parent))
-        known_obpis.add(ledger.canonicalize_id(obpi_id))
-        console.print(f"Registered OBPI: {obpi_id} (parent: {parent})")
+        for obpi_id, parent in to_register_obpis:
+            txn.append(obpi_created_event(obpi_id, parent))
+            known_obpis.add(ledger.canonicalize_id(obpi_id))
+            console.print(f"Registered OBPI: {obpi_id} (parent: {parent})")
 
     console.print(
         f"\n[green]ADR registration complete:[/green] "
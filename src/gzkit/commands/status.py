@@ -1,10 +1,13 @@
 """Status command implementation."""
 
 import json
+import math
 import re
 from pathlib import Path
 from typing import Any, cast
 
+from gzkit import profiling
+from gzkit.cli.helpers.ndjson import emit_record, emit_summary
 from gzkit.commands.common import (
     GzCliError,
     _apply_pool_adr_status_overrides,
@@ -223,43 +226,119 @@ def _collect_adr_statuses(
     return adrs
 
 
+def _stream_adr_statuses(
+    project_root: Path,
+    config: GzkitConfig,
+    ledger: Ledger,
+    graph: dict[str, dict[str, Any]],
+) -> int:
+    """Emit ``obpi`` and ``adr`` NDJSON records as each ADR entry is built."""
+    obpi_index = _build_obpi_index(project_root, config, ledger)
+    adr_ids = sorted(
+        (adr_id for adr_id, info in graph.items() if info.get("type") == "adr"),
+        key=_adr_status_sort_key,
+    )
+    for adr_id in adr_ids:
+        entry = _build_adr_status_entry(
+            project_root, config, ledger, adr_id, graph[adr_id], obpi_index=obpi_index
+        )
+        for row in entry.pop("obpis", []):
+            emit_record("obpi", {"adr": adr_id, **row})
+        emit_record("adr", {"id": adr_id, **entry})
+    return len(adr_ids)
+
+
 # ---------------------------------------------------------------------------
 # Command entry points
 # ---------------------------------------------------------------------------
 
 
-def status(as_json: bool, show_gates: bool, as_table: bool) -> None:
+def status(
+    as_json: bool,
+    show_gates: bool,
+    as_table: bool,
+    watch: bool = False,
+    interval: float = 1.0,
+    as_ndjson: bool = False,
+) -> None:
     """Display OBPI progress, lifecycle, and gate readiness across ADRs."""
+    if not (math.isfinite(interval) and interval > 0):
+        msg = f"--interval must be a positive number of seconds (got {interval:g})."
+        raise GzCliError(msg)
+    if as_ndjson and watch:
+        msg = "--ndjson cannot be combined with --watch."
+        raise GzCliError(msg)
     config = ensure_initialized()
     project_root = get_project_root()
 
+    if as_ndjson:
+        ledger = Ledger(project_root / config.paths.ledger)
+        graph = ledger.get_artifact_graph()
+        with profiling.span("status.collect"):
+            count = _stream_adr_statuses(project_root, config, ledger, graph)
+        emit_summary(
+            {
+                "mode": config.mode,
+                "adrs": count,
+                "pending_attestations": ledger.get_pending_attestations(),
+            }
+        )
+        return
+
+    if watch:
+        # Late import: status_watch builds on this module's entry builders.
+        from gzkit.commands.status_watch import watch_status  # noqa: PLC0415
+
+        watch_status(
+            project_root,
+            config,
+            as_json=as_json,
+            show_gates=show_gates,
+            as_table=as_table,
+            interval=interval,
+        )
+        return
+
     ledger = Ledger(project_root / config.paths.ledger)
     pending = ledger.get_pending_attestations()
     graph = ledger.get_artifact_graph()
-    adrs = _collect_adr_statuses(project_root, config, ledger, graph)
+    with profiling.span("status.collect"):
+        adrs = _collect_adr_statuses(project_root, config, ledger, graph)
     adrs = dict(sorted(adrs.items(), key=lambda item: _adr_status_sort_key(item[0])))
 
+    with profiling.span("render"):
+        _render_status(adrs, pending, config.mode, as_json, show_gates, as_table)
+
+
+def _render_status(
+    adrs: dict[str, dict[str, Any]],
+    pending: list[str],
+    mode: str,
+    as_json: bool,
+    show_gates: bool,
+    as_table: bool,
+) -> None:
     if as_json:
         result = {
-            "mode": config.mode,
+            "mode": mode,
             "adrs": adrs,
             "pending_attestations": pending,
         }
         print(json.dumps(result, indent=2))  # noqa: T201
         return
 
-    console.print(f"[bold]Lane: {config.mode}[/bold]\n")
+    console.print(f"[bold]Lane: {mode}[/bold]\n")
 
     if not adrs:
         console.print("No ADRs found. Create one with 'gz plan'.")
         return
 
     if as_table:
-        _render_status_table(adrs, config.mode)
+        _render_status_table(adrs, mode)
         return
 
     for adr_id, info in adrs.items():
-        _render_status_row(adr_id, info, config.mode, show_gates)
+        _render_status_row(adr_id, info, mode, show_gates)
 
 
 def obpi_status_cmd(obpi: str, as_json: bool) -> None:
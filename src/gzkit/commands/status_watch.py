@@ -0,0 +1,326 @@
+"""Resident ``gz status --watch`` loop with incremental recomputation.
+
+The watcher keeps the ledger, the OBPI index and every ADR status entry in
+memory. Each cycle it tails the ledger from the last byte offset and stats
+the design-doc directories and markdown files it already knows about
+(listing only directories whose mtime moved), then rebuilds just the ADR
+entries those changes touch. On Linux an inotify descriptor wakes the loop
+as soon as something is written; elsewhere it sleeps for the poll interval.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from gzkit.commands.common import console
+from gzkit.commands.status import (
+    _adr_status_sort_key,
+    _build_adr_status_entry,
+    _render_status,
+)
+from gzkit.commands.status_obpi import _build_obpi_index
+from gzkit.config import GzkitConfig
+from gzkit.ledger import Ledger, LedgerEvent
+
+# Ledger events whose effect is not confined to the ids they name.
+_RESTRUCTURING_EVENTS = frozenset({"artifact_renamed", "project_init"})
+
+_Stamp = tuple[int, int]
+
+
+def _stamp(path: Path) -> _Stamp | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _Inotify:
+    """Minimal Linux inotify handle, used only to sleep until something changes."""
+
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    # | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    _MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400
+
+    def __init__(self, libc: Any, fd: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._watched: set[Path] = set()
+
+    @classmethod
+    def create(cls) -> _Inotify | None:
+        """Return an inotify handle, or ``None`` where inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Add watches for directories not watched yet (failures are ignored)."""
+        for directory in directories:
+            if directory not in self._watched:
+                self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+                self._watched.add(directory)
+
+    def wait(self, timeout: float) -> None:
+        """Block until an event arrives or *timeout* seconds pass, then drain."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self._fd, 65536):
+                pass
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        os.close(self._fd)
+
+
+class DesignTreeSnapshot:
+    """Stat stamps of the design-doc directories and the markdown files in them."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.dirs: dict[Path, _Stamp] = {}
+        self.files: dict[Path, _Stamp] = {}
+        if root.is_dir():
+            for directory, _dirnames, _filenames in os.walk(root):
+                self._scan_dir(Path(directory))
+
+    def _scan_dir(self, directory: Path) -> list[Path]:
+        stamp = _stamp(directory)
+        if stamp is None:
+            return []
+        self.dirs[directory] = stamp
+        children: list[Path] = []
+        with contextlib.suppress(OSError), os.scandir(directory) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    children.append(path)
+                elif entry.name.endswith(".md"):
+                    file_stamp = _stamp(path)
+                    if file_stamp is not None:
+                        self.files[path] = file_stamp
+        return children
+
+    def refresh(self) -> set[Path]:
+        """Re-stat known paths, list only changed directories; return changed paths."""
+        changed: set[Path] = set()
+        for path, stamp in list(self.files.items()):
+            current = _stamp(path)
+            if current != stamp:
+                changed.add(path)
+                if current is None:
+                    del self.files[path]
+                else:
+                    self.files[path] = current
+        pending = [d for d, stamp in self.dirs.items() if _stamp(d) != stamp]
+        while pending:
+            directory = pending.pop()
+            changed.add(directory)
+            before = {p for p in self.files if p.parent == directory}
+            before_dirs = {d for d in self.dirs if d.parent == directory}
+            self.dirs.pop(directory, None)
+            for path in before:
+                self.files.pop(path, None)
+            subdirs = self._scan_dir(directory)
+            after = {p for p in self.files if p.parent == directory}
+            changed.update(before ^ after)
+            for gone in before_dirs - set(subdirs):
+                changed.add(gone)
+                self._forget(gone)
+            pending.extend(d for d in subdirs if d not in self.dirs)
+        return changed
+
+    def _forget(self, directory: Path) -> None:
+        for path in [p for p in self.files if p.is_relative_to(directory)]:
+            del self.files[path]
+        for path in [d for d in self.dirs if d.is_relative_to(directory)]:
+            del self.dirs[path]
+
+
+class StatusWatcher:
+    """Resident ``gz status`` state, recomputed per ADR as inputs change."""
+
+    def __init__(self, project_root: Path, config: GzkitConfig) -> None:
+        self.project_root = project_root
+        self.config = config
+        self.ledger = Ledger(project_root / config.paths.ledger)
+        self.design = DesignTreeSnapshot(project_root / config.paths.design_root / "adr")
+        self.adrs: dict[str, dict[str, Any]] = {}
+        self.pending: list[str] = []
+        self._obpi_index: list[tuple[str, str, Path]] = []
+        self._path_owner: dict[Path, str] = {}
+        self._rebuild_all()
+
+    def _rebuild_index(self) -> None:
+        self._obpi_index = _build_obpi_index(self.project_root, self.config, self.ledger)
+        self._path_owner = {path: parent for _id, parent, path in self._obpi_index if parent}
+
+    def _obpi_groups(self) -> dict[str, set[Path]]:
+        groups: dict[str, set[Path]] = {}
+        for _obpi_id, parent, path in self._obpi_index:
+            groups.setdefault(parent, set()).add(path)
+        return groups
+
+    def _rebuild_all(self) -> None:
+        self.ledger.read_all()
+        self._rebuild_index()
+        graph = self.ledger.get_artifact_graph()
+        self.adrs = {}
+        self._recompute({adr_id for adr_id, info in graph.items() if info.get("type") == "adr"})
+
+    def _recompute(self, adr_ids: set[str]) -> None:
+        graph = self.ledger.get_artifact_graph()
+        for adr_id in adr_ids:
+            info = graph.get(adr_id)
+            if info is None or info.get("type") != "adr":
+                self.adrs.pop(adr_id, None)
+                continue
+            self.adrs[adr_id] = _build_adr_status_entry(
+                self.project_root, self.config, self.ledger, adr_id, info, self._obpi_index
+            )
+        self.adrs = dict(sorted(self.adrs.items(), key=lambda item: _adr_status_sort_key(item[0])))
+        self.pending = self.ledger.get_pending_attestations()
+
+    def _owning_adr(self, artifact_id: object, graph: dict[str, dict[str, Any]]) -> str | None:
+        if not isinstance(artifact_id, str) or not artifact_id:
+            return None
+        canonical = self.ledger.canonicalize_id(artifact_id)
+        info = graph.get(canonical, {})
+        if info.get("type") == "adr":
+            return canonical
+        parent = info.get("parent")
+        if info.get("type") == "obpi" and isinstance(parent, str) and parent:
+            return self.ledger.canonicalize_id(parent)
+        return None
+
+    def _adrs_for_events(self, events: list[LedgerEvent]) -> set[str]:
+        graph = self.ledger.get_artifact_graph()
+        affected: set[str] = set()
+        for event in events:
+            candidates = (
+                event.id,
+                event.parent,
+                event.extra.get("adr_id"),
+                event.extra.get("parent_adr"),
+                event.extra.get("obpi_id"),
+            )
+            affected.update(
+                owner for owner in (self._owning_adr(c, graph) for c in candidates) if owner
+            )
+        return affected
+
+    def _adrs_for_paths(self, paths: set[Path]) -> set[str]:
+        affected = {self._path_owner[p] for p in paths if p in self._path_owner}
+        unknown = {p for p in paths if p not in self._path_owner}
+        if unknown:
+            # New, removed or moved docs (or an ADR doc): rescan and diff OBPI groups.
+            before = self._obpi_groups()
+            self._rebuild_index()
+            after = self._obpi_groups()
+            affected.update(
+                a for a in before.keys() | after.keys() if before.get(a) != after.get(a)
+            )
+            graph = self.ledger.get_artifact_graph()
+            affected.update(
+                owner for owner in (self._owning_adr(p.stem, graph) for p in unknown) if owner
+            )
+        return affected
+
+    def poll(self) -> set[str] | None:
+        """Apply ledger and design-doc changes since the last poll.
+
+        Returns the ADR ids whose entries were recomputed, or ``None`` after
+        a full rebuild (ledger rewritten, artifact renamed, ...).
+        """
+        events = self.ledger.read_new()
+        if events is None or any(e.event in _RESTRUCTURING_EVENTS for e in events):
+            self.design = DesignTreeSnapshot(self.design.root)
+            self._rebuild_all()
+            return None
+        known = set(self.adrs)
+        affected = self._adrs_for_events(events)
+        changed_paths = self.design.refresh()
+        if changed_paths:
+            affected |= self._adrs_for_paths(changed_paths)
+        if events:
+            graph = self.ledger.get_artifact_graph()
+            current = {adr_id for adr_id, info in graph.items() if info.get("type") == "adr"}
+            affected |= current ^ known
+        if affected or events:
+            self._recompute(affected)
+        return affected
+
+    def directories(self) -> list[Path]:
+        """Directories to watch: the ledger's and every design-doc directory."""
+        return [self.ledger.path.parent, *self.design.dirs]
+
+
+def _wait_cycles(watcher: StatusWatcher, interval: float) -> Iterator[None]:
+    inotify = _Inotify.create()
+    try:
+        while True:
+            if inotify is None:
+                time.sleep(interval)
+            else:
+                inotify.watch(watcher.directories())
+                inotify.wait(interval)
+            yield
+    finally:
+        if inotify is not None:
+            inotify.close()
+
+
+def watch_status(
+    project_root: Path,
+    config: GzkitConfig,
+    *,
+    as_json: bool,
+    show_gates: bool,
+    as_table: bool,
+    interval: float = 1.0,
+    max_updates: int | None = None,
+) -> None:
+    """Render status, then redraw it whenever the ledger or design docs change.
+
+    Runs until interrupted (or after *max_updates* redraws, for tests).
+    """
+    watcher = StatusWatcher(project_root, config)
+    updates = 0
+
+    def draw(note: str) -> None:
+        if not as_json:
+            console.clear()
+        _render_status(watcher.adrs, watcher.pending, config.mode, as_json, show_gates, as_table)
+        if not as_json:
+            console.print(f"\n[dim]{note} — watching for changes (Ctrl-C to stop)[/dim]")
+
+    draw(f"{len(watcher.adrs)} ADR(s)")
+    with contextlib.suppress(KeyboardInterrupt):
+        for _ in _wait_cycles(watcher, interval):
+            affected = watcher.poll()
+            if affected is None:
+                draw("Rebuilt all ADRs")
+            elif affected:
+                draw(f"Updated {', '.join(sorted(affected, key=_adr_status_sort_key))}")
+            else:
+                continue
+            updates += 1
+            if max_updates is not None and updates >= max_updates:
+                return
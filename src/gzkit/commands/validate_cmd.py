@@ -6,6 +6,8 @@ import subprocess
 from collections.abc import Callable
 from pathlib import Path
 
+from gzkit import profiling
+from gzkit.cli.helpers.ndjson import emit_record, emit_summary
 from gzkit.commands.common import console, get_project_root
 from gzkit.commands.validate_frontmatter import (
     _render_frontmatter_explain,
@@ -259,6 +261,16 @@ def _validate_decomposition(project_root: Path) -> list[ValidationError]:
     return errors
 
 
+ScopeCallback = Callable[[str, list[ValidationError]], None]
+
+
+def _emit_scope_ndjson(scope: str, errors: list[ValidationError]) -> None:
+    """Stream one finished scope: its errors, then a ``scope`` record."""
+    for error in errors:
+        emit_record("error", {"scope": scope, **error.model_dump(exclude_none=True)})
+    emit_record("scope", {"scope": scope, "errors": len(errors)})
+
+
 def _collect_errors(
     project_root: Path,
     check_manifest: bool,
@@ -289,6 +301,7 @@ def _collect_errors(
     check_advisory_scorecard: bool = False,
     check_reconcile_freshness: bool = False,
     frontmatter_adr: str | None = None,
+    on_scope: ScopeCallback | None = None,
 ) -> list[ValidationError]:
     """Collect validation errors across all requested check types."""
     # Scopes included in "run_all" (no flags = run these)
@@ -327,7 +340,12 @@ def _collect_errors(
     run_all = not any(default_scopes.values()) and not any(explicit_scopes.values())
 
     return _run_scope_checks(
-        project_root, default_scopes, explicit_scopes, run_all, frontmatter_adr=frontmatter_adr
+        project_root,
+        default_scopes,
+        explicit_scopes,
+        run_all,
+        frontmatter_adr=frontmatter_adr,
+        on_scope=on_scope,
     )
 
 
@@ -389,18 +407,28 @@ def _run_scope_checks(
     explicit_scopes: dict[str, bool],
     run_all: bool,
     frontmatter_adr: str | None = None,
+    on_scope: ScopeCallback | None = None,
 ) -> list[ValidationError]:
-    """Dispatch validation checks based on active scopes."""
+    """Dispatch validation checks based on active scopes.
+
+    ``on_scope`` is called with each scope's errors as soon as it finishes.
+    """
     errors: list[ValidationError] = []
     default_runners = _default_scope_runners(project_root, frontmatter_adr)
     explicit_runners = _explicit_scope_runners(project_root)
 
-    for scope, runner in default_runners.items():
-        if run_all and scope in default_scopes or default_scopes.get(scope, False):
-            errors.extend(runner())
-    for scope, runner in explicit_runners.items():
-        if explicit_scopes.get(scope):
-            errors.extend(runner())
+    selected = [
+        (scope, runner)
+        for scope, runner in default_runners.items()
+        if run_all and scope in default_scopes or default_scopes.get(scope, False)
+    ]
+    selected += [(s, r) for s, r in explicit_runners.items() if explicit_scopes.get(s)]
+    for scope, runner in selected:
+        with profiling.span(f"validate.{scope}"):
+            scope_errors = runner()
+        errors.extend(scope_errors)
+        if on_scope is not None:
+            on_scope(scope, scope_errors)
     return errors
 
 
@@ -540,6 +568,7 @@ def validate(
     as_json: bool = False,
     frontmatter_adr: str | None = None,
     frontmatter_explain: str | None = None,
+    as_ndjson: bool = False,
 ) -> None:
     """Validate governance artifacts against schemas.
 
@@ -584,8 +613,13 @@ def validate(
         check_advisory_scorecard=check_advisory_scorecard,
         check_reconcile_freshness=check_reconcile_freshness,
         frontmatter_adr=frontmatter_adr,
+        on_scope=_emit_scope_ndjson if as_ndjson else None,
     )
 
+    if as_ndjson:
+        emit_summary({"valid": not errors, "errors": len(errors)})
+        return
+
     if as_json:
         payload: dict[str, object] = {
             "valid": len(errors) == 0,
@@ -602,7 +636,8 @@ def validate(
                 for e in errors
                 if e.type == "frontmatter"
             ]
-        print(json.dumps(payload, indent=2))  # noqa: T201
+        with profiling.span("render"):
+            print(json.dumps(payload, indent=2))  # noqa: T201
         return
 
     checks = {
@@ -643,4 +678,5 @@ def validate(
             raise SystemExit(3)
         return
 
-    _print_validation_result(errors, scopes, frontmatter_only=frontmatter_only)
+    with profiling.span("render"):
+        _print_validation_result(errors, scopes, frontmatter_only=frontmatter_only)
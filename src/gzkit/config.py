@@ -115,6 +115,20 @@ class ArbConfig(BaseModel):
     )
 
 
+class SkillsConfig(BaseModel):
+    """Skill mirror materialization settings."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    mirror_mode: Literal["copy", "hardlink", "reflink"] = Field(
+        default="copy",
+        description=(
+            "How vendor skill mirrors are materialized: byte copies, hardlinks to the "
+            "canonical files, or copy-on-write reflinks. Link modes fall back to copy."
+        ),
+    )
+
+
 class GzkitConfig(BaseModel):
     """Root configuration for a gzkit-enabled project."""
 
@@ -124,6 +138,7 @@ class GzkitConfig(BaseModel):
     paths: PathConfig = Field(default_factory=PathConfig)
     vendors: VendorsConfig = Field(default_factory=VendorsConfig)
     arb: ArbConfig = Field(default_factory=ArbConfig)
+    skills: SkillsConfig = Field(default_factory=SkillsConfig)
     project_name: str = ""
 
     @classmethod
@@ -166,6 +181,7 @@ class GzkitConfig(BaseModel):
                 "paths": paths_data,
                 "vendors": vendors_data,
                 "arb": arb_data,
+                "skills": data.get("skills", {}),
                 "project_name": data.get("project_name", ""),
             }
         )
@@ -183,6 +199,8 @@ class GzkitConfig(BaseModel):
 
         if not self.project_name:
             data.pop("project_name", None)
+        if self.skills == SkillsConfig():
+            data.pop("skills", None)
 
         with config_path.open("w") as f:
             json.dump(data, f, indent=2)
@@ -11,6 +11,8 @@ from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from gzkit.schemas import load_schema_file
+
 KNOWN_SURFACES: list[str] = [
     "instruction_eval",
     "adr_eval",
@@ -58,9 +60,8 @@ _VALID_CASE_TYPES = {"golden_path", "edge_case"}
 
 
 def _load_schema(schema_path: Path) -> dict[str, object]:
-    """Load the eval dataset JSON schema."""
-    result: dict[str, object] = json.loads(schema_path.read_text(encoding="utf-8"))
-    return result
+    """Load the eval dataset JSON schema (parsed once per process)."""
+    return load_schema_file(schema_path)
 
 
 class DatasetValidationError(ValueError):
@@ -2,17 +2,36 @@
 
 Orchestrates the eval pipeline: load dataset → score each case → aggregate
 dimension scores → return typed results compatible with QualityResult.
+
+Case results are content-addressed: each is keyed by a hash of the surface,
+the case fixture, ``SCORER_VERSION`` and the source of the scoring modules, so
+a rerun over unchanged fixtures and scorers is only cache lookups. Cases that
+miss are scored across a process pool (all suites at once) and reassembled in
+dataset order, so results do not depend on scheduling.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from gzkit.cache import read_json_cache, write_json_cache
+from gzkit.eval import scorer
 from gzkit.eval.datasets import EvalDataset, EvalDatasetCase, load_all_datasets, load_dataset
-from gzkit.eval.scorer import CaseScore, score_case
+from gzkit.eval.scorer import SCORER_VERSION, CaseScore, score_case
+
+CASE_CACHE_SCHEMA = "gzkit.eval.case_results.v1"
+
+# Below this many uncached cases, process start-up costs more than it saves.
+PARALLEL_MIN_CASES = 32
 
 # ---------------------------------------------------------------------------
 # Result models
@@ -68,16 +87,81 @@ def _evaluate_case(surface: str, case: EvalDatasetCase) -> CaseScore:
     )
 
 
+def _evaluate_task(task: tuple[str, EvalDatasetCase]) -> CaseScore:
+    """Process-pool entry point for :func:`_evaluate_case`."""
+    return _evaluate_case(*task)
+
+
+@cache
+def _source_digest() -> str:
+    """Hash the modules whose code decides a case result."""
+    digest = hashlib.sha256()
+    for path in sorted({Path(scorer.__file__), Path(__file__)}):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def case_cache_key(surface: str, case: EvalDatasetCase) -> str:
+    """Content address of one case result."""
+    material = json.dumps(
+        [surface, case.model_dump(mode="json"), SCORER_VERSION, _source_digest()],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _score_tasks(
+    tasks: list[tuple[str, EvalDatasetCase]], max_workers: int | None
+) -> list[CaseScore]:
+    """Score *tasks*, in order, on a process pool when it is worth it."""
+    workers = max_workers if max_workers is not None else min(os.cpu_count() or 1, 8)
+    if workers > 1 and len(tasks) >= PARALLEL_MIN_CASES:
+        chunk = max(1, len(tasks) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_evaluate_task, tasks, chunksize=chunk))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No usable process pool here (sandbox, frozen app): score inline.
+    return [_evaluate_task(task) for task in tasks]
+
+
+def _score_datasets(
+    datasets: list[EvalDataset], cache_path: Path | None, max_workers: int | None
+) -> list[list[CaseScore]]:
+    """Score every case of every dataset, reusing cached results by content key."""
+    cached = (read_json_cache(cache_path, CASE_CACHE_SCHEMA) or {}) if cache_path else {}
+    keys = [[case_cache_key(ds.surface, case) for case in ds.cases] for ds in datasets]
+
+    results: dict[str, CaseScore] = {}
+    for key in {k for surface_keys in keys for k in surface_keys}:
+        try:
+            results[key] = CaseScore.model_validate(cached[key])
+        except (KeyError, ValidationError):
+            continue
+
+    misses: dict[str, tuple[str, EvalDatasetCase]] = {}
+    for ds, surface_keys in zip(datasets, keys, strict=True):
+        for case, key in zip(ds.cases, surface_keys, strict=True):
+            if key not in results:
+                misses.setdefault(key, (ds.surface, case))
+    if misses:
+        scored = _score_tasks(list(misses.values()), max_workers)
+        results.update(zip(misses, scored, strict=True))
+        if cache_path is not None:
+            payload = {key: score.model_dump(mode="json") for key, score in results.items()}
+            write_json_cache(cache_path, CASE_CACHE_SCHEMA, dict(sorted(payload.items())))
+
+    return [[results[key] for key in surface_keys] for surface_keys in keys]
+
+
 # ---------------------------------------------------------------------------
 # Surface evaluation
 # ---------------------------------------------------------------------------
 
 
-def _evaluate_surface(dataset: EvalDataset) -> SurfaceScore:
-    """Score all cases for one surface."""
-    case_scores: list[CaseScore] = []
-    for case in dataset.cases:
-        case_scores.append(_evaluate_case(dataset.surface, case))
+def _evaluate_surface(dataset: EvalDataset, case_scores: list[CaseScore]) -> SurfaceScore:
+    """Aggregate the scored cases of one surface."""
 
     # Aggregate dimension averages across cases
     dim_totals: dict[str, list[float]] = {}
@@ -110,6 +194,8 @@ def run_eval_suite(
     surfaces: list[str] | None = None,
     *,
     data_dir: Path,
+    cache_path: Path | None = None,
+    max_workers: int | None = None,
 ) -> EvalSuiteScore:
     """Run the full eval suite across all (or specified) surfaces.
 
@@ -119,6 +205,9 @@ def run_eval_suite(
     Args:
         surfaces: Surface names to evaluate. Defaults to all available datasets.
         data_dir: Directory containing eval dataset JSON files.
+        cache_path: Case-result cache file; ``None`` scores every case afresh.
+        max_workers: Scoring processes (``1`` scores inline). Defaults to the
+            CPU count, capped at 8.
 
     Returns:
         EvalSuiteScore with per-surface and per-case results.
@@ -130,9 +219,10 @@ def run_eval_suite(
         else load_all_datasets(data_dir=data_dir)
     )
 
-    surface_scores: list[SurfaceScore] = []
-    for ds in datasets:
-        surface_scores.append(_evaluate_surface(ds))
+    scored = _score_datasets(datasets, cache_path, max_workers)
+    surface_scores = [
+        _evaluate_surface(ds, case_scores) for ds, case_scores in zip(datasets, scored, strict=True)
+    ]
 
     all_overalls = [ss.overall for ss in surface_scores]
     grand_mean = round(statistics.mean(all_overalls), 2) if all_overalls else 0.0
@@ -9,6 +9,11 @@ import re
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Bump when scoring semantics change in a way the source digest cannot see
+# (e.g. a scorer delegating to code outside this module). Part of every cached
+# case-result key in ``gzkit.eval.runner``.
+SCORER_VERSION = "1"
+
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
@@ -383,10 +383,9 @@ def _write_receipt(
 
 def _schema_validate(payload: dict) -> None:
     """Validate the receipt payload against the JSON schema before writing."""
-    import jsonschema  # noqa: PLC0415
+    from gzkit.schemas import schema_file_validator  # noqa: PLC0415
 
-    schema = json.loads(_schema_path().read_text(encoding="utf-8"))
-    jsonschema.validate(instance=payload, schema=schema)
+    schema_file_validator(_schema_path()).validate(payload)
 
 
 def _schema_path() -> Path:
@@ -4,7 +4,9 @@ Enforces scope, evidence, and git-sync readiness requirements for OBPI
 completion transitions.
 """
 
+import functools
 import re
+from collections.abc import Callable, Iterable
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, cast
@@ -121,18 +123,47 @@ def verify_gz_chain(verbs: list[str]) -> tuple[bool, str]:
     return True, f"resolved 'gz {' '.join(walked)}'"
 
 
+@functools.lru_cache(maxsize=256)
+def _section_index(content: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Map every H2 and H3 heading to the raw body of its first occurrence.
+
+    One pass over the lines. An H2 body runs to the next ``## `` line, an
+    H3 body to the next ``### `` line; a line starting with ``---`` ends
+    both.
+    """
+    lines = content.split("\n")
+    index: tuple[dict[str, str], dict[str, str]] = ({}, {})
+    open_at: list[tuple[str, int] | None] = [None, None]
+
+    def close(level: int, end: int) -> None:
+        section = open_at[level]
+        if section is not None:
+            heading, start = section
+            index[level][heading] = "\n".join(lines[start + 1 : end])
+            open_at[level] = None
+
+    for i, line in enumerate(lines):
+        if line.startswith("---"):
+            close(0, i)
+            close(1, i)
+            continue
+        for level, marker in enumerate(("## ", "### ")):
+            if line.startswith(marker):
+                close(level, i)
+                heading = line[len(marker) :].rstrip()
+                if heading not in index[level]:
+                    open_at[level] = (heading, i)
+    close(0, len(lines))
+    close(1, len(lines))
+    return index
+
+
 def section_body(content: str, heading: str) -> str | None:
     """Return the body of an H2/H3 section when present."""
-    for marker in ("##", "###"):
-        pattern = (
-            rf"^{re.escape(marker)} {re.escape(heading)}\s*$"
-            rf"([\s\S]*?)(?:^{marker} |\n---|\Z)"
-        )
-        match = re.search(pattern, content, flags=re.MULTILINE)
-        if match:
-            body = match.group(1).strip()
-            if body:
-                return body
+    for level in _section_index(content):
+        body = level.get(heading)
+        if body is not None and body.strip():
+            return body.strip()
     return None
 
 
@@ -278,6 +309,18 @@ def normalize_git_sync_state(raw_state: Any) -> dict[str, Any] | None:
     return normalized
 
 
+class _RepoSnapshot:
+    """Repository state computed at most once and shared by a validation batch."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, Any] = {}
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]
+
+
 class ObpiValidator:
     """Validates OBPI brief content against governance requirements."""
 
@@ -286,6 +329,42 @@ class ObpiValidator:
         self.project_root = project_root
         self.config = GzkitConfig.load(project_root / ".gzkit.json")
         self.ledger = Ledger(project_root / self.config.paths.ledger)
+        self._snapshot: _RepoSnapshot | None = None
+
+    def validate_files(
+        self, obpi_paths: Iterable[Path], *, require_authored: bool = False
+    ) -> dict[Path, list[str]]:
+        """Validate many OBPI files against one shared snapshot of repository state.
+
+        The changed-file set and git-sync readiness are computed at most once
+        for the whole batch instead of once per brief, and the ledger graph is
+        loaded up front. Returns error lists keyed by path, in input order.
+        """
+        paths = list(obpi_paths)
+        self.ledger.get_artifact_graph()
+        self._snapshot = _RepoSnapshot()
+        try:
+            return {
+                path: self.validate_file(path, require_authored=require_authored) for path in paths
+            }
+        finally:
+            self._snapshot = None
+
+    def _changed_files(self) -> list[str]:
+        """Return the changed-file set, shared across a batch when one is running."""
+        if self._snapshot is None:
+            return collect_changed_files(self.project_root)
+        return self._snapshot.get("changed_files", lambda: collect_changed_files(self.project_root))
+
+    def _git_sync_blockers(self) -> list[str]:
+        """Return git-sync readiness blockers, shared across a batch when one is running."""
+
+        def compute() -> list[str]:
+            return cast(list[str], assess_git_sync_readiness(self.project_root)["blockers"])
+
+        if self._snapshot is None:
+            return compute()
+        return self._snapshot.get("git_sync_blockers", compute)
 
     def validate_file(self, obpi_path: Path, *, require_authored: bool = False) -> list[str]:
         """Validate an OBPI file for completion readiness.
@@ -344,12 +423,11 @@ class ObpiValidator:
                 scope_audit = normalize_scope_audit(completion_evidence.get("scope_audit"))
                 changed_files = scope_audit.get("changed_files", []) if scope_audit else []
             else:
-                changed_files = collect_changed_files(self.project_root)
+                changed_files = self._changed_files()
             errors.extend(self._validate_changed_files(changed_files, allowlist))
 
         if not ledger_completed:
-            readiness = assess_git_sync_readiness(self.project_root)
-            errors.extend(cast(list[str], readiness["blockers"]))
+            errors.extend(self._git_sync_blockers())
 
         # 2. Check for Substantive Implementation Summary
         if not self._has_substantive_summary(content):
@@ -526,15 +604,10 @@ class ObpiValidator:
 
     def _has_substantive_summary(self, content: str) -> bool:
         """Check for substantive bullets in the Implementation Summary."""
-        match = re.search(
-            r"^### Implementation Summary\s*$([\s\S]*?)(?:^### |\n---|\Z)",
-            content,
-            flags=re.MULTILINE,
-        )
-        if not match:
+        section = _section_index(content)[1].get("Implementation Summary")
+        if section is None:
             return False
 
-        section = match.group(1)
         bullets = re.findall(r"^- [^:\n]+:[ \t]*(.+)$", section, flags=re.MULTILINE)
         if not bullets:
             bullets = re.findall(r"^- \s*(.+)$", section, flags=re.MULTILINE)
@@ -72,7 +72,9 @@ def _pipeline_completion_reminder_script() -> str:
                 if not obpi_id:
                     sys.exit(0)
 
-                brief_path = find_obpi_brief(project_root / "docs" / "design" / "adr", obpi_id)
+                brief_path = find_obpi_brief(
+                    project_root / "docs" / "design" / "adr", obpi_id, project_root=project_root
+                )
                 if brief_path is None:
                     sys.exit(0)
 
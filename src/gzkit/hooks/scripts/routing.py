@@ -425,7 +425,7 @@ def _pipeline_gate_script() -> str:
 
                 # GHI-127: Skip gate if the OBPI brief is already Completed (stale receipt).
                 docs_root = project_root / "docs"
-                brief_path = find_obpi_brief(docs_root, obpi_id)
+                brief_path = find_obpi_brief(docs_root, obpi_id, project_root=project_root)
                 if brief_path is not None:
                     brief_status = extract_brief_status(brief_path)
                     if brief_status and brief_status.lower() == "completed":
@@ -5,6 +5,7 @@ content drift between canonical instructions and generated rules,
 and policy-vs-code mismatches.
 """
 
+import os
 import re
 from pathlib import Path
 
@@ -23,15 +24,105 @@ _FOREIGN_INDICATORS = {"airlineops", "opsdev"}
 _FOREIGN_PATTERN = re.compile(r"\b(airlineops|opsdev)\b")
 _GENERATED_COMMENT_RE = re.compile(r"^<!--\s*Generated by gz agent sync[^>]*-->\n?")
 
+# Directories never targeted by applyTo globs; pruned from the reachability walk.
+_REACHABILITY_PRUNED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
 
 # ---------------------------------------------------------------------------
 # REQ-04-01: Instruction reachability
 # ---------------------------------------------------------------------------
 
 
+def _glob_segment_regex(segment: str) -> str:
+    """Translate one glob path segment; wildcards never cross ``/``."""
+    out: list[str] = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and "]" in segment[i + 2 :]:
+            end = segment.index("]", i + 2)
+            body = segment[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a ``Path.glob`` pattern into a regex over ``/``-prefixed relative paths.
+
+    A middle ``**`` spans zero or more directories; a trailing ``**`` matches
+    the directory itself and everything below it, as ``Path.glob`` does.
+    """
+    segments = [seg for seg in pattern.strip("/").split("/") if seg and seg != "."]
+    parts: list[str] = []
+    for index, segment in enumerate(segments):
+        if segment == "**":
+            parts.append("(?:/.*)?" if index == len(segments) - 1 else "(?:/[^/]+)*")
+        else:
+            parts.append("/" + _glob_segment_regex(segment))
+    return "".join(parts)
+
+
+def _unmatched_patterns(project_root: Path, patterns: list[str]) -> set[str]:
+    """Return the subset of *patterns* that match no path under *project_root*.
+
+    Walks the tree once, pruning ``_REACHABILITY_PRUNED_DIRS``. Every path is
+    tested against a single compiled alternation of the still-pending
+    patterns; a pattern leaves the pending set on its first hit and the walk
+    stops as soon as nothing is pending.
+    """
+    pending = {pattern: re.compile(_glob_regex(pattern)) for pattern in dict.fromkeys(patterns)}
+
+    def _combined() -> re.Pattern[str] | None:
+        if not pending:
+            return None
+        return re.compile("|".join(f"(?:{rx.pattern})" for rx in pending.values()))
+
+    combined = _combined()
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        if combined is None:
+            break
+        dirnames[:] = [name for name in dirnames if name not in _REACHABILITY_PRUNED_DIRS]
+        rel_dir = Path(dirpath).relative_to(project_root).as_posix()
+        prefix = "" if rel_dir == "." else f"/{rel_dir}"
+        for name in (*dirnames, *filenames):
+            candidate = f"{prefix}/{name}"
+            if combined is None or not combined.fullmatch(candidate):
+                continue
+            for pattern in [p for p, rx in pending.items() if rx.fullmatch(candidate)]:
+                del pending[pattern]
+            combined = _combined()
+    return set(pending)
+
+
 def audit_instruction_reachability(project_root: Path) -> list[ValidationError]:
     """Check that every applyTo glob pattern matches at least one file.
 
+    Patterns from all instruction files are checked in one pruned walk of the
+    project tree (see ``_unmatched_patterns``) instead of one glob per pattern.
+
     Args:
         project_root: Project root directory.
 
@@ -44,6 +135,7 @@ def audit_instruction_reachability(project_root: Path) -> list[ValidationError]:
     if not instructions_dir.exists():
         return errors
 
+    checks: list[tuple[str, str]] = []
     for src_file in sorted(instructions_dir.iterdir()):
         if not src_file.name.endswith(".instructions.md"):
             continue
@@ -55,21 +147,26 @@ def audit_instruction_reachability(project_root: Path) -> list[ValidationError]:
         if not apply_to:
             continue
 
-        patterns = _convert_apply_to_paths(apply_to)
-        for pattern in patterns:
+        for pattern in _convert_apply_to_paths(apply_to):
             # Global patterns like **/* always match conceptually
             if pattern.startswith("**"):
                 continue
-            matches = list(project_root.glob(pattern))
-            if not matches:
-                errors.append(
-                    ValidationError(
-                        type="instruction",
-                        artifact=src_file.name,
-                        message=f"applyTo pattern '{pattern}' matches zero files",
-                        field="applyTo",
-                    )
+            checks.append((src_file.name, pattern))
+
+    if not checks:
+        return errors
+
+    unmatched = _unmatched_patterns(project_root, [pattern for _, pattern in checks])
+    for artifact, pattern in checks:
+        if pattern in unmatched:
+            errors.append(
+                ValidationError(
+                    type="instruction",
+                    artifact=artifact,
+                    message=f"applyTo pattern '{pattern}' matches zero files",
+                    field="applyTo",
                 )
+            )
 
     return errors
 
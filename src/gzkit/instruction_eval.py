@@ -4,8 +4,15 @@ Provides a 10-prompt baseline eval suite that exercises agent instruction
 surfaces across four readiness dimensions (outcome, process, style,
 efficiency) with both positive and negative controls for Codex loading,
 Claude loading, workflow relocation, and drift detection.
+
+Several cases consume the same repo-walking instruction audits. The runner
+builds one :class:`EvalAuditContext` per run that computes each audit at
+most once, running the audits the selected cases need concurrently.
 """
 
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -15,6 +22,7 @@ from gzkit.instruction_audit import (
     audit_generated_surface_drift,
     audit_instruction_reachability,
 )
+from gzkit.validate import ValidationError
 
 # ---------------------------------------------------------------------------
 # Models
@@ -178,12 +186,60 @@ BASELINE_CASES: list[EvalCase] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Shared audit context
+# ---------------------------------------------------------------------------
+
+_AUDITS: dict[str, Callable[[Path], list[ValidationError]]] = {
+    "reachability": audit_instruction_reachability,
+    "foreign": audit_foreign_references,
+    "surface_drift": audit_generated_surface_drift,
+}
+
+
+class EvalAuditContext:
+    """Per-run memo of the instruction audits shared across eval cases."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self._results: dict[str, list[ValidationError]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Compute the named audits not computed yet, concurrently."""
+        with self._lock:
+            missing = sorted({n for n in names if n not in self._results})
+        if len(missing) <= 1:
+            for name in missing:
+                self.get(name)
+            return
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            computed = dict(
+                zip(
+                    missing, pool.map(lambda n: _AUDITS[n](self.project_root), missing), strict=True
+                )
+            )
+        with self._lock:
+            for name, errors in computed.items():
+                self._results.setdefault(name, errors)
+
+    def get(self, name: str) -> list[ValidationError]:
+        """Return the result of audit *name*, computing it on first use."""
+        with self._lock:
+            cached = self._results.get(name)
+        if cached is not None:
+            return cached
+        errors = _AUDITS[name](self.project_root)
+        with self._lock:
+            return self._results.setdefault(name, errors)
+
+
 # ---------------------------------------------------------------------------
 # Check functions (one per eval case)
 # ---------------------------------------------------------------------------
 
 
-def _check_codex_load_positive(project_root: Path) -> EvalResult:
+def _check_codex_load_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     agents = project_root / "AGENTS.md"
     if not agents.is_file():
         return EvalResult(case_id="codex-load-positive", passed=False, detail="AGENTS.md not found")
@@ -199,7 +255,7 @@ def _check_codex_load_positive(project_root: Path) -> EvalResult:
     )
 
 
-def _check_codex_load_negative(project_root: Path) -> EvalResult:
+def _check_codex_load_negative(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     instructions_dir = project_root / ".github" / "instructions"
     if not instructions_dir.exists():
         return EvalResult(
@@ -236,7 +292,7 @@ def _check_codex_load_negative(project_root: Path) -> EvalResult:
     )
 
 
-def _check_claude_load_positive(project_root: Path) -> EvalResult:
+def _check_claude_load_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     rules_dir = project_root / ".claude" / "rules"
     if not rules_dir.is_dir():
         return EvalResult(
@@ -254,8 +310,8 @@ def _check_claude_load_positive(project_root: Path) -> EvalResult:
     )
 
 
-def _check_claude_load_negative(project_root: Path) -> EvalResult:
-    errors = audit_generated_surface_drift(project_root)
+def _check_claude_load_negative(project_root: Path, audits: EvalAuditContext) -> EvalResult:
+    errors = audits.get("surface_drift")
     orphans = [e for e in errors if "Orphan" in e.message]
     if orphans:
         return EvalResult(
@@ -272,7 +328,7 @@ def _check_claude_load_negative(project_root: Path) -> EvalResult:
     )
 
 
-def _check_workflow_relocation_positive(project_root: Path) -> EvalResult:
+def _check_workflow_relocation_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     skills_dir = project_root / ".gzkit" / "skills"
     if not skills_dir.is_dir():
         return EvalResult(
@@ -294,7 +350,7 @@ def _check_workflow_relocation_positive(project_root: Path) -> EvalResult:
     )
 
 
-def _check_workflow_relocation_negative(project_root: Path) -> EvalResult:
+def _check_workflow_relocation_negative(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     # Only root-level skills/ is legacy; .github/skills/ is a valid Copilot mirror
     legacy_locations = [
         project_root / "skills",
@@ -313,7 +369,7 @@ def _check_workflow_relocation_negative(project_root: Path) -> EvalResult:
     )
 
 
-def _check_workflow_docs_positive(project_root: Path) -> EvalResult:
+def _check_workflow_docs_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
     index = project_root / "docs" / "user" / "commands" / "index.md"
     if not index.is_file():
         return EvalResult(
@@ -337,8 +393,8 @@ def _check_workflow_docs_positive(project_root: Path) -> EvalResult:
     )
 
 
-def _check_drift_reachability_positive(project_root: Path) -> EvalResult:
-    errors = audit_instruction_reachability(project_root)
+def _check_drift_reachability_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
+    errors = audits.get("reachability")
     if errors:
         return EvalResult(
             case_id="drift-reachability-positive",
@@ -352,8 +408,8 @@ def _check_drift_reachability_positive(project_root: Path) -> EvalResult:
     )
 
 
-def _check_drift_foreign_negative(project_root: Path) -> EvalResult:
-    errors = audit_foreign_references(project_root)
+def _check_drift_foreign_negative(project_root: Path, audits: EvalAuditContext) -> EvalResult:
+    errors = audits.get("foreign")
     if errors:
         return EvalResult(
             case_id="drift-foreign-negative",
@@ -368,8 +424,8 @@ def _check_drift_foreign_negative(project_root: Path) -> EvalResult:
     )
 
 
-def _check_drift_sync_positive(project_root: Path) -> EvalResult:
-    errors = audit_generated_surface_drift(project_root)
+def _check_drift_sync_positive(project_root: Path, audits: EvalAuditContext) -> EvalResult:
+    errors = audits.get("surface_drift")
     # Filter to only drift/missing errors (not orphans — those are style)
     sync_errors = [e for e in errors if "Orphan" not in e.message]
     if sync_errors:
@@ -385,7 +441,7 @@ def _check_drift_sync_positive(project_root: Path) -> EvalResult:
     )
 
 
-_CHECK_FUNCTIONS: dict[str, object] = {
+_CHECK_FUNCTIONS: dict[str, Callable[[Path, EvalAuditContext], EvalResult]] = {
     "codex-load-positive": _check_codex_load_positive,
     "codex-load-negative": _check_codex_load_negative,
     "claude-load-positive": _check_claude_load_positive,
@@ -398,6 +454,14 @@ _CHECK_FUNCTIONS: dict[str, object] = {
     "drift-sync-positive": _check_drift_sync_positive,
 }
 
+# Shared audits each case consumes; prefetched together before the cases run.
+_CASE_AUDITS: dict[str, tuple[str, ...]] = {
+    "claude-load-negative": ("surface_drift",),
+    "drift-reachability-positive": ("reachability",),
+    "drift-foreign-negative": ("foreign",),
+    "drift-sync-positive": ("surface_drift",),
+}
+
 
 # ---------------------------------------------------------------------------
 # Runner
@@ -428,6 +492,9 @@ def run_eval_suite(
     if cases is None:
         cases = BASELINE_CASES
 
+    audits = EvalAuditContext(project_root)
+    audits.prefetch(name for case in cases for name in _CASE_AUDITS.get(case.id, ()))
+
     results: list[EvalResult] = []
     for case in cases:
         check_fn = _CHECK_FUNCTIONS.get(case.id)
@@ -436,7 +503,7 @@ def run_eval_suite(
                 EvalResult(case_id=case.id, passed=False, detail=f"No check function for {case.id}")
             )
             continue
-        result = check_fn(project_root)  # ty: ignore[call-non-callable]
+        result = check_fn(project_root, audits)
         results.append(result)
 
     # Compute dimension scores
@@ -5,12 +5,22 @@ State is derived from the ledger, not stored separately.
 """
 
 import json
+import os
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import IO, Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_serializer, model_validator
 
+from gzkit import profiling
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - platforms without POSIX advisory locks
+    fcntl = None
+
 LEDGER_SCHEMA = "gzkit.ledger.v1"
 
 
@@ -130,6 +140,43 @@ def resolve_adr_lane(info: dict[str, Any], default_mode: str) -> str:
     return lane if lane in {"lite", "heavy"} else default_mode
 
 
+@contextmanager
+def _exclusive_lock(handle: IO[str]) -> Generator[None]:
+    """Hold an advisory exclusive lock on an open file for the block duration.
+
+    Falls back to a no-op where ``fcntl`` is unavailable; appends remain
+    line-atomic for small writes but are not serialized across processes.
+    """
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class LedgerTransaction:
+    """Buffer of events committed to the ledger as a single locked write.
+
+    Obtained from ``Ledger.transaction()``; events appended here are not
+    visible in the ledger file until the ``with`` block exits cleanly.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty event buffer."""
+        self.events: list[LedgerEvent] = []
+
+    def append(self, event: LedgerEvent) -> None:
+        """Stage an event for the group commit."""
+        self.events.append(event)
+
+    def extend(self, events: Iterable[LedgerEvent]) -> None:
+        """Stage several events for the group commit."""
+        self.events.extend(events)
+
+
 class Ledger:
     """Append-only ledger for governance events.
 
@@ -147,6 +194,7 @@ class Ledger:
         self.path = path
         self._cached_events: list[LedgerEvent] | None = None
         self._cached_graph: dict[str, dict[str, Any]] | None = None
+        self._cached_stamp: tuple[int, int] | None = None  # (st_ino, byte offset) read so far
 
     def exists(self) -> bool:
         """Check if the ledger file exists."""
@@ -161,6 +209,7 @@ class Ledger:
         """Invalidate all in-memory caches after a mutation."""
         self._cached_events = None
         self._cached_graph = None
+        self._cached_stamp = None
 
     def append(self, event: LedgerEvent) -> None:
         """Append an event to the ledger.
@@ -169,15 +218,54 @@ class Ledger:
             event: The event to append.
 
         """
+        self.append_many([event])
+
+    def append_many(self, events: Iterable[LedgerEvent], *, fsync: bool = False) -> int:
+        """Append several events in one locked, buffered write.
+
+        All lines are serialized up front and written with a single ``write``
+        call while an advisory exclusive lock is held, so concurrent writers
+        (CLI, agent hooks) never interleave partial batches.
+
+        Args:
+            events: Events to append, in order.
+            fsync: Force the batch to stable storage before releasing the lock.
+
+        Returns:
+            Number of events written.
+
+        """
+        lines = [json.dumps(event.model_dump(), separators=(",", ":")) + "\n" for event in events]
+        if not lines:
+            return 0
+
         if not self.path.exists():
             self.create()
 
-        with self.path.open("a") as f:
-            json.dump(event.model_dump(), f, separators=(",", ":"))
-            f.write("\n")
+        with self.path.open("a", encoding="utf-8") as f, _exclusive_lock(f):
+            f.write("".join(lines))
             f.flush()
+            if fsync:
+                os.fsync(f.fileno())
 
         self._invalidate_cache()
+        return len(lines)
+
+    @contextmanager
+    def transaction(self, *, fsync: bool = False) -> Generator[LedgerTransaction]:
+        """Group-commit events appended inside the ``with`` block.
+
+        Staged events are written once via ``append_many`` when the block
+        exits without error; an exception discards the whole batch. Reads
+        inside the block see the pre-transaction ledger state.
+
+        Args:
+            fsync: Force the batch to stable storage on commit.
+
+        """
+        txn = LedgerTransaction()
+        yield txn
+        self.append_many(txn.events, fsync=fsync)
 
     def read_all(self) -> list[LedgerEvent]:
         """Read all events from the ledger.
@@ -194,16 +282,79 @@ class Ledger:
             return []
 
         events = []
-        with self.path.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
+        with profiling.span("ledger.load"), self.path.open("rb") as f:
+            for raw in f:
+                line = raw.strip()
                 if line:
                     data = json.loads(line)
                     events.append(LedgerEvent.model_validate(data))
+            profiling.count("ledger_events", len(events))
+            self._cached_stamp = (os.fstat(f.fileno()).st_ino, f.tell())
 
         self._cached_events = events
         return events
 
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream raw event dicts in ledger order, in one pass.
+
+        For single-pass consumers that only inspect a few keys: lines are
+        decoded but not validated into ``LedgerEvent`` and nothing is cached.
+        Blank and malformed lines are skipped.
+        """
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as f:
+            for raw in f:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(data, dict):
+                    yield data
+
+    def read_new(self) -> list[LedgerEvent] | None:
+        """Read only the events appended since the last read.
+
+        The new events extend the ``read_all`` cache and the artifact graph
+        is dropped so it is rebuilt from memory. A trailing line without a
+        newline (an append in flight) is left for the next call.
+
+        Returns:
+            The newly appended events, or ``None`` when nothing was read yet
+            or the file was replaced or truncated; the cache is then dropped
+            and the caller should fall back to ``read_all``.
+
+        """
+        if self._cached_events is None or self._cached_stamp is None:
+            return None
+        inode, offset = self._cached_stamp
+        try:
+            with self.path.open("rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != inode or st.st_size < offset:
+                    self._invalidate_cache()
+                    return None
+                f.seek(offset)
+                chunk = f.read()
+        except OSError:
+            self._invalidate_cache()
+            return None
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        if not complete:
+            return []
+        events = [
+            LedgerEvent.model_validate(json.loads(line))
+            for line in complete.splitlines()
+            if line.strip()
+        ]
+        self._cached_events.extend(events)
+        self._cached_graph = None
+        self._cached_stamp = (inode, offset + len(complete))
+        return events
+
     def query(
         self,
         event_type: str | None = None,
@@ -506,17 +657,18 @@ class Ledger:
 
         graph: dict[str, dict[str, Any]] = {}
         events = self.read_all()
-        rename_map = self._build_rename_map(events)
-
-        for event in events:
-            canonical_id = self._canonicalize_with_map(event.id, rename_map)
-            canonical_parent = (
-                self._canonicalize_with_map(event.parent, rename_map) if event.parent else None
-            )
-
-            self._ensure_artifact_entry(graph, event, canonical_id, canonical_parent)
-            self._record_parent_child_relationship(graph, canonical_parent, canonical_id)
-            self._apply_graph_event_metadata(graph, canonical_id, event)
+        with profiling.span("ledger.graph_build"):
+            rename_map = self._build_rename_map(events)
+
+            for event in events:
+                canonical_id = self._canonicalize_with_map(event.id, rename_map)
+                canonical_parent = (
+                    self._canonicalize_with_map(event.parent, rename_map) if event.parent else None
+                )
+
+                self._ensure_artifact_entry(graph, event, canonical_id, canonical_parent)
+                self._record_parent_child_relationship(graph, canonical_parent, canonical_id)
+                self._apply_graph_event_metadata(graph, canonical_id, event)
 
         self._cached_graph = graph
         return graph
@@ -2,18 +2,43 @@
 
 Provides the data layer for gz obpi lock commands. All functions take
 ``project_root: Path`` as input — no config or initialization required.
+
+Each lock is one ``<OBPI>.lock.json`` file. Claims are atomic: a fresh
+lock is published with an exclusive create (hard link of a fully written
+temp file, or ``O_CREAT|O_EXCL``), so exactly one of any number of
+concurrent claimers wins. Taking over an expired lock and every other
+mutation run under an advisory ``fcntl`` lock on ``obpi.guard`` (beside the
+lock directory; skipped where ``fcntl`` is unavailable). Listing and reaping
+read the lock files directly, so locks added, removed or edited by hand are
+always seen.
+
+Leases are renewed by :func:`renew_lock`, which only moves the lock's
+``heartbeat_at`` timestamp; expiry counts from the latest heartbeat.
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
 import os
 import subprocess
+import tempfile
+from collections.abc import Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - platforms without POSIX advisory locks
+    fcntl = None
+
+# Fields computed on read; never persisted.
+_COMPUTED_FIELDS = {"is_expired", "elapsed_minutes"}
+
 
 class LockData(BaseModel):
     """Immutable representation of a single OBPI work lock."""
@@ -27,13 +52,16 @@ class LockData(BaseModel):
     claimed_at: str = Field(..., description="ISO 8601 timestamp when lock was claimed")
     branch: str = Field(..., description="Git branch active at claim time")
     ttl_minutes: int = Field(..., description="Time-to-live in minutes")
+    heartbeat_at: str | None = Field(
+        None, description="ISO 8601 timestamp of the latest lease renewal, if any"
+    )
 
     @computed_field
     @property
     def is_expired(self) -> bool:
-        """Return True if the lock TTL has elapsed."""
-        claimed = datetime.fromisoformat(self.claimed_at)
-        elapsed = (datetime.now(UTC) - claimed).total_seconds() / 60
+        """Return True if the TTL has elapsed since the latest heartbeat (or the claim)."""
+        lease_start = datetime.fromisoformat(self.heartbeat_at or self.claimed_at)
+        elapsed = (datetime.now(UTC) - lease_start).total_seconds() / 60
         return elapsed >= self.ttl_minutes
 
     @computed_field
@@ -66,13 +94,22 @@ def resolve_session_id() -> str:
 
 
 def current_branch() -> str:
-    """Return the current git branch name, or ``"unknown"`` on error."""
+    """Return the current git branch name, or ``"unknown"`` on error.
+
+    Cached per process and working directory.
+    """
+    return _branch_for(os.getcwd())
+
+
+@functools.cache
+def _branch_for(cwd: str) -> str:
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             capture_output=True,
             text=True,
             encoding="utf-8",
+            cwd=cwd,
             timeout=5,
         )
         return result.stdout.strip() if result.returncode == 0 else "unknown"
@@ -108,6 +145,69 @@ def read_lock(project_root: Path, obpi_id: str) -> LockData | None:
         return None
 
 
+def _lock_payload(lock: LockData) -> dict[str, Any]:
+    return lock.model_dump(exclude=_COMPUTED_FIELDS)
+
+
+def _parse_lock(raw: str) -> LockData | None:
+    try:
+        return LockData(**json.loads(raw))
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return None
+
+
+@contextlib.contextmanager
+def _mutation_guard(project_root: Path) -> Generator[None]:
+    """Serialize lock mutations across processes (no-op without ``fcntl``)."""
+    if fcntl is None:
+        yield
+        return
+    guard = lock_dir(project_root).with_name("obpi.guard")
+    with guard.open("a", encoding="utf-8") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _staged_lock(path: Path, lock: LockData) -> str:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(_lock_payload(lock), handle, indent=2)
+    return tmp
+
+
+def _replace_lock_file(path: Path, lock: LockData) -> None:
+    tmp = _staged_lock(path, lock)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _create_lock_file(path: Path, lock: LockData) -> bool:
+    """Publish *lock* at *path* only if no lock file exists; return whether it did."""
+    tmp = _staged_lock(path, lock)
+    try:
+        os.link(tmp, path)
+        return True
+    except FileExistsError:
+        return False
+    except OSError:
+        # No hard links on this filesystem: fall back to an exclusive create.
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(_lock_payload(lock), handle, indent=2)
+        return True
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+
 def write_lock(project_root: Path, lock: LockData) -> Path:
     """Serialize *lock* to disk and return the written path.
 
@@ -116,12 +216,49 @@ def write_lock(project_root: Path, lock: LockData) -> Path:
     the stored payload.
     """
     path = lock_path(project_root, lock.obpi_id)
-    # Exclude computed fields — only persist the raw declared fields.
-    payload = lock.model_dump(exclude={"is_expired", "elapsed_minutes"})
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with _mutation_guard(project_root):
+        _replace_lock_file(path, lock)
     return path
 
 
+def claim_lock(project_root: Path, lock: LockData) -> LockData | None:
+    """Atomically claim ``lock.obpi_id`` for ``lock.agent``.
+
+    Returns ``None`` when the claim succeeded, or the conflicting live lock
+    held by another agent. A missing lock is created exclusively; an
+    expired, unreadable or same-agent lock is replaced.
+    """
+    path = lock_path(project_root, lock.obpi_id)
+    with _mutation_guard(project_root):
+        while True:
+            existing = read_lock(project_root, lock.obpi_id)
+            if existing is not None and not existing.is_expired and existing.agent != lock.agent:
+                return existing
+            if path.exists():
+                _replace_lock_file(path, lock)
+                break
+            if _create_lock_file(path, lock):
+                break
+            # Lost an exclusive-create race (only possible without fcntl): re-check.
+    return None
+
+
+def renew_lock(project_root: Path, obpi_id: str, agent: str) -> LockData | None:
+    """Move the heartbeat of *agent*'s live lock on *obpi_id* to now.
+
+    Only ``heartbeat_at`` changes. Returns the renewed lock, or ``None``
+    when *obpi_id* is not held by *agent* (missing, expired or foreign).
+    """
+    path = lock_path(project_root, obpi_id)
+    with _mutation_guard(project_root):
+        existing = read_lock(project_root, obpi_id)
+        if existing is None or existing.is_expired or existing.agent != agent:
+            return None
+        renewed = existing.model_copy(update={"heartbeat_at": datetime.now(UTC).isoformat()})
+        _replace_lock_file(path, renewed)
+    return renewed
+
+
 def delete_lock(project_root: Path, obpi_id: str) -> bool:
     """Delete the lock file for *obpi_id*.
 
@@ -129,9 +266,11 @@ def delete_lock(project_root: Path, obpi_id: str) -> bool:
     not found.
     """
     path = lock_path(project_root, obpi_id)
-    if not path.is_file():
-        return False
-    path.unlink()
+    with _mutation_guard(project_root):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
     return True
 
 
@@ -141,14 +280,13 @@ def list_locks(project_root: Path, adr_filter: str | None = None) -> list[LockDa
     *adr_filter* should be an ADR identifier such as ``"ADR-0.0.14"``.
     Matching converts OBPI-X.Y.Z-NN → ADR-X.Y.Z and compares the prefix.
     """
-    d = lock_dir(project_root)
     locks: list[LockData] = []
-    for lock_file in sorted(d.glob("*.lock.json")):
+    for lock_file in sorted(lock_dir(project_root).glob("*.lock.json")):
         try:
-            raw = lock_file.read_text(encoding="utf-8")
-            data = json.loads(raw)
-            lock = LockData(**data)
-        except (json.JSONDecodeError, OSError, TypeError, ValueError):
+            lock = _parse_lock(lock_file.read_text(encoding="utf-8"))
+        except OSError:
+            continue
+        if lock is None:
             continue
 
         if adr_filter is not None:
@@ -163,13 +301,19 @@ def list_locks(project_root: Path, adr_filter: str | None = None) -> list[LockDa
 
 def reap_expired_locks(project_root: Path) -> list[LockData]:
     """Delete all expired locks and return the reaped ``LockData`` objects."""
+    expired = [lock for lock in list_locks(project_root) if lock.is_expired]
+    if not expired:
+        return []
     reaped: list[LockData] = []
-    for lock in list_locks(project_root):
-        if lock.is_expired:
+    with _mutation_guard(project_root):
+        for lock in expired:
             path = lock_path(project_root, lock.obpi_id)
+            current = read_lock(project_root, lock.obpi_id)
+            if current is None or not current.is_expired:
+                continue  # renewed or re-claimed since it was listed
             try:
                 path.unlink()
-                reaped.append(lock)
             except OSError:
-                pass
+                continue
+            reaped.append(current)
     return reaped
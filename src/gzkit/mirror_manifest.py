@@ -0,0 +1,230 @@
+"""Stat manifests for vendor skill mirrors.
+
+Every mirror root (``.claude/skills``, ``.github/skills``, ``.agents/skills``)
+gets a manifest in ``.gzkit/cache/mirrors/`` recording, per mirrored file,
+the ``(size, mtime_ns)`` stamp of the canonical source and of the mirror copy
+plus the SHA-256 of the content they share. When both stamps still match,
+sync and parity validation skip the file without reading it; only files whose
+stat changed are re-read and re-hashed.
+
+Materialization is ``copy`` by default. Projects can opt into ``hardlink``
+(mirror and canonical share one inode: zero extra bytes, parity is an inode
+comparison) or ``reflink`` (copy-on-write clone where the filesystem supports
+it). Both fall back to a plain copy when the filesystem refuses.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from gzkit.cache import cache_file, read_json_cache, stat_key, write_json_cache
+
+MIRROR_MANIFEST_SCHEMA = "gzkit.mirror_manifest.v1"
+
+MirrorMode = Literal["copy", "hardlink", "reflink"]
+
+# Linux FICLONE ioctl request (``_IOW(0x94, 9, int)``).
+_FICLONE = 0x40049409
+
+
+class FileStamp(BaseModel):
+    """Stat fingerprint of one file."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    size: int = Field(..., description="File size in bytes")
+    mtime_ns: int = Field(..., description="Modification time in nanoseconds")
+
+    @classmethod
+    def of(cls, st: os.stat_result) -> "FileStamp":
+        """Build a stamp from a stat result."""
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Return True when *st* carries the same size and mtime."""
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns
+
+
+class MirrorEntry(BaseModel):
+    """Manifest record for one mirrored file."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    source: FileStamp = Field(..., description="Canonical file stamp at last sync")
+    target: FileStamp = Field(..., description="Mirror file stamp at last sync")
+    sha256: str = Field(..., description="Content hash shared by source and target")
+
+    def is_current(self, source_st: os.stat_result, target_st: os.stat_result) -> bool:
+        """Return True when neither side changed since the entry was recorded."""
+        return self.source.matches(source_st) and self.target.matches(target_st)
+
+
+def content_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest of *data*."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def same_inode(a: os.stat_result, b: os.stat_result) -> bool:
+    """Return True when both stats describe the same file (hardlinked mirror)."""
+    return a.st_ino == b.st_ino and a.st_dev == b.st_dev and a.st_ino != 0
+
+
+# ---------------------------------------------------------------------------
+# Manifest store
+# ---------------------------------------------------------------------------
+
+_loaded: dict[Path, tuple[tuple[int, int] | None, dict[str, MirrorEntry]]] = {}
+
+
+def manifest_path(project_root: Path, target_dir: str) -> Path:
+    """Return the cache file holding the manifest for mirror root *target_dir*."""
+    slug = Path(target_dir).as_posix().strip("/").replace("/", "__")
+    return cache_file(project_root, "mirrors", f"{slug}.json")
+
+
+def load_mirror_manifest(project_root: Path, target_dir: str) -> dict[str, MirrorEntry]:
+    """Load the manifest for *target_dir* (keys are paths relative to the mirror root).
+
+    Parsed manifests are memoized per process and revalidated by the cache
+    file's own stat, so repeated parity checks read it once.
+    """
+    path = manifest_path(project_root, target_dir)
+    key = stat_key(path)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    entries: dict[str, MirrorEntry] = {}
+    raw = read_json_cache(path, MIRROR_MANIFEST_SCHEMA) if key is not None else None
+    for rel, value in (raw or {}).get("entries", {}).items():
+        try:
+            entries[rel] = MirrorEntry.model_validate(value)
+        except ValidationError:
+            continue
+    _loaded[path] = (key, entries)
+    return entries
+
+
+def save_mirror_manifest(
+    project_root: Path, target_dir: str, entries: dict[str, MirrorEntry]
+) -> None:
+    """Persist *entries* as the manifest for *target_dir*."""
+    path = manifest_path(project_root, target_dir)
+    payload = {"entries": {rel: e.model_dump() for rel, e in sorted(entries.items())}}
+    write_json_cache(path, MIRROR_MANIFEST_SCHEMA, payload)
+    _loaded[path] = (stat_key(path), dict(entries))
+
+
+# ---------------------------------------------------------------------------
+# Parity and materialization
+# ---------------------------------------------------------------------------
+
+
+def stat_parity(source: Path, target: Path, entry: MirrorEntry | None) -> bool:
+    """Return True when *target* is known to equal *source* from stat data alone.
+
+    ``False`` means "unknown", not "different": callers fall back to reading.
+    """
+    try:
+        source_st = source.stat()
+        target_st = target.stat()
+    except OSError:
+        return False
+    if same_inode(source_st, target_st):
+        return True
+    return entry is not None and entry.is_current(source_st, target_st)
+
+
+def _target_holds_content(
+    target: Path,
+    target_st: os.stat_result,
+    entry: MirrorEntry | None,
+    digest: str,
+    source_bytes: bytes,
+) -> bool:
+    """Return True when an existing mirror file already holds the source content.
+
+    A recorded target stamp vouches for the recorded hash, so only targets that
+    changed since the last sync are read.
+    """
+    if entry is not None and entry.target.matches(target_st):
+        return entry.sha256 == digest
+    try:
+        return target.read_bytes() == source_bytes
+    except OSError:
+        return False
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl  # noqa: PLC0415
+
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def materialize_mirror_file(source: Path, target: Path, data: bytes, mode: MirrorMode) -> None:
+    """Write *target* as a copy, hardlink or reflink of *source*.
+
+    The old target is replaced rather than written through, so a mirror that
+    was previously hardlinked never modifies the canonical file.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.gz-mirror")
+    staging.unlink(missing_ok=True)
+    linked = False
+    if mode == "hardlink":
+        try:
+            os.link(source, staging)
+            linked = True
+        except OSError:
+            linked = False
+    elif mode == "reflink":
+        linked = _reflink(source, staging)
+    if not linked:
+        staging.write_bytes(data)
+    os.replace(staging, target)
+
+
+def sync_mirror_file(
+    source: Path, target: Path, entry: MirrorEntry | None, mode: MirrorMode
+) -> tuple[MirrorEntry, bool]:
+    """Bring *target* in line with *source*; return its new entry and whether it was written.
+
+    Unchanged pairs (both stamps match *entry*) are settled from stat data
+    alone. In ``hardlink`` mode anything but a shared inode is rewritten so
+    mirrors converge to links after the mode is switched on.
+    """
+    source_st = source.stat()
+    try:
+        target_st: os.stat_result | None = target.stat()
+    except OSError:
+        target_st = None
+    linked = target_st is not None and same_inode(source_st, target_st)
+    current = target_st is not None and entry is not None and entry.is_current(source_st, target_st)
+    if current and entry is not None and (linked or mode != "hardlink"):
+        return entry, False
+
+    data = source.read_bytes()
+    digest = content_digest(data)
+    written = False
+    if target_st is None or not (
+        linked
+        or (mode != "hardlink" and _target_holds_content(target, target_st, entry, digest, data))
+    ):
+        materialize_mirror_file(source, target, data, mode)
+        target_st = target.stat()
+        written = True
+    fresh = MirrorEntry(
+        source=FileStamp.of(source_st), target=FileStamp.of(target_st), sha256=digest
+    )
+    return fresh, written
@@ -0,0 +1,352 @@
+"""Persona drift detection engine (OBPI-0.0.13-05).
+
+Each trait maps to a behavioral proxy evaluated from governance evidence:
+ledger events and the per-ADR ``logs/obpi-audit.jsonl`` audit records.
+Proxies are incremental accumulators, so a drift report streams the ledger
+and the audit logs once however many proxies and personas are evaluated.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gzkit.models.persona import PersonaDriftReport, PersonaFrontmatter, TraitCheckResult
+
+# ADR directories sit one level (``adr/<ADR>``) or two levels
+# (``adr/<series>/<ADR>``) below ``docs/design/adr``; their audit logs are
+# looked up at exactly those depths instead of walking the whole tree.
+_AUDIT_LOG_PATTERNS = ("*/logs/obpi-audit.jsonl", "*/*/logs/obpi-audit.jsonl")
+
+
+def _iter_obpi_audit_records(project_root: Path) -> Iterator[dict[str, object]]:
+    """Yield OBPI audit records from every ADR's ``logs/obpi-audit.jsonl``."""
+    import json  # noqa: PLC0415
+
+    adr_root = project_root / "docs" / "design" / "adr"
+    if not adr_root.is_dir():
+        return
+    for pattern in _AUDIT_LOG_PATTERNS:
+        for log_path in sorted(adr_root.glob(pattern)):
+            for line in log_path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+# -- Proxy accumulators -----------------------------------------------------
+
+
+class _ProxyAccumulator(ABC):
+    """Incremental evaluator for one behavioral proxy.
+
+    Fed each ledger event and/or audit record once, in stream order; the
+    ``uses_*`` flags say which streams the proxy needs.
+    """
+
+    uses_events = False
+    uses_audits = False
+
+    def add_event(self, event: dict[str, object]) -> None:  # noqa: B027 -- optional hook
+        """Consume one ledger event."""
+
+    def add_audit(self, record: dict[str, object]) -> None:  # noqa: B027 -- optional hook
+        """Consume one OBPI audit record."""
+
+    @abstractmethod
+    def result(self) -> tuple[str, str]:
+        """Return ``(status, detail)`` for everything consumed so far."""
+
+
+class _GovernanceActivity(_ProxyAccumulator):
+    """Check for governance lifecycle events in the ledger."""
+
+    uses_events = True
+    _TYPES = frozenset(
+        {"gate_checked", "attested", "audit_receipt_emitted", "obpi_receipt_emitted"}
+    )
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def add_event(self, event: dict[str, object]) -> None:
+        if event.get("event") in self._TYPES:
+            self._count += 1
+
+    def result(self) -> tuple[str, str]:
+        if self._count > 0:
+            return "pass", f"{self._count} governance events found in ledger"
+        return "fail", "No governance activity events in ledger"
+
+
+class _AuditFinding(_ProxyAccumulator):
+    """Pass on the first audit record that yields a finding."""
+
+    uses_audits = True
+    _missing = ""
+
+    def __init__(self) -> None:
+        self._seen = 0
+        self._found: str | None = None
+
+    def add_audit(self, record: dict[str, object]) -> None:
+        self._seen += 1
+        if self._found is None:
+            self._found = self._inspect(record)
+
+    @abstractmethod
+    def _inspect(self, record: dict[str, object]) -> str | None:
+        """Return the finding detail for *record*, or ``None`` when it has none."""
+
+    def result(self) -> tuple[str, str]:
+        if self._found is not None:
+            return "pass", self._found
+        if not self._seen:
+            return "fail", "No OBPI audit records found"
+        return "fail", self._missing
+
+
+class _TestEvidence(_AuditFinding):
+    """Check OBPI audit logs for test evidence."""
+
+    _missing = "No passing test evidence in audit records"
+
+    def _inspect(self, record: dict[str, object]) -> str | None:
+        raw_ev = record.get("evidence")
+        if not isinstance(raw_ev, dict):
+            return None
+        test_count = raw_ev.get("test_count")
+        tests_passed = raw_ev.get("tests_passed")
+        if isinstance(test_count, int) and test_count > 0 and tests_passed is True:
+            return f"Audit shows {test_count} tests passing"
+        return None
+
+
+class _EvidenceQuality(_AuditFinding):
+    """Check for substantive criteria evaluations in audit records."""
+
+    _missing = "No substantive criteria evaluations found"
+
+    def _inspect(self, record: dict[str, object]) -> str | None:
+        raw_ev = record.get("evidence")
+        if not isinstance(raw_ev, dict):
+            return None
+        criteria = raw_ev.get("criteria_evaluated")
+        if isinstance(criteria, list):
+            passing = [c for c in criteria if isinstance(c, dict) and c.get("result") == "PASS"]
+            if passing:
+                return f"{len(passing)} criteria evaluated with PASS"
+        return None
+
+
+class _CompletionQuality(_ProxyAccumulator):
+    """Check for completed OBPI brief transitions in audit records."""
+
+    uses_audits = True
+
+    def __init__(self) -> None:
+        self._seen = 0
+        self._completed = False
+        self._attested = False
+
+    def add_audit(self, record: dict[str, object]) -> None:
+        self._seen += 1
+        self._completed = self._completed or record.get("brief_status_after") == "Completed"
+        self._attested = self._attested or record.get("action_taken") == "attestation_recorded"
+
+    def result(self) -> tuple[str, str]:
+        if self._completed:
+            return "pass", "OBPI brief completed in audit trail"
+        if self._attested:
+            return "pass", "Attestation recorded in audit trail"
+        if not self._seen:
+            return "fail", "No OBPI audit records found"
+        return "fail", "No completion transitions found in audit records"
+
+
+class _PlanDiscipline(_ProxyAccumulator):
+    """Check that ADR creation events precede gate checks."""
+
+    uses_events = True
+
+    def __init__(self) -> None:
+        self._first_adr: str | None = None
+        self._first_gate: str | None = None
+
+    def add_event(self, event: dict[str, object]) -> None:
+        ts = event.get("ts", "")
+        if not isinstance(ts, str):
+            return
+        kind = event.get("event")
+        if kind == "adr_created" and (self._first_adr is None or ts < self._first_adr):
+            self._first_adr = ts
+        elif kind == "gate_checked" and (self._first_gate is None or ts < self._first_gate):
+            self._first_gate = ts
+
+    def result(self) -> tuple[str, str]:
+        if self._first_adr is None:
+            return "fail", "No ADR creation events found in ledger"
+        if self._first_gate is None:
+            return "pass", "ADR created; no gate checks yet (plan-first discipline)"
+        if self._first_adr <= self._first_gate:
+            return "pass", "ADR creation precedes first gate check"
+        return "fail", "Gate checks occurred before ADR was created"
+
+
+PROXY_ACCUMULATORS: dict[str, type[_ProxyAccumulator]] = {
+    "governance_activity": _GovernanceActivity,
+    "test_evidence": _TestEvidence,
+    "evidence_quality": _EvidenceQuality,
+    "completion_quality": _CompletionQuality,
+    "plan_discipline": _PlanDiscipline,
+}
+"""Maps proxy name to its incremental accumulator class."""
+
+
+def _evaluate_proxies(project_root: Path, proxy_names: set[str]) -> dict[str, tuple[str, str]]:
+    """Evaluate *proxy_names* in one pass over the ledger and one over the audit logs."""
+    from gzkit.ledger import Ledger  # noqa: PLC0415
+
+    accumulators = {name: PROXY_ACCUMULATORS[name]() for name in sorted(proxy_names)}
+    on_event = [acc.add_event for acc in accumulators.values() if acc.uses_events]
+    on_audit = [acc.add_audit for acc in accumulators.values() if acc.uses_audits]
+    if on_event:
+        for event in Ledger(project_root / ".gzkit" / "ledger.jsonl").iter_records():
+            for feed in on_event:
+                feed(event)
+    if on_audit:
+        for record in _iter_obpi_audit_records(project_root):
+            for feed in on_audit:
+                feed(record)
+    return {name: acc.result() for name, acc in accumulators.items()}
+
+
+# -- Trait proxy registry ---------------------------------------------------
+
+TRAIT_PROXY_REGISTRY: dict[str, str] = {
+    "governance-aware": "governance_activity",
+    "governance-fidelity": "governance_activity",
+    "evidence-anchoring": "governance_activity",
+    "test-first": "test_evidence",
+    "thorough": "test_evidence",
+    "architectural-rigor": "test_evidence",
+    "evidence-driven": "evidence_quality",
+    "evidence-based-assessment": "evidence_quality",
+    "evidence-to-decision": "evidence_quality",
+    "precision": "evidence_quality",
+    "complete-units": "completion_quality",
+    "atomic-edits": "completion_quality",
+    "ceremony-completion": "completion_quality",
+    "methodical": "plan_discipline",
+    "plan-then-write": "plan_discipline",
+    "stage-discipline": "plan_discipline",
+    "sequential-flow": "plan_discipline",
+}
+"""Maps trait keywords to the name of their proxy in ``PROXY_ACCUMULATORS``."""
+
+
+def _trait_result(
+    trait: str,
+    outcome: tuple[str, str] | None,
+    *,
+    is_anti_trait: bool = False,
+) -> TraitCheckResult:
+    """Build the check result for *trait* from its proxy's ``(status, detail)``."""
+    from gzkit.models.persona import TraitCheckResult  # noqa: PLC0415
+
+    proxy_name = TRAIT_PROXY_REGISTRY.get(trait)
+    if proxy_name is None or outcome is None:
+        return TraitCheckResult(
+            trait=trait,
+            status="no_evidence",
+            proxy="unmapped",
+            detail=f"No behavioral proxy registered for '{trait}'",
+            is_anti_trait=is_anti_trait,
+        )
+    status, detail = outcome
+    if is_anti_trait and status == "pass":
+        status = "pass"
+        detail = f"(inverse) {detail}"
+    elif is_anti_trait and status == "fail":
+        status = "pass"
+        detail = f"(inverse: anti-trait not evidenced) {detail}"
+    return TraitCheckResult(
+        trait=trait,
+        status=status,
+        proxy=proxy_name,
+        detail=detail,
+        is_anti_trait=is_anti_trait,
+    )
+
+
+def evaluate_persona_drift(
+    project_root: Path,
+    persona_name: str | None = None,
+) -> PersonaDriftReport:
+    """Evaluate trait adherence for one or all personas.
+
+    Loads personas from ``.gzkit/personas/``, evaluates every proxy their
+    traits map to in a single pass over the ledger and the audit logs, then
+    reports each persona's traits against those proxy outcomes.
+    """
+    import datetime  # noqa: PLC0415
+
+    from gzkit.models.persona import (  # noqa: PLC0415
+        PersonaDriftReport,
+        PersonaDriftResult,
+        discover_persona_files,
+        parse_persona_file,
+    )
+
+    personas_dir = project_root / ".gzkit" / "personas"
+    personas: list[PersonaFrontmatter] = []
+    for f in discover_persona_files(personas_dir):
+        try:
+            fm, _body = parse_persona_file(f)
+        except ValueError:
+            continue
+        if persona_name is None or fm.name == persona_name:
+            personas.append(fm)
+
+    proxy_names = {
+        TRAIT_PROXY_REGISTRY[trait]
+        for fm in personas
+        for trait in (*fm.traits, *fm.anti_traits)
+        if trait in TRAIT_PROXY_REGISTRY
+    }
+    outcomes = _evaluate_proxies(project_root, proxy_names)
+
+    def outcome_for(trait: str) -> tuple[str, str] | None:
+        proxy_name = TRAIT_PROXY_REGISTRY.get(trait)
+        return None if proxy_name is None else outcomes[proxy_name]
+
+    results: list[PersonaDriftResult] = []
+    for fm in personas:
+        checks: list[TraitCheckResult] = [
+            _trait_result(trait, outcome_for(trait)) for trait in fm.traits
+        ]
+        checks.extend(
+            _trait_result(anti_trait, outcome_for(anti_trait), is_anti_trait=True)
+            for anti_trait in fm.anti_traits
+        )
+        has_drift = any(c.status == "fail" for c in checks)
+        results.append(PersonaDriftResult(persona=fm.name, checks=checks, has_drift=has_drift))
+
+    total_checks = sum(len(r.checks) for r in results)
+    drift_count = sum(1 for r in results for c in r.checks if c.status == "fail")
+    return PersonaDriftReport(
+        personas=results,
+        total_personas=len(results),
+        total_checks=total_checks,
+        drift_count=drift_count,
+        scan_timestamp=datetime.datetime.now(datetime.UTC).isoformat(),
+    )
@@ -0,0 +1,184 @@
+"""On-disk index behind OBPI plan and brief lookup on the pipeline hook path.
+
+``find_plan_for_obpi`` used to read every plan markdown file in the project
+and user-global plans directories, and ``find_obpi_brief`` ran an ``rglob``
+over the whole design tree, on every hook invocation. This index, kept in
+``.gzkit/cache/pipeline_index.json``, records:
+
+* per plans directory: the directory mtime and, per plan file, its
+  ``(mtime_ns, size)`` stamp and the OBPI id tokens it mentions. A directory
+  is only listed again when its mtime moved; a plan file is only read again
+  when its stamp changed.
+* per docs root: the mtime of every directory in the tree and the
+  ``OBPI-*.md`` file names in it. Only directories whose mtime moved are
+  listed again.
+
+Lookups are exact for ids of the form ``OBPI-<word chars, dots, dashes>``;
+callers fall back to scanning for anything else.
+"""
+
+import os
+import re
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from gzkit.cache import cache_file, read_json_cache, stat_key, write_json_cache
+
+PIPELINE_INDEX_SCHEMA = "gzkit.pipeline_index.v1"
+
+_OBPI_TOKEN_RE = re.compile(r"OBPI-[\w.-]+")
+
+
+def indexable_obpi_id(obpi_id: str) -> bool:
+    """Return True when *obpi_id* can be answered from the index."""
+    return bool(_OBPI_TOKEN_RE.fullmatch(obpi_id))
+
+
+def find_index_root(path: Path) -> Path | None:
+    """Return the nearest ancestor of *path* (inclusive) holding a ``.gzkit`` directory."""
+    for candidate in (path, *path.parents):
+        if (candidate / ".gzkit").is_dir():
+            return candidate
+    return None
+
+
+def _plan_tokens(plan_path: Path) -> list[str] | None:
+    """Return the sorted OBPI id tokens in a plan, or ``None`` when unreadable."""
+    try:
+        content = plan_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return sorted(set(_OBPI_TOKEN_RE.findall(content)))
+
+
+def _dir_mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class PipelineIndex:
+    """Plan-mention and brief-location index for one project."""
+
+    def __init__(self, project_root: Path) -> None:
+        self._path = cache_file(project_root, "pipeline_index.json")
+        payload = read_json_cache(self._path, PIPELINE_INDEX_SCHEMA) or {}
+        plans = payload.get("plans")
+        briefs = payload.get("briefs")
+        self._plans: dict[str, dict[str, Any]] = plans if isinstance(plans, dict) else {}
+        self._briefs: dict[str, dict[str, Any]] = briefs if isinstance(briefs, dict) else {}
+        self._dirty = False
+
+    # -- plans --------------------------------------------------------------
+
+    def plans_mentioning(self, plans_dir: Path, obpi_id: str) -> list[tuple[int, Path]]:
+        """Return ``(mtime_ns, path)`` for every plan in *plans_dir* mentioning *obpi_id*."""
+        files = self._refresh_plans(plans_dir)
+        return [
+            (record[0], plans_dir / name)
+            for name, record in files.items()
+            if any(obpi_id in token for token in record[2])
+        ]
+
+    def _refresh_plans(self, plans_dir: Path) -> dict[str, list[Any]]:
+        key = str(plans_dir)
+        entry = self._plans.get(key, {})
+        known: dict[str, list[Any]] = entry.get("files", {})
+        dir_mtime = _dir_mtime(plans_dir)
+        if dir_mtime is None:
+            return {}
+        if entry.get("mtime_ns") == dir_mtime:
+            names = list(known)
+        else:
+            with os.scandir(plans_dir) as entries:
+                names = [
+                    e.name
+                    for e in entries
+                    if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()
+                ]
+        files: dict[str, list[Any]] = {}
+        for name in names:
+            stamp = stat_key(plans_dir / name)
+            if stamp is None:
+                continue
+            record = known.get(name)
+            if record is not None and tuple(record[:2]) == stamp:
+                files[name] = record
+                continue
+            tokens = _plan_tokens(plans_dir / name)
+            if tokens is not None:
+                files[name] = [*stamp, tokens]
+        if files != known or entry.get("mtime_ns") != dir_mtime:
+            self._plans[key] = {"mtime_ns": dir_mtime, "files": files}
+            self._dirty = True
+        return files
+
+    # -- briefs -------------------------------------------------------------
+
+    def brief_for(self, docs_root: Path, obpi_id: str) -> Path | None:
+        """Return the first ``<obpi_id>*.md`` under *docs_root*, like a sorted ``rglob``."""
+        files = self._refresh_tree(docs_root)
+        matches = sorted(
+            docs_root / rel / name
+            for rel, names in files.items()
+            for name in names
+            if name.startswith(obpi_id)
+        )
+        return matches[0] if matches else None
+
+    def _refresh_tree(self, docs_root: Path) -> dict[str, list[str]]:
+        entry = self._briefs.setdefault(str(docs_root), {"dirs": {}, "files": {}})
+        dirs: dict[str, int] = entry["dirs"]
+        files: dict[str, list[str]] = entry["files"]
+        pending = (
+            ["."] if not dirs else [r for r, m in dirs.items() if _dir_mtime(docs_root / r) != m]
+        )
+        if pending:
+            self._dirty = True
+        while pending:
+            rel = pending.pop()
+            directory = docs_root / rel
+            mtime = _dir_mtime(directory)
+            if mtime is None:
+                self._forget(dirs, files, rel)
+                continue
+            names: list[str] = []
+            subdirs: set[str] = set()
+            try:
+                with os.scandir(directory) as entries:
+                    for e in entries:
+                        if e.is_dir(follow_symlinks=False):
+                            subdirs.add(str(PurePosixPath(rel) / e.name))
+                        elif e.name.startswith("OBPI-") and e.name.endswith(".md"):
+                            names.append(e.name)
+            except OSError:
+                self._forget(dirs, files, rel)
+                continue
+            dirs[rel] = mtime
+            if names:
+                files[rel] = sorted(names)
+            else:
+                files.pop(rel, None)
+            for gone in [d for d in dirs if d != rel and str(PurePosixPath(d).parent) == rel]:
+                if gone not in subdirs:
+                    self._forget(dirs, files, gone)
+            pending.extend(s for s in subdirs if s not in dirs)
+        return files
+
+    @staticmethod
+    def _forget(dirs: dict[str, int], files: dict[str, list[str]], rel: str) -> None:
+        prefix = f"{rel}/"
+        for d in [d for d in dirs if d == rel or d.startswith(prefix)]:
+            del dirs[d]
+        for d in [d for d in files if d == rel or d.startswith(prefix)]:
+            del files[d]
+
+    def save(self) -> None:
+        """Persist the index when this lookup changed it."""
+        if not self._dirty:
+            return
+        write_json_cache(
+            self._path, PIPELINE_INDEX_SCHEMA, {"plans": self._plans, "briefs": self._briefs}
+        )
+        self._dirty = False
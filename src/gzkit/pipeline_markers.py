@@ -13,6 +13,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, cast
 
+from gzkit.pipeline_index import PipelineIndex, find_index_root, indexable_obpi_id
+
 
 def _claude_home() -> Path:
     """Return the Claude Code user home directory.
@@ -90,7 +92,8 @@ def find_plan_for_obpi(project_root: Path, obpi_id: str) -> Path | None:
     """Locate the most recent plan file referencing ``obpi_id`` across both dirs (#128).
 
     Searches every directory returned by :func:`pipeline_plan_search_dirs`,
-    chooses the plan file with the most recent mtime that mentions the OBPI,
+    chooses the plan file with the most recent mtime that mentions the OBPI
+    (answered from :class:`gzkit.pipeline_index.PipelineIndex`),
     and — if that file lives in the global user directory — copies it into
     the project-local plans directory so the plan, the receipt, and the
     pipeline marker stay co-located. Returns the project-local path the
@@ -100,22 +103,28 @@ def find_plan_for_obpi(project_root: Path, obpi_id: str) -> Path | None:
         return None
 
     project_local = pipeline_plans_dir(project_root)
-    candidates: list[tuple[float, Path]] = []
-    for plans_dir in pipeline_plan_search_dirs(project_root):
-        for plan_path in plans_dir.glob("*.md"):
-            if plan_path.name.startswith("."):
-                continue
-            try:
-                content = plan_path.read_text(encoding="utf-8")
-            except OSError:
-                continue
-            if obpi_id not in content:
-                continue
-            try:
-                mtime = plan_path.stat().st_mtime
-            except OSError:
-                continue
-            candidates.append((mtime, plan_path))
+    candidates: list[tuple[int, Path]] = []
+    if indexable_obpi_id(obpi_id):
+        index = PipelineIndex(project_root)
+        for plans_dir in pipeline_plan_search_dirs(project_root):
+            candidates.extend(index.plans_mentioning(plans_dir, obpi_id))
+        index.save()
+    else:
+        for plans_dir in pipeline_plan_search_dirs(project_root):
+            for plan_path in plans_dir.glob("*.md"):
+                if plan_path.name.startswith("."):
+                    continue
+                try:
+                    content = plan_path.read_text(encoding="utf-8")
+                except OSError:
+                    continue
+                if obpi_id not in content:
+                    continue
+                try:
+                    mtime = plan_path.stat().st_mtime_ns
+                except OSError:
+                    continue
+                candidates.append((mtime, plan_path))
 
     if not candidates:
         return None
@@ -427,10 +436,22 @@ def find_active_pipeline_marker(plans_dir: Path) -> dict[str, Any] | None:
     return None
 
 
-def find_obpi_brief(docs_root: Path, obpi_id: str) -> Path | None:
-    """Find the OBPI brief that corresponds to the active marker."""
+def find_obpi_brief(
+    docs_root: Path, obpi_id: str, *, project_root: Path | None = None
+) -> Path | None:
+    """Find the OBPI brief that corresponds to the active marker.
+
+    Answered from the project's pipeline index when *project_root* is given
+    or can be found above *docs_root*; otherwise the tree is scanned.
+    """
     if not docs_root.is_dir():
         return None
+    index_root = project_root or find_index_root(docs_root)
+    if index_root is not None and indexable_obpi_id(obpi_id):
+        index = PipelineIndex(index_root)
+        brief = index.brief_for(docs_root, obpi_id)
+        index.save()
+        return brief
     matches = sorted(docs_root.rglob(f"{obpi_id}*.md"))
     return matches[0] if matches else None
 
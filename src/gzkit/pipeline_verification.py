@@ -98,25 +98,44 @@ def extract_verification_scopes(
     return scopes
 
 
+def _scopes_by_path(scopes: list[VerificationScope]) -> dict[str, list[int]]:
+    """Inverted index: test path -> positions (in *scopes*) of the scopes that list it.
+
+    Built in one pass over all paths; a scope listing a path twice appears once.
+    """
+    index: dict[str, list[int]] = {}
+    for position, scope in enumerate(scopes):
+        for path in dict.fromkeys(scope.test_paths):
+            index.setdefault(path, []).append(position)
+    return index
+
+
 def compute_path_overlap(scopes: list[VerificationScope]) -> dict[tuple[int, int], list[str]]:
     """Return overlapping test paths between each pair of scopes.
 
     Keys are ``(req_a, req_b)`` tuples (``a < b``). Values are the shared
     paths. An empty dict means no overlaps exist.
+
+    Pairs are emitted from the buckets of a path -> scopes inverted index, so
+    the cost is proportional to total paths plus overlapping pairs rather than
+    to every pair of scopes.
     """
-    overlaps: dict[tuple[int, int], list[str]] = {}
-    for i, scope_a in enumerate(scopes):
-        set_a = set(scope_a.test_paths)
-        for scope_b in scopes[i + 1 :]:
-            shared = sorted(set_a & set(scope_b.test_paths))
-            if shared:
-                overlaps[(scope_a.req_index, scope_b.req_index)] = shared
-    return overlaps
+    shared: dict[tuple[int, int], list[str]] = {}
+    for path, positions in _scopes_by_path(scopes).items():
+        if len(positions) < 2:
+            continue
+        for i, pos_a in enumerate(positions):
+            for pos_b in positions[i + 1 :]:
+                shared.setdefault((pos_a, pos_b), []).append(path)
+    return {
+        (scopes[pos_a].req_index, scopes[pos_b].req_index): sorted(paths)
+        for (pos_a, pos_b), paths in sorted(shared.items())
+    }
 
 
 def partition_independent_groups(
     scopes: list[VerificationScope],
-    overlaps: dict[tuple[int, int], list[str]],
+    overlaps: dict[tuple[int, int], list[str]] | None = None,
 ) -> list[list[int]]:
     """Partition scopes into groups of non-overlapping requirements.
 
@@ -126,7 +145,9 @@ def partition_independent_groups(
     a single subagent.
 
     Uses a simple union-find to merge overlapping scopes into connected
-    components.
+    components. With *overlaps* given, its pairs drive the merges; without,
+    each bucket of the path -> scopes index is merged directly, which never
+    enumerates pairs.
     """
     if not scopes:
         return []
@@ -144,8 +165,14 @@ def partition_independent_groups(
         if ra != rb:
             parent[ra] = rb
 
-    for req_a, req_b in overlaps:
-        union(req_a, req_b)
+    if overlaps is None:
+        for positions in _scopes_by_path(scopes).values():
+            first = scopes[positions[0]].req_index
+            for position in positions[1:]:
+                union(first, scopes[position].req_index)
+    else:
+        for req_a, req_b in overlaps:
+            union(req_a, req_b)
 
     groups: dict[int, list[int]] = {}
     for s in scopes:
@@ -174,8 +201,7 @@ def build_verification_plan(
             strategy="sequential",
         )
 
-    overlaps = compute_path_overlap(scopes)
-    groups = partition_independent_groups(scopes, overlaps)
+    groups = partition_independent_groups(scopes)
 
     if len(groups) <= 1:
         strategy = "sequential"
@@ -0,0 +1,168 @@
+"""Phase profiler behind ``gz --profile``.
+
+Subsystems mark their phases with :func:`span` and tally cheap events with
+:func:`count`; both are no-ops unless the CLI has started a profiler for the
+current invocation, so instrumented hot paths pay one global lookup when
+profiling is off.
+
+Spans nest by call structure. The report merges sibling spans that share a
+name (fifty ``git`` calls under ``status`` become one node with
+``calls: 50``), keeping the tree small enough to read while preserving where
+the time went. Counters roll up to the root as invocation totals.
+
+Only the thread that started the profiler records spans; worker threads
+still contribute counters to the currently open span.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+
+class Span:
+    """One timed phase and the phases nested inside it."""
+
+    __slots__ = ("attrs", "children", "counts", "duration_ms", "name", "start")
+
+    def __init__(self, name: str, attrs: dict[str, Any] | None = None) -> None:
+        self.name = name
+        self.attrs: dict[str, Any] = attrs or {}
+        self.counts: dict[str, int] = {}
+        self.children: list[Span] = []
+        self.start = time.perf_counter()
+        self.duration_ms = 0.0
+
+    def finish(self) -> None:
+        """Record the elapsed time since the span opened."""
+        self.duration_ms = (time.perf_counter() - self.start) * 1000
+
+
+class Profiler:
+    """Span stack and counters for one gz invocation."""
+
+    def __init__(self, correlation_id: str, *, command: str = "") -> None:
+        self.correlation_id = correlation_id
+        self.root = Span(command or "gz")
+        self._stack: list[Span] = [self.root]
+        self._thread = threading.get_ident()
+
+    @property
+    def current(self) -> Span:
+        """Innermost open span."""
+        return self._stack[-1]
+
+    def push(self, name: str, attrs: dict[str, Any]) -> Span | None:
+        """Open a child of the current span; ``None`` off the owning thread."""
+        if threading.get_ident() != self._thread:
+            return None
+        node = Span(name, attrs)
+        self.current.children.append(node)
+        self._stack.append(node)
+        return node
+
+    def pop(self, node: Span) -> None:
+        """Close *node* (and anything left open inside it)."""
+        node.finish()
+        while len(self._stack) > 1 and self._stack.pop() is not node:
+            pass
+
+    def report(self) -> dict[str, Any]:
+        """Return the merged timing tree with invocation-wide counter totals."""
+        if not self.root.duration_ms:
+            self.root.finish()
+        totals: dict[str, int] = {}
+        _accumulate_counts(self.root, totals)
+        return {
+            "correlation_id": self.correlation_id,
+            "total_ms": round(self.root.duration_ms, 3),
+            "totals": dict(sorted(totals.items())),
+            "tree": _merge_nodes([self.root])[0],
+        }
+
+
+def _accumulate_counts(node: Span, totals: dict[str, int]) -> None:
+    for key, value in node.counts.items():
+        totals[key] = totals.get(key, 0) + value
+    for child in node.children:
+        _accumulate_counts(child, totals)
+
+
+def _merge_nodes(nodes: list[Span]) -> list[dict[str, Any]]:
+    """Merge same-named siblings, preserving first-seen order."""
+    groups: dict[str, list[Span]] = {}
+    for node in nodes:
+        groups.setdefault(node.name, []).append(node)
+    merged: list[dict[str, Any]] = []
+    for name, group in groups.items():
+        entry: dict[str, Any] = {
+            "name": name,
+            "calls": len(group),
+            "duration_ms": round(sum(n.duration_ms for n in group), 3),
+        }
+        if len(group) == 1 and group[0].attrs:
+            entry["attrs"] = group[0].attrs
+        counts: dict[str, int] = {}
+        for node in group:
+            for key, value in node.counts.items():
+                counts[key] = counts.get(key, 0) + value
+        if counts:
+            entry["counts"] = dict(sorted(counts.items()))
+        children = [child for node in group for child in node.children]
+        if children:
+            entry["children"] = _merge_nodes(children)
+        merged.append(entry)
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instrumentation API
+# ---------------------------------------------------------------------------
+
+_active: Profiler | None = None
+
+
+def start_profiling(correlation_id: str, *, command: str = "") -> Profiler:
+    """Install a profiler for this process; instrumentation starts recording."""
+    global _active  # noqa: PLW0603
+    _active = Profiler(correlation_id, command=command)
+    return _active
+
+
+def stop_profiling() -> Profiler | None:
+    """Uninstall and return the active profiler (``None`` if none was running)."""
+    global _active  # noqa: PLW0603
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.root.finish()
+    return profiler
+
+
+def active_profiler() -> Profiler | None:
+    """Return the running profiler, if any."""
+    return _active
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Generator[None]:
+    """Time the enclosed block as a named phase of the active profile."""
+    profiler = _active
+    node = profiler.push(name, attrs) if profiler is not None else None
+    if profiler is None or node is None:
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.pop(node)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add *n* to counter *name* on the innermost open span."""
+    profiler = _active
+    if profiler is not None:
+        counts = profiler.current.counts
+        counts[name] = counts.get(name, 0) + n
@@ -559,10 +559,14 @@ def run_eval(project_root: Path) -> QualityResult:
         QualityResult with eval suite output.
 
     """
+    from gzkit.cache import cache_file
     from gzkit.eval.runner import run_eval_suite
 
     try:
-        result = run_eval_suite(data_dir=project_root / "data" / "eval")
+        result = run_eval_suite(
+            data_dir=project_root / "data" / "eval",
+            cache_path=cache_file(project_root, "eval_cases.json"),
+        )
         lines = [
             f"Eval suite: {result.surfaces_scored} surfaces scored",
             f"Overall score: {result.overall_score}/4.0",
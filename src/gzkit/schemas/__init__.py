@@ -6,12 +6,31 @@ This package contains schemas for validating:
 - ADR documents (frontmatter + headers)
 - Brief documents (frontmatter + headers)
 - AGENTS.md (required sections)
+
+Schemas are registered process-wide: each one is read and parsed once, and
+its ``Draft202012Validator`` is compiled (``check_schema`` included) once.
+Packaged schemas are keyed by name and schema files by resolved path; a
+schema file that changed on disk replaces its previous entry.
+The returned schema dictionaries are shared and must be treated as
+read-only.
 """
 
 import json
+import threading
 from importlib.resources import files
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+_lock = threading.Lock()
+_schemas: dict[str, dict[str, Any]] = {}
+_schema_validators: dict[str, "Validator"] = {}
+# Per resolved path: the stamp the schema was read at, the schema, and its
+# validator once compiled. A reload replaces the whole entry, so a stale
+# schema and validator are dropped together.
+_file_schemas: dict[Path, tuple[tuple[int, int], dict[str, Any], "Validator | None"]] = {}
 
 
 def load_schema(name: str) -> dict[str, Any]:
@@ -21,15 +40,86 @@ def load_schema(name: str) -> dict[str, Any]:
         name: Schema name without .json extension (e.g., 'manifest', 'prd', 'adr')
 
     Returns:
-        Parsed JSON schema as a dictionary.
+        Parsed JSON schema as a dictionary (shared; do not mutate).
 
     Raises:
         FileNotFoundError: If schema file doesn't exist.
 
     """
-    schema_dir = files("gzkit.schemas")
-    schema_file = schema_dir.joinpath(f"{name}.json")
-    return json.loads(schema_file.read_text(encoding="utf-8"))
+    schema = _schemas.get(name)
+    if schema is None:
+        schema_dir = files("gzkit.schemas")
+        schema_file = schema_dir.joinpath(f"{name}.json")
+        schema = json.loads(schema_file.read_text(encoding="utf-8"))
+        with _lock:
+            schema = _schemas.setdefault(name, schema)
+    return schema
+
+
+def load_schema_file(path: Path) -> dict[str, Any]:
+    """Load a JSON schema from *path* (e.g. ``data/schemas/*.schema.json``).
+
+    Parsed once per process and re-read only if the file's mtime or size
+    changes.
+
+    Raises:
+        FileNotFoundError: If the schema file doesn't exist.
+
+    """
+    resolved = path.resolve()
+    st = resolved.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _file_schemas.get(resolved)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    schema = json.loads(resolved.read_text(encoding="utf-8"))
+    with _lock:
+        _file_schemas[resolved] = (key, schema, None)
+    return schema
+
+
+def compiled_validator(schema: dict[str, Any]) -> "Validator":
+    """Check *schema* and compile a ``Draft202012Validator`` for it.
+
+    Not cached; use :func:`schema_validator` / :func:`schema_file_validator`
+    for registry schemas, whose validators are compiled once.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+
+    """
+    from jsonschema import Draft202012Validator  # noqa: PLC0415
+
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
+def schema_validator(name: str) -> "Validator":
+    """Return the compiled validator for the packaged schema *name*."""
+    validator = _schema_validators.get(name)
+    if validator is None:
+        compiled = compiled_validator(load_schema(name))
+        with _lock:
+            validator = _schema_validators.setdefault(name, compiled)
+    return validator
+
+
+def schema_file_validator(path: Path) -> "Validator":
+    """Return the compiled validator for the schema file at *path*.
+
+    Recompiled only when the file's mtime or size changes.
+    """
+    resolved = path.resolve()
+    schema = load_schema_file(resolved)
+    entry = _file_schemas.get(resolved)
+    if entry is not None and entry[1] is schema and entry[2] is not None:
+        return entry[2]
+    validator = compiled_validator(schema)
+    with _lock:
+        current = _file_schemas.get(resolved)
+        if current is not None and current[1] is schema:
+            _file_schemas[resolved] = (current[0], schema, validator)
+    return validator
 
 
 def get_schema_path(name: str) -> Path:
@@ -46,4 +136,11 @@ def get_schema_path(name: str) -> Path:
     return Path(str(schema_dir.joinpath(f"{name}.json")))
 
 
-__all__ = ["load_schema", "get_schema_path"]
+__all__ = [
+    "compiled_validator",
+    "get_schema_path",
+    "load_schema",
+    "load_schema_file",
+    "schema_file_validator",
+    "schema_validator",
+]
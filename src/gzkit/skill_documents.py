@@ -0,0 +1,118 @@
+"""Shared SKILL.md parses for the skill audit.
+
+The audit looks at every skill in the canonical root and in three mirror
+roots, and mirrors are meant to be byte-identical to canonical. Parses are
+therefore keyed by content hash: each distinct SKILL.md is parsed once per
+run and every copy of it reuses that result. A per-project cache in
+``.gzkit/cache/skill_parse.json`` maps ``(path, mtime_ns, size)`` to the
+content hash, so a repeat audit of an unchanged tree reads no SKILL.md at all.
+"""
+
+import hashlib
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from gzkit.cache import cache_file, read_json_cache, write_json_cache
+
+SKILL_PARSE_CACHE_SCHEMA = "gzkit.skill_parse.v1"
+
+
+class SkillDocument(BaseModel):
+    """Parsed view of one SKILL.md used by the audit."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    frontmatter: dict[str, str] = Field(default_factory=dict)
+    body_sha256: str = Field(..., description="SHA-256 of the stripped markdown body")
+
+
+def parse_skill_document(content: str) -> SkillDocument:
+    """Parse SKILL.md *content* into frontmatter and a body digest."""
+    # Late import: gzkit.skills re-exports audit_skills, which imports this module.
+    from gzkit.skills import _parse_frontmatter  # noqa: PLC0415
+
+    frontmatter, body = _parse_frontmatter(content)
+    digest = hashlib.sha256(body.strip().encode("utf-8")).hexdigest()
+    return SkillDocument(frontmatter=frontmatter, body_sha256=digest)
+
+
+_MISSING = SkillDocument(body_sha256=hashlib.sha256(b"").hexdigest())
+
+
+class SkillDocuments:
+    """Per-run SKILL.md parse memo backed by an optional on-disk stat cache."""
+
+    def __init__(self, project_root: Path | None = None) -> None:
+        self._root = project_root
+        self._cache_path = cache_file(project_root, "skill_parse.json") if project_root else None
+        self._files: dict[str, tuple[int, int, str]] = {}
+        self._parses: dict[str, SkillDocument] = {}
+        self._memo: dict[Path, SkillDocument] = {}
+        self._dirty = False
+        if self._cache_path is not None:
+            self._load(read_json_cache(self._cache_path, SKILL_PARSE_CACHE_SCHEMA) or {})
+
+    def _load(self, payload: dict) -> None:
+        for digest, raw in payload.get("parses", {}).items():
+            try:
+                self._parses[digest] = SkillDocument.model_validate(raw)
+            except ValidationError:
+                continue
+        for key, record in payload.get("files", {}).items():
+            if isinstance(record, list) and len(record) == 3 and record[2] in self._parses:
+                self._files[key] = (record[0], record[1], record[2])
+
+    def _key(self, skill_file: Path) -> str:
+        if self._root is not None and skill_file.is_relative_to(self._root):
+            return skill_file.relative_to(self._root).as_posix()
+        return skill_file.as_posix()
+
+    def get(self, skill_file: Path) -> SkillDocument:
+        """Return the parse of *skill_file* (an empty document when unreadable)."""
+        cached = self._memo.get(skill_file)
+        if cached is not None:
+            return cached
+        doc = self._resolve(skill_file)
+        self._memo[skill_file] = doc
+        return doc
+
+    def share(self, skill_file: Path, doc: SkillDocument) -> None:
+        """Record *doc* for *skill_file*, known to hold identical content."""
+        self._memo[skill_file] = doc
+
+    def _resolve(self, skill_file: Path) -> SkillDocument:
+        try:
+            st = skill_file.stat()
+        except OSError:
+            return _MISSING
+        key = self._key(skill_file)
+        record = self._files.get(key)
+        if record is not None and record[:2] == (st.st_mtime_ns, st.st_size):
+            return self._parses[record[2]]
+        try:
+            data = skill_file.read_bytes()
+        except OSError:
+            return _MISSING
+        digest = hashlib.sha256(data).hexdigest()
+        doc = self._parses.get(digest)
+        if doc is None:
+            # Match read_text(): universal newlines, strict UTF-8.
+            text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            doc = parse_skill_document(text)
+            self._parses[digest] = doc
+        self._files[key] = (st.st_mtime_ns, st.st_size, digest)
+        self._dirty = True
+        return doc
+
+    def save(self) -> None:
+        """Persist the stat cache when this run learned anything new."""
+        if self._cache_path is None or not self._dirty:
+            return
+        live = {record[2] for record in self._files.values()}
+        payload = {
+            "files": {key: list(record) for key, record in sorted(self._files.items())},
+            "parses": {d: self._parses[d].model_dump() for d in sorted(live)},
+        }
+        write_json_cache(self._cache_path, SKILL_PARSE_CACHE_SCHEMA, payload)
+        self._dirty = False
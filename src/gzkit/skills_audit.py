@@ -8,7 +8,8 @@ from datetime import date, timedelta
 from pathlib import Path
 
 from gzkit.config import GzkitConfig
-from gzkit.skills import SkillAuditIssue, SkillAuditReport, _parse_frontmatter
+from gzkit.skill_documents import SkillDocuments
+from gzkit.skills import SkillAuditIssue, SkillAuditReport
 
 KEBAB_CASE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 LIFECYCLE_STATES = {"draft", "active", "deprecated", "retired"}
@@ -77,16 +78,6 @@ def _skill_dirs(root: Path) -> dict[str, Path]:
     return {path.name: path for path in root.iterdir() if path.is_dir()}
 
 
-def _read_frontmatter(skill_file: Path) -> dict[str, str]:
-    """Read frontmatter from a SKILL.md file."""
-    try:
-        content = skill_file.read_text(encoding="utf-8")
-    except OSError:
-        return {}
-    frontmatter, _ = _parse_frontmatter(content)
-    return frontmatter
-
-
 def _append_audit_issue(
     issues: list[SkillAuditIssue],
     project_root: Path,
@@ -543,6 +534,7 @@ def _validate_canonical_skill(
     skill_name: str,
     skill_dir: Path,
     max_review_age_days: int,
+    docs: SkillDocuments,
 ) -> None:
     """Validate one canonical skill directory and SKILL metadata."""
     if not KEBAB_CASE_RE.match(skill_name):
@@ -565,7 +557,7 @@ def _validate_canonical_skill(
         )
         return
 
-    frontmatter = _read_frontmatter(skill_file)
+    frontmatter = docs.get(skill_file).frontmatter
     if not frontmatter:
         _append_audit_issue(
             issues,
@@ -587,7 +579,11 @@ def audit_skills(
     config: GzkitConfig | None = None,
     max_review_age_days: int = DEFAULT_MAX_REVIEW_AGE_DAYS,
 ) -> SkillAuditReport:
-    """Audit skill naming, metadata, and canonical/mirror parity."""
+    """Audit skill naming, metadata, and canonical/mirror parity.
+
+    SKILL.md parses are shared across roots and cached on disk (see
+    ``gzkit.skill_documents``), so re-auditing an unchanged tree reads no SKILL.md.
+    """
     # Late import to avoid circular dependency (skills_mirror imports from skills_audit).
     from gzkit.skills_mirror import validate_mirror_root
 
@@ -618,19 +614,19 @@ def audit_skills(
             "Canonical skills root has no skill directories.",
         )
 
+    docs = SkillDocuments(project_root)
     checked_skills = len(canonical_dirs)
     for skill_name, skill_dir in sorted(canonical_dirs.items()):
-        _validate_canonical_skill(project_root, issues, skill_name, skill_dir, max_review_age_days)
+        _validate_canonical_skill(
+            project_root, issues, skill_name, skill_dir, max_review_age_days, docs
+        )
 
     # Manpage coverage for active skills (only when skills index exists)
     index_file = project_root / SKILL_INDEX_PATH
     if index_file.exists():
         index_content = index_file.read_text(encoding="utf-8")
         for skill_name, skill_dir in sorted(canonical_dirs.items()):
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.exists():
-                continue
-            fm = _read_frontmatter(skill_file)
+            fm = docs.get(skill_dir / "SKILL.md").frontmatter
             if fm and fm.get("lifecycle_state") == "active":
                 _validate_skill_manpage(project_root, issues, skill_name, index_content)
 
@@ -640,7 +636,8 @@ def audit_skills(
         config.paths.copilot_skills,
     )
     for root_name in mirror_roots:
-        validate_mirror_root(project_root, issues, root_paths[root_name], canonical_dirs)
+        validate_mirror_root(project_root, issues, root_paths[root_name], canonical_dirs, docs=docs)
+    docs.save()
 
     issues = sorted(issues, key=lambda issue: (issue.path, issue.code, issue.message))
     valid = not any(issue.blocking for issue in issues)
@@ -7,7 +7,9 @@ and non-SKILL.md supporting files must all agree with canonical.
 
 from pathlib import Path
 
-from gzkit.skills import SkillAuditIssue, _parse_frontmatter
+from gzkit.mirror_manifest import MirrorEntry, load_mirror_manifest, stat_parity
+from gzkit.skill_documents import SkillDocuments
+from gzkit.skills import SkillAuditIssue
 from gzkit.skills_audit import (
     KEBAB_CASE_RE,
     SKILL_CAPABILITY_FIELDS,
@@ -16,7 +18,6 @@ from gzkit.skills_audit import (
     SKILL_REQUIRED_FIELDS,
     SKILL_TRANSITION_FIELDS,
     _append_audit_issue,
-    _read_frontmatter,
     _skill_dirs,
 )
 
@@ -27,6 +28,7 @@ def _validate_mirror_skill(
     name: str,
     canonical_dir: Path,
     mirror_dir: Path,
+    docs: SkillDocuments,
 ) -> None:
     """Validate one mirrored skill against its canonical source."""
     mirrored_fields = list(SKILL_REQUIRED_FIELDS)
@@ -42,8 +44,13 @@ def _validate_mirror_skill(
         )
         return
 
-    canonical_frontmatter = _read_frontmatter(canonical_file)
-    mirror_frontmatter = _read_frontmatter(mirror_file)
+    manifest = _mirror_manifest_for(project_root, mirror_dir)
+    canonical_doc = docs.get(canonical_file)
+    if stat_parity(canonical_file, mirror_file, manifest.get(f"{mirror_dir.name}/SKILL.md")):
+        docs.share(mirror_file, canonical_doc)
+    mirror_doc = docs.get(mirror_file)
+    canonical_frontmatter = canonical_doc.frontmatter
+    mirror_frontmatter = mirror_doc.frontmatter
     if not mirror_frontmatter:
         _append_audit_issue(
             issues,
@@ -101,42 +108,20 @@ def _validate_mirror_skill(
             f"Mirror field drift for '{field}' compared to canonical skill '{name}'.",
         )
 
-    _validate_mirror_skill_body(project_root, issues, name, canonical_file, mirror_file)
+    if canonical_doc.body_sha256 != mirror_doc.body_sha256:
+        _append_audit_issue(
+            issues,
+            project_root,
+            "SKA-MIRROR-BODY-DRIFT",
+            mirror_file,
+            (
+                f"Mirror SKILL.md body drift for canonical skill '{name}'. "
+                "Run `uv run gz agent sync control-surfaces` to repair."
+            ),
+        )
     _validate_mirror_skill_assets(project_root, issues, name, canonical_dir, mirror_dir)
 
 
-def _read_skill_body(skill_file: Path) -> str:
-    """Return the body of a SKILL.md file after its YAML frontmatter."""
-    try:
-        content = skill_file.read_text(encoding="utf-8")
-    except OSError:
-        return ""
-    _, body = _parse_frontmatter(content)
-    return body.strip()
-
-
-def _validate_mirror_skill_body(
-    project_root: Path,
-    issues: list[SkillAuditIssue],
-    name: str,
-    canonical_file: Path,
-    mirror_file: Path,
-) -> None:
-    """Compare the markdown body of canonical and mirror SKILL.md files."""
-    if _read_skill_body(canonical_file) == _read_skill_body(mirror_file):
-        return
-    _append_audit_issue(
-        issues,
-        project_root,
-        "SKA-MIRROR-BODY-DRIFT",
-        mirror_file,
-        (
-            f"Mirror SKILL.md body drift for canonical skill '{name}'. "
-            "Run `uv run gz agent sync control-surfaces` to repair."
-        ),
-    )
-
-
 def _collect_package_files(skill_dir: Path) -> dict[str, Path]:
     """Return mapping of rel-posix-path to absolute path for all files below skill_dir.
 
@@ -156,6 +141,15 @@ def _collect_package_files(skill_dir: Path) -> dict[str, Path]:
     return package
 
 
+def _mirror_manifest_for(project_root: Path, mirror_dir: Path) -> dict[str, MirrorEntry]:
+    """Return the sync manifest of the mirror root containing *mirror_dir*."""
+    try:
+        mirror_root = mirror_dir.parent.relative_to(project_root).as_posix()
+    except ValueError:
+        return {}
+    return load_mirror_manifest(project_root, mirror_root)
+
+
 def _validate_mirror_skill_assets(
     project_root: Path,
     issues: list[SkillAuditIssue],
@@ -163,7 +157,11 @@ def _validate_mirror_skill_assets(
     canonical_dir: Path,
     mirror_dir: Path,
 ) -> None:
-    """Ensure every canonical supporting file exists in the mirror with matching bytes."""
+    """Ensure every canonical supporting file exists in the mirror with matching bytes.
+
+    Assets whose stat stamps match the mirror manifest written by sync (or
+    that are hardlinked to the canonical file) are accepted without reading.
+    """
     canonical_assets = _collect_package_files(canonical_dir)
     mirror_assets = _collect_package_files(mirror_dir)
 
@@ -189,7 +187,11 @@ def _validate_mirror_skill_assets(
             blocking=False,
         )
 
+    manifest = _mirror_manifest_for(project_root, mirror_dir)
     for rel in sorted(set(canonical_assets) & set(mirror_assets)):
+        entry = manifest.get(f"{mirror_dir.name}/{rel}")
+        if stat_parity(canonical_assets[rel], mirror_assets[rel], entry):
+            continue
         try:
             canonical_bytes = canonical_assets[rel].read_bytes()
             mirror_bytes = mirror_assets[rel].read_bytes()
@@ -214,12 +216,16 @@ def validate_mirror_root(
     issues: list[SkillAuditIssue],
     mirror_root: Path,
     canonical_dirs: dict[str, Path],
+    *,
+    docs: SkillDocuments | None = None,
 ) -> None:
     """Validate mirror parity for one mirror root.
 
     Retired skills are excluded from mirror expectations — they should not
     be mirrored and their presence in a mirror is a non-blocking warning.
     """
+    if docs is None:
+        docs = SkillDocuments()
     mirror_dirs = _skill_dirs(mirror_root)
     for name, path in sorted(mirror_dirs.items()):
         if KEBAB_CASE_RE.match(name):
@@ -236,7 +242,7 @@ def validate_mirror_root(
     retired = {
         name
         for name, path in canonical_dirs.items()
-        if (fm := _read_frontmatter(path / "SKILL.md")) and fm.get("lifecycle_state") == "retired"
+        if docs.get(path / "SKILL.md").frontmatter.get("lifecycle_state") == "retired"
     }
     canonical_names = set(canonical_dirs.keys()) - retired
     mirror_names = set(mirror_dirs.keys())
@@ -261,4 +267,6 @@ def validate_mirror_root(
 
     shared_names = sorted(canonical_names & mirror_names)
     for name in shared_names:
-        _validate_mirror_skill(project_root, issues, name, canonical_dirs[name], mirror_dirs[name])
+        _validate_mirror_skill(
+            project_root, issues, name, canonical_dirs[name], mirror_dirs[name], docs
+        )
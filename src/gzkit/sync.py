@@ -11,6 +11,8 @@ This module provides the public API. Implementation is split across:
 import re
 from pathlib import Path
 
+from gzkit import profiling
+
 # Re-export rules-based functions (originally imported and re-exported here)
 from gzkit.rules import sync_claude_rules as sync_claude_rules  # noqa: F401
 from gzkit.rules import sync_nested_agents_md as sync_nested_agents_md  # noqa: F401
@@ -214,6 +216,7 @@ def detect_project_structure(project_root: Path) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
+@profiling.span("artifact_scan")
 def scan_existing_artifacts(project_root: Path, design_root: str) -> dict[str, list[Path]]:
     """Scan for existing PRD, ADR, and OBPI files in the design directory.
 
@@ -349,6 +352,7 @@ def parse_artifact_metadata(file_path: Path) -> dict[str, str]:
     """
     result: dict[str, str] = {"id": file_path.stem}
 
+    profiling.count("file_reads")
     try:
         content = file_path.read_text(encoding="utf-8")
     except OSError:
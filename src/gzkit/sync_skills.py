@@ -8,6 +8,13 @@ import re
 from pathlib import Path
 
 from gzkit.config import GzkitConfig
+from gzkit.mirror_manifest import (
+    MirrorEntry,
+    MirrorMode,
+    load_mirror_manifest,
+    save_mirror_manifest,
+    sync_mirror_file,
+)
 
 # ---------------------------------------------------------------------------
 # Skill constants
@@ -296,17 +303,22 @@ def sync_skill_mirror(
     target_dir: str,
     *,
     exclude_dirs: set[str] | None = None,
+    mode: MirrorMode = "copy",
 ) -> list[str]:
     """Copy canonical skills into a tool-local mirror directory.
 
     This is intentionally additive/non-destructive: files are copied/updated,
     but extra files already present in the mirror are preserved.
 
+    Files whose canonical and mirror stat stamps match the mirror manifest
+    (see ``gzkit.mirror_manifest``) are skipped without being read.
+
     Args:
         project_root: Project root directory.
         source_dir: Canonical skills path.
         target_dir: Tool-local mirrored skills path.
         exclude_dirs: Top-level directory names to skip (e.g. retired skills).
+        mode: ``copy`` (default), ``hardlink`` or ``reflink`` materialization.
 
     Returns:
         List of mirrored files that were written.
@@ -317,6 +329,8 @@ def sync_skill_mirror(
     if not source_root.exists():
         return []
 
+    manifest = load_mirror_manifest(project_root, target_dir)
+    entries: dict[str, MirrorEntry] = {}
     updated: list[str] = []
     for source_file in sorted(source_root.rglob("*")):
         if not source_file.is_file():
@@ -326,16 +340,14 @@ def sync_skill_mirror(
         if exclude_dirs and relative_path.parts and relative_path.parts[0] in exclude_dirs:
             continue
 
+        rel = relative_path.as_posix()
         target_file = target_root / relative_path
-        target_file.parent.mkdir(parents=True, exist_ok=True)
-
-        source_bytes = source_file.read_bytes()
-        if target_file.exists() and target_file.read_bytes() == source_bytes:
-            continue
-
-        target_file.write_bytes(source_bytes)
-        updated.append(target_file.relative_to(project_root).as_posix())
+        entries[rel], written = sync_mirror_file(source_file, target_file, manifest.get(rel), mode)
+        if written:
+            updated.append(target_file.relative_to(project_root).as_posix())
 
+    if entries != manifest:
+        save_mirror_manifest(project_root, target_dir, entries)
     return updated
 
 
@@ -555,7 +567,13 @@ def sync_skill_mirrors(
                 continue
         seen.add(target)
         updated.extend(
-            sync_skill_mirror(project_root, config.paths.skills, target, exclude_dirs=retired)
+            sync_skill_mirror(
+                project_root,
+                config.paths.skills,
+                target,
+                exclude_dirs=retired,
+                mode=config.skills.mirror_mode,
+            )
         )
     return updated
 
@@ -11,6 +11,7 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
+from gzkit import profiling
 from gzkit.config import GzkitConfig
 from gzkit.hooks.claude import generate_claude_settings, setup_claude_hooks
 from gzkit.hooks.copilot import generate_copilotignore, setup_copilot_hooks
@@ -576,66 +577,73 @@ def sync_all(project_root: Path, config: GzkitConfig | None = None) -> list[str]
     vendor_aware = _has_manifest_vendors(project_root)
 
     # Generate manifest
-    manifest = generate_manifest(project_root, config)
-    write_manifest(project_root, manifest)
+    with profiling.span("sync.manifest"):
+        manifest = generate_manifest(project_root, config)
+        write_manifest(project_root, manifest)
     updated.append(".gzkit/manifest.json")
 
     # Migrate legacy skill layouts into canonical path when needed.
     updated.extend(bootstrap_canonical_skills(project_root, config))
 
     # Vendor-neutral surfaces (always generated)
-    sync_agents_md(project_root, config)
-    updated.append(config.paths.agents_md)
-    updated.extend(sync_nested_agents_md(project_root, config))
+    with profiling.span("sync.agents_md"):
+        sync_agents_md(project_root, config)
+        updated.append(config.paths.agents_md)
+        updated.extend(sync_nested_agents_md(project_root, config))
 
     # Load canonical rules once for all vendor renderers
     canonical_rules_dir = project_root / ".gzkit" / "rules"
-    canonical_rules = load_rules(canonical_rules_dir) if canonical_rules_dir.is_dir() else []
+    with profiling.span("sync.load_rules"):
+        canonical_rules = load_rules(canonical_rules_dir) if canonical_rules_dir.is_dir() else []
 
     # Claude surfaces
     if not vendor_aware or config.vendors.claude.enabled:
-        sync_claude_md(project_root, config)
-        updated.append(config.paths.claude_md)
+        with profiling.span("sync.claude"):
+            sync_claude_md(project_root, config)
+            updated.append(config.paths.claude_md)
 
-        if canonical_rules:
-            rendered = render_rules_to_dir(
-                canonical_rules, project_root / config.paths.claude_rules, "claude"
-            )
-            updated.extend(rendered)
-        else:
-            updated.extend(sync_claude_rules(project_root, config))
+            if canonical_rules:
+                rendered = render_rules_to_dir(
+                    canonical_rules, project_root / config.paths.claude_rules, "claude"
+                )
+                updated.extend(rendered)
+            else:
+                updated.extend(sync_claude_rules(project_root, config))
 
-        sync_claude_settings(project_root, config)
-        updated.append(config.paths.claude_settings)
-        updated.extend(setup_claude_hooks(project_root, config))
+            sync_claude_settings(project_root, config)
+            updated.append(config.paths.claude_settings)
+            updated.extend(setup_claude_hooks(project_root, config))
 
     # Copilot surfaces
     if not vendor_aware or config.vendors.copilot.enabled:
-        if canonical_rules:
-            rendered = render_rules_to_dir(
-                canonical_rules,
-                project_root / ".github" / "instructions",
-                "copilot",
-            )
-            updated.extend(rendered)
-        else:
-            sync_copilot_instructions(project_root, config)
-            updated.append(config.paths.copilot_instructions)
+        with profiling.span("sync.copilot"):
+            if canonical_rules:
+                rendered = render_rules_to_dir(
+                    canonical_rules,
+                    project_root / ".github" / "instructions",
+                    "copilot",
+                )
+                updated.extend(rendered)
+            else:
+                sync_copilot_instructions(project_root, config)
+                updated.append(config.paths.copilot_instructions)
 
-        sync_discovery_index(project_root, config)
-        updated.append(config.paths.discovery_index)
+            sync_discovery_index(project_root, config)
+            updated.append(config.paths.discovery_index)
 
-        sync_copilotignore(project_root)
-        updated.append(".copilotignore")
+            sync_copilotignore(project_root)
+            updated.append(".copilotignore")
 
-        updated.extend(setup_copilot_hooks(project_root, config))
+            updated.extend(setup_copilot_hooks(project_root, config))
 
     # Vendor-aware skill mirrors
-    mirrored = sync_skill_mirrors(project_root, config, vendor_aware=vendor_aware)
+    with profiling.span("sync.skill_mirrors"):
+        mirrored = sync_skill_mirrors(project_root, config, vendor_aware=vendor_aware)
     updated.extend(mirrored)
 
     # Vendor-aware persona mirrors
-    persona_mirrored = sync_persona_mirrors(project_root, config, vendor_aware=vendor_aware)
+    with profiling.span("sync.persona_mirrors"):
+        persona_mirrored = sync_persona_mirrors(project_root, config, vendor_aware=vendor_aware)
     updated.extend(persona_mirrored)
 
     # Normalize to forward-slash POSIX form so cross-platform consumers
@@ -8,6 +8,8 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from gzkit import profiling
+
 if TYPE_CHECKING:
     from gzkit.events import EventAnchor
 
@@ -33,7 +35,9 @@ def run_exec(cmd: list[str], cwd: Path, timeout: int | None = None) -> tuple[int
 
 def git_cmd(project_root: Path, *args: str) -> tuple[int, str, str]:
     """Run git command in project root."""
-    return run_exec(["git", *args], cwd=project_root)
+    with profiling.span("git", subcommand=args[0] if args else ""):
+        profiling.count("git_calls")
+        return run_exec(["git", *args], cwd=project_root)
 
 
 _git_cache: dict[str, str | None] = {}
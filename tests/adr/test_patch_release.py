@@ -159,30 +159,43 @@ class TestDiscoverGhis(unittest.TestCase):
 
 
 # ---------------------------------------------------------------------------
-# Test: _ghi_has_src_commits
+# Test: _src_commit_ghi_refs
 # ---------------------------------------------------------------------------
 
 
-class TestGhiHasSrcCommits(unittest.TestCase):
-    """Verify commit-to-src/gzkit/ diff detection."""
+class TestSrcCommitGhiRefs(unittest.TestCase):
+    """Verify the single-pass collection of GHI refs from src/gzkit/ commits."""
 
-    @patch("gzkit.commands.patch_release.git_cmd", return_value=(0, "abc1234", ""))
-    def test_commits_touching_src(self, _mock: object) -> None:
-        from gzkit.commands.patch_release import _ghi_has_src_commits
+    @patch(
+        "gzkit.commands.patch_release.git_cmd",
+        return_value=(0, "abc1234\x00Fix crash (#42)\n\nRefs #7, #123\n\ndef5678\x00Docs\n", ""),
+    )
+    def test_collects_refs_in_one_git_call(self, mock_git: unittest.mock.MagicMock) -> None:
+        from gzkit.commands.patch_release import _src_commit_ghi_refs
+
+        self.assertEqual(_src_commit_ghi_refs(_PROJECT_ROOT), {7, 42, 123})
+        mock_git.assert_called_once()
+        self.assertIn("src/gzkit/", mock_git.call_args.args)
+
+    @patch("gzkit.commands.patch_release.git_cmd", return_value=(0, "abc\x00Refs #123\n", ""))
+    def test_refs_match_whole_numbers(self, _mock: object) -> None:
+        from gzkit.commands.patch_release import _src_commit_ghi_refs
 
-        self.assertTrue(_ghi_has_src_commits(_PROJECT_ROOT, 42))
+        refs = _src_commit_ghi_refs(_PROJECT_ROOT)
+        self.assertNotIn(12, refs)
+        self.assertIn(123, refs)
 
     @patch("gzkit.commands.patch_release.git_cmd", return_value=(0, "", ""))
     def test_no_commits(self, _mock: object) -> None:
-        from gzkit.commands.patch_release import _ghi_has_src_commits
+        from gzkit.commands.patch_release import _src_commit_ghi_refs
 
-        self.assertFalse(_ghi_has_src_commits(_PROJECT_ROOT, 42))
+        self.assertEqual(_src_commit_ghi_refs(_PROJECT_ROOT), set())
 
     @patch("gzkit.commands.patch_release.git_cmd", return_value=(1, "", "error"))
     def test_git_error(self, _mock: object) -> None:
-        from gzkit.commands.patch_release import _ghi_has_src_commits
+        from gzkit.commands.patch_release import _src_commit_ghi_refs
 
-        self.assertFalse(_ghi_has_src_commits(_PROJECT_ROOT, 42))
+        self.assertEqual(_src_commit_ghi_refs(_PROJECT_ROOT), set())
 
 
 # ---------------------------------------------------------------------------
@@ -210,11 +223,7 @@ class TestClassifyGhi(unittest.TestCase):
         for labels, has_diff, expected_status, has_warning in self._CASES:
             with self.subTest(labels=labels, has_diff=has_diff):
                 ghi = GhiRecord(number=99, title="Test", closed_at="2026-04-01", labels=labels)
-                with patch(
-                    "gzkit.commands.patch_release._ghi_has_src_commits",
-                    return_value=has_diff,
-                ):
-                    result = _classify_ghi(_PROJECT_ROOT, ghi)
+                result = _classify_ghi(ghi, {99} if has_diff else set())
 
                 self.assertEqual(result.status, expected_status)
                 self.assertEqual(result.has_runtime_label, "runtime" in labels)
@@ -230,8 +239,7 @@ class TestClassifyGhi(unittest.TestCase):
         from gzkit.commands.patch_release import GhiRecord, _classify_ghi
 
         ghi = GhiRecord(number=55, title="Labeled", closed_at="2026-04-01", labels=["runtime"])
-        with patch("gzkit.commands.patch_release._ghi_has_src_commits", return_value=False):
-            result = _classify_ghi(_PROJECT_ROOT, ghi)
+        result = _classify_ghi(ghi, set())
         self.assertIn("no commits touching src/gzkit/", result.warning)
 
     def test_diff_only_warning_text(self) -> None:
@@ -239,8 +247,7 @@ class TestClassifyGhi(unittest.TestCase):
         from gzkit.commands.patch_release import GhiRecord, _classify_ghi
 
         ghi = GhiRecord(number=56, title="Diffed", closed_at="2026-04-01", labels=[])
-        with patch("gzkit.commands.patch_release._ghi_has_src_commits", return_value=True):
-            result = _classify_ghi(_PROJECT_ROOT, ghi)
+        result = _classify_ghi(ghi, {56})
         self.assertIn("no 'runtime' label", result.warning)
 
 
@@ -257,10 +264,9 @@ def _build_mock_git_cmd(tag_output: str, tag_date: str, src_commits: dict[int, b
             return (0, tag_output, "")
         if args[0] == "log" and "--format=%aI" in args:
             return (0, tag_date, "")
-        if args[0] == "log" and "--grep" in args:
-            ghi_num_str = args[args.index("--grep") + 1].lstrip("#")
-            has = src_commits.get(int(ghi_num_str), False)
-            return (0, "abc1234" if has else "", "")
+        if args[0] == "log" and "--format=%H%x00%B" in args:
+            bodies = [f"abc{n}\x00Fix #{n}\n" for n, has in src_commits.items() if has]
+            return (0, "".join(bodies), "")
         return (0, "", "")
 
     return _side_effect
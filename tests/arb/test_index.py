@@ -0,0 +1,119 @@
+"""Tests for gzkit.arb.index (receipt index and rollups)."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit.arb.advisor import collect_arb_advice
+from gzkit.arb.index import INDEX_NAME, ReceiptIndex, index_receipt
+from gzkit.arb.patterns import collect_patterns
+
+
+def _write_lint_receipt(
+    directory: Path,
+    name: str,
+    rules: list[str],
+    *,
+    exit_status: int = 1,
+    age: int = 0,
+) -> Path:
+    payload = {
+        "schema": "gzkit.arb.lint_receipt.v1",
+        "tool": {"name": "ruff", "version": "0.5.0"},
+        "run_id": name,
+        "timestamp_utc": "2026-04-14T00:00:00Z",
+        "git": {"commit": "abc1234"},
+        "findings": [
+            {"rule": rule, "path": f"{rule.lower()}.py", "line": 1, "message": "m"}
+            for rule in rules
+        ],
+        "findings_total": len(rules),
+        "exit_status": exit_status,
+    }
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    stamp = 1_700_000_000_000_000_000 - age * 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+    return path
+
+
+class TestReceiptIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _write_lint_receipt(self.root, "new", ["E501", "F401"], age=0)
+        _write_lint_receipt(self.root, "old", ["E501"], exit_status=0, age=10)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_records_are_ordered_newest_first(self) -> None:
+        index = ReceiptIndex.open(self.root)
+        self.assertEqual([r.file for r in index.recent(-1)], ["new.json", "old.json"])
+        self.assertEqual([r.run_id for r in index.recent(1)], ["new"])
+        self.assertTrue((self.root / INDEX_NAME).is_file())
+
+    def test_rollups_over_windows(self) -> None:
+        index = ReceiptIndex.open(self.root)
+        totals = index.totals
+        self.assertEqual((totals.scanned, totals.failed, totals.findings_total), (2, 1, 3))
+        self.assertEqual(totals.rule_counts["E501"], 2)
+        self.assertEqual(index.window(1).rule_counts["E501"], 1)
+
+    def test_reopen_reads_no_receipt(self) -> None:
+        ReceiptIndex.open(self.root)
+        with patch("gzkit.arb.index.summarize_receipt", side_effect=AssertionError("parsed")):
+            advice = collect_arb_advice(root=self.root)
+        self.assertEqual(advice.scanned_receipts, 2)
+
+    def test_new_edited_and_removed_receipts_are_reconciled(self) -> None:
+        ReceiptIndex.open(self.root)
+        _write_lint_receipt(self.root, "newer", ["B006"], age=-5)
+        (self.root / "old.json").unlink()
+        index = ReceiptIndex.open(self.root)
+        self.assertEqual([r.file for r in index.recent(-1)], ["newer.json", "new.json"])
+        lines = (self.root / INDEX_NAME).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 3)  # header + compacted records
+
+    def test_reporter_append_is_picked_up(self) -> None:
+        ReceiptIndex.open(self.root)
+        path = _write_lint_receipt(self.root, "appended", ["SIM108"], age=-1)
+        index_receipt(path)
+        with patch("gzkit.arb.index.summarize_receipt", side_effect=AssertionError("parsed")):
+            report = collect_patterns(root=self.root)
+        self.assertEqual(report.scanned_receipts, 3)
+
+    def test_corrupt_index_is_rebuilt(self) -> None:
+        (self.root / INDEX_NAME).write_text("garbage\n", encoding="utf-8")
+        self.assertEqual(len(ReceiptIndex.open(self.root)), 2)
+        header = (self.root / INDEX_NAME).read_text(encoding="utf-8").splitlines()[0]
+        self.assertIn("receipt_index", header)
+
+
+class TestValidatorUsesIndex(unittest.TestCase):
+    def test_schema_verdicts_are_cached_until_receipt_changes(self) -> None:
+        from gzkit.arb.validator import validate_receipts
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            path = _write_lint_receipt(root, "r1", ["E501"])
+            first = validate_receipts(root=root)
+            with patch(
+                "gzkit.arb.validator.schema_file_validator",
+                side_effect=AssertionError("revalidated"),
+            ):
+                second = validate_receipts(root=root)
+            self.assertEqual(first, second)
+
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload["exit_status"] = "not-int"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            third = validate_receipts(root=root)
+            self.assertEqual((first.valid, third.invalid), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+"""Tests for gz performance benchmarks."""
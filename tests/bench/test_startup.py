@@ -0,0 +1,123 @@
+"""Tests for the gz startup benchmark harness and import-time guardrail."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from gzkit.bench.startup import (
+    DEFAULT_BASELINE_PATH,
+    CommandSample,
+    ImportSample,
+    StartupReport,
+    compare_startup,
+    load_startup_baseline,
+    measure_command,
+    parse_importtime,
+    run_startup_benchmarks,
+    save_startup_baseline,
+)
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_SRC_ROOT = _PROJECT_ROOT / "src"
+
+# Wall-clock comparisons depend on the machine and interpreter the baseline was
+# recorded on, so the guardrail only runs when explicitly requested.
+_GUARDRAIL_ENABLED = os.environ.get("GZKIT_STARTUP_GUARDRAIL") == "1"
+
+_IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |       4200 |   gzkit.cli.parser
+import time:        18 |      15000 | gzkit.cli.main
+Traceback noise that is not importtime output
+"""
+
+
+def _report(import_ms: float, command_ms: float) -> StartupReport:
+    return StartupReport(
+        imports=[ImportSample(module="gzkit.cli.main", cumulative_ms=import_ms, modules_loaded=9)],
+        commands=[CommandSample(name="help", argv=["--help"], wall_ms=command_ms, exit_code=0)],
+    )
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_maps_module_to_cumulative_us(self) -> None:
+        timings = parse_importtime(_IMPORTTIME_SAMPLE)
+        self.assertEqual(timings["gzkit.cli.main"], 15000)
+        self.assertEqual(timings["gzkit.cli.parser"], 4200)
+        self.assertNotIn("imported package", timings)
+        self.assertEqual(len(timings), 3)
+
+
+class TestCompareStartup(unittest.TestCase):
+    def test_within_budget_passes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = save_startup_baseline(
+                _report(100.0, 200.0), Path(tmp) / "b.json", tolerance=1.5, slack_ms=10.0
+            )
+        self.assertEqual(compare_startup(_report(150.0, 300.0), baseline), [])
+
+    def test_over_budget_reports_each_kind(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = save_startup_baseline(
+                _report(100.0, 200.0), Path(tmp) / "b.json", tolerance=1.5, slack_ms=10.0
+            )
+        regressions = compare_startup(_report(161.0, 311.0), baseline)
+        self.assertEqual(
+            [(r.kind, r.name) for r in regressions],
+            [
+                ("import", "gzkit.cli.main"),
+                ("command", "help"),
+            ],
+        )
+        self.assertEqual(regressions[0].budget_ms, 160.0)
+
+    def test_missing_baseline_entry_is_not_a_regression(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = save_startup_baseline(StartupReport(), Path(tmp) / "b.json")
+        self.assertEqual(compare_startup(_report(1e6, 1e6), baseline), [])
+
+    def test_baseline_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "startup_baseline.json"
+            self.assertIsNone(load_startup_baseline(path))
+            saved = save_startup_baseline(_report(12.5, 40.0), path)
+            self.assertEqual(load_startup_baseline(path), saved)
+            self.assertIn('"schema": "gzkit.startup_baseline.v1"', path.read_text("utf-8"))
+
+
+class TestStartupGuardrail(unittest.TestCase):
+    """Cold-path imports and ``gz --help`` stay within the stored baseline budget."""
+
+    @unittest.skipUnless(_GUARDRAIL_ENABLED, "set GZKIT_STARTUP_GUARDRAIL=1 to run")
+    def test_cold_path_within_stored_baseline(self) -> None:
+        baseline = load_startup_baseline(_PROJECT_ROOT / DEFAULT_BASELINE_PATH)
+        self.assertIsNotNone(baseline, "data/benchmarks/startup_baseline.json missing")
+        assert baseline is not None
+        report = run_startup_benchmarks(
+            _PROJECT_ROOT,
+            runs=3,
+            commands={"help": ("--help",)},
+            src_root=_SRC_ROOT,
+        )
+        regressions = compare_startup(report, baseline)
+        self.assertEqual(
+            regressions,
+            [],
+            "\n".join(
+                f"{r.kind} {r.name}: {r.current_ms:.1f} ms > budget {r.budget_ms:.1f} ms"
+                for r in regressions
+            ),
+        )
+
+    def test_measure_command_records_exit_code(self) -> None:
+        sample = measure_command(
+            "version", ["--version"], cwd=_PROJECT_ROOT, runs=1, src_root=_SRC_ROOT
+        )
+        self.assertEqual(sample.exit_code, 0)
+        self.assertGreater(sample.wall_ms, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
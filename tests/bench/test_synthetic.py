@@ -0,0 +1,124 @@
+"""Tests for the synthetic governance-repo generator and macro benchmark runner."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from gzkit.bench.macro import MacroReport, run_macro_benchmarks
+from gzkit.bench.synthetic import (
+    BASE_SPEC,
+    DOCUMENTED_COMMANDS,
+    SIZE_TIERS,
+    SyntheticSpec,
+    generate_synthetic_project,
+    scaled_spec,
+)
+from gzkit.ledger import Ledger
+from gzkit.skills import CORE_SKILLS
+
+_SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+
+_TINY = SyntheticSpec(
+    adrs=3,
+    obpis_per_adr=2,
+    reqs_per_obpi=2,
+    renamed_adrs=1,
+    completed_ratio=0.5,
+    tasks_per_obpi=1,
+    edit_events=4,
+    skills=len(CORE_SKILLS) + 1,
+)
+
+
+class TestScaledSpec(unittest.TestCase):
+    def test_tiers_scale_history_but_not_shape(self) -> None:
+        spec = scaled_spec(SIZE_TIERS["10x"])
+        self.assertEqual(spec.adrs, BASE_SPEC.adrs * 10)
+        self.assertEqual(spec.edit_events, BASE_SPEC.edit_events * 10)
+        self.assertEqual(spec.obpis_per_adr, BASE_SPEC.obpis_per_adr)
+
+    def test_skills_are_capped(self) -> None:
+        self.assertEqual(scaled_spec(100).skills, BASE_SPEC.skills * 10)
+
+
+class TestGenerateSyntheticProject(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "repo"
+        self.summary = generate_synthetic_project(self.root, _TINY, git=False)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_summary_counts(self) -> None:
+        self.assertEqual(self.summary.adrs, 3)
+        self.assertEqual(self.summary.obpis, 6)
+        self.assertEqual(self.summary.reqs, 12)
+        self.assertEqual(self.summary.skills, len(CORE_SKILLS) + 1)
+        self.assertEqual(len(list(self.root.rglob("OBPI-*.md"))), 6)
+
+    def test_ledger_graph_resolves_renames(self) -> None:
+        ledger = Ledger(self.root / ".gzkit" / "ledger.jsonl")
+        self.assertEqual(len(ledger.read_all()), self.summary.ledger_events)
+        self.assertEqual(ledger.canonicalize_id("ADR-0.1.0"), "ADR-0.1.0-bench-00000")
+        self.assertIn("ADR-0.3.0-bench-00002", ledger.get_artifact_graph())
+
+    def test_briefs_and_tests_share_req_ids(self) -> None:
+        brief = next(self.root.rglob("OBPI-0.2.0-01-bench-item.md")).read_text(encoding="utf-8")
+        test_module = (self.root / "tests" / "test_bench_00001.py").read_text(encoding="utf-8")
+        self.assertIn("REQ-0.2.0-01-02", brief)
+        self.assertIn('@covers("REQ-0.2.0-01-02")', test_module)
+
+    def test_skills_are_mirrored(self) -> None:
+        self.assertTrue(
+            (self.root / ".claude" / "skills" / "bench-skill-0000" / "SKILL.md").exists()
+        )
+
+    def test_completed_briefs_match_ledger_status(self) -> None:
+        done = next(self.root.rglob("OBPI-0.1.0-01-bench-item.md")).read_text(encoding="utf-8")
+        open_ = next(self.root.rglob("OBPI-0.3.0-02-bench-item.md")).read_text(encoding="utf-8")
+        self.assertIn("status: Completed", done)
+        self.assertIn("status: Draft", open_)
+
+    def test_audit_surfaces_are_written(self) -> None:
+        manifest = json.loads((self.root / "config" / "doc-coverage.json").read_text("utf-8"))
+        self.assertEqual(sorted(manifest["commands"]), sorted(DOCUMENTED_COMMANDS))
+        index = (self.root / "docs" / "user" / "commands" / "index.md").read_text("utf-8")
+        self.assertIn("skill-audit.md", index)
+        self.assertTrue((self.root / "AGENTS.md").is_file())
+        self.assertTrue((self.root / ".github" / "copilot-instructions.md").is_file())
+        self.assertTrue(any((self.root / ".claude" / "rules").glob("*.md")))
+
+
+class TestMacroRunner(unittest.TestCase):
+    def test_unknown_tier_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(ValueError):
+            run_macro_benchmarks(["3x"], Path(tmp))
+
+    def test_tier_report_roundtrips_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "out" / "macro.json"
+            report = run_macro_benchmarks(
+                ["1x"],
+                Path(tmp),
+                commands={
+                    "covers_json": ("covers", "--json"),
+                    "unknown": ("no-such-command",),
+                },
+                src_root=_SRC_ROOT,
+            )
+            tier = report.tiers[0]
+            self.assertEqual(tier.summary.adrs, BASE_SPEC.adrs)
+            self.assertEqual(tier.commands[0].exit_code, 0)
+            self.assertGreater(tier.commands[0].wall_ms, 0)
+            self.assertEqual(tier.failures, ["unknown"])
+
+            output.parent.mkdir(parents=True)
+            output.write_text(json.dumps(report.model_dump(by_alias=True)), encoding="utf-8")
+            loaded = MacroReport.model_validate_json(output.read_text(encoding="utf-8"))
+            self.assertEqual(loaded.tiers[0].tier, "1x")
+
+
+if __name__ == "__main__":
+    unittest.main()
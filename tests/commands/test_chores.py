@@ -1,9 +1,13 @@
 import json
 import sys
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from gzkit.cli import main
+from gzkit.commands.chores import AcceptanceCriterion, CriterionResult
+from gzkit.commands.chores_exec import _criterion_batches, _evaluate_criteria
 from tests.commands.common import CliRunner, _quick_init
 
 # Forward-slash executable path for shlex.split compatibility on Windows.
@@ -329,3 +333,127 @@ class TestChoresCommands(unittest.TestCase):
             result = runner.invoke(main, ["chores", "list"])
             self.assertEqual(result.exit_code, 0)
             self.assertNotIn("vendor-chore", result.output)
+
+    def test_chores_rejects_non_boolean_independent(self) -> None:
+        """acceptance.json independent flag must be a boolean."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            _setup_demo_chore(slug="flag-test", chore_path="ops/chores/flag-test")
+            _write_acceptance(
+                "ops/chores/flag-test",
+                [
+                    {
+                        "type": "exitCodeEquals",
+                        "command": f'{_PYTHON} -c "print(1)"',
+                        "expected": 0,
+                        "independent": "yes",
+                    }
+                ],
+            )
+
+            result = runner.invoke(main, ["chores", "list"])
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn("independent must be a boolean", result.output)
+
+
+def _criterion(name: str, *, independent: bool = True) -> AcceptanceCriterion:
+    return AcceptanceCriterion(
+        criterion_type="exitCodeEquals",
+        command=name,
+        argv=(name,),
+        expected=0,
+        independent=independent,
+    )
+
+
+def _result(criterion: AcceptanceCriterion, *, passed: bool = True) -> CriterionResult:
+    return CriterionResult(
+        criterion=criterion,
+        passed=passed,
+        returncode=0 if passed else 1,
+        duration_seconds=0.0,
+        stdout="",
+        stderr="",
+        detail="",
+    )
+
+
+class TestParallelCriteria(unittest.TestCase):
+    """Independent acceptance criteria run on a bounded pool."""
+
+    def test_batches_split_on_dependent_criteria(self) -> None:
+        criteria = (
+            _criterion("a"),
+            _criterion("b"),
+            _criterion("c", independent=False),
+            _criterion("d"),
+            _criterion("e"),
+        )
+        self.assertEqual(_criterion_batches(criteria), [[0, 1], [2], [3, 4]])
+
+    def test_independent_criteria_overlap_and_keep_order(self) -> None:
+        criteria = (_criterion("slow"), _criterion("fast"))
+        barrier = threading.Barrier(2, timeout=5)
+        finished: list[str] = []
+
+        def fake(criterion: AcceptanceCriterion, _root: Path, _timeout: int) -> CriterionResult:
+            barrier.wait()  # deadlocks (and times out) unless both run concurrently
+            if criterion.command == "slow":
+                threading.Event().wait(0.05)
+            finished.append(criterion.command)
+            return _result(criterion)
+
+        with patch("gzkit.commands.chores_exec._evaluate_criterion", side_effect=fake):
+            results = _evaluate_criteria(criteria, Path("."), 10)
+
+        self.assertEqual(finished, ["fast", "slow"])
+        self.assertEqual([r.criterion.command for r in results], ["slow", "fast"])
+
+    def test_failure_stops_later_batches(self) -> None:
+        criteria = (_criterion("bad"), _criterion("gate", independent=False), _criterion("x"))
+        calls: list[str] = []
+
+        def fake(criterion: AcceptanceCriterion, _root: Path, _timeout: int) -> CriterionResult:
+            calls.append(criterion.command)
+            return _result(criterion, passed=criterion.command != "bad")
+
+        with patch("gzkit.commands.chores_exec._evaluate_criterion", side_effect=fake):
+            results = _evaluate_criteria(criteria, Path("."), 10)
+            self.assertEqual(calls, ["bad"])
+            self.assertFalse(results[0].passed)
+
+            calls.clear()
+            results = _evaluate_criteria(criteria, Path("."), 10, fail_fast=False)
+            self.assertEqual(calls, ["bad", "gate", "x"])
+            self.assertEqual(len(results), 3)
+
+    def test_chores_run_reports_first_declared_failure(self) -> None:
+        """chores run logs all criteria that ran and names the first failure."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            _setup_demo_chore(slug="par-run", chore_path="ops/chores/par-run")
+            _write_acceptance(
+                "ops/chores/par-run",
+                [
+                    {
+                        "type": "outputContains",
+                        "command": f'{_PYTHON} -c "print(1)"',
+                        "contains": "1",
+                        "independent": True,
+                    },
+                    {
+                        "type": "exitCodeEquals",
+                        "command": f'{_PYTHON} -c "import sys; sys.exit(2)"',
+                        "expected": 0,
+                        "independent": True,
+                    },
+                ],
+            )
+
+            result = runner.invoke(main, ["chores", "run", "par-run"])
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn("sys.exit(2)", result.output)
+            log = Path("ops/chores/par-run/proofs/CHORE-LOG.md").read_text(encoding="utf-8")
+            self.assertLess(log.index("print(1)"), log.index("sys.exit(2)"))
@@ -7,8 +7,14 @@ import unittest
 from contextlib import redirect_stdout
 from io import StringIO
 from pathlib import Path
+from unittest.mock import patch
 
-from gzkit.commands.readiness import _readiness_check_ok, readiness_audit_cmd
+from gzkit.commands.readiness import (
+    _readiness_check_ok,
+    _readiness_score_checks,
+    _ReadinessProbe,
+    readiness_audit_cmd,
+)
 
 
 class ReadinessAnyOfKindTest(unittest.TestCase):
@@ -117,5 +123,60 @@ class ReadinessAuditDiscoveryOnFixtureTest(unittest.TestCase):
             self.assertFalse(_readiness_check_ok(root, check))
 
 
+class ReadinessCheckCachingTest(unittest.TestCase):
+    """Checks read each file once per run and reuse results on an unchanged tree."""
+
+    DISCIPLINES = {
+        "prompt_craft": [
+            {"kind": "markers", "path": "AGENTS.md", "markers": ("Gate 2",), "issue": "gate 2"},
+            {"kind": "markers", "path": "AGENTS.md", "markers": ("BDD",), "issue": "bdd"},
+            {"kind": "dir", "path": "features", "required": True, "issue": "no features"},
+        ]
+    }
+    PRIMITIVES = {
+        "acceptance_criteria": [{"kind": "markers", "path": "AGENTS.md", "markers": ("gate 4",)}]
+    }
+
+    def _score(self, root: Path) -> dict[str, object]:
+        return _readiness_score_checks(root, self.DISCIPLINES, self.PRIMITIVES)
+
+    def test_each_markers_file_is_read_once_per_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "AGENTS.md").write_text("Gate 2, Gate 4, BDD\n", encoding="utf-8")
+            with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as rd:
+                probe = _ReadinessProbe(root)
+                for checks in (*self.DISCIPLINES.values(), *self.PRIMITIVES.values()):
+                    for check in checks:
+                        _readiness_check_ok(root, check, probe)
+            self.assertEqual(rd.call_count, 1)
+
+    def test_unchanged_tree_reuses_recorded_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "AGENTS.md").write_text("Gate 2 only\n", encoding="utf-8")
+            cold = self._score(root)
+            with patch(
+                "gzkit.commands.readiness._readiness_check_ok",
+                side_effect=AssertionError("check re-evaluated"),
+            ):
+                warm = self._score(root)
+        self.assertEqual(warm, cold)
+        self.assertEqual([i["issue"] for i in cold["issues"]], ["bdd", "no features"])
+
+    def test_changed_or_created_paths_invalidate_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            agents = root / "AGENTS.md"
+            agents.write_text("Gate 2 only\n", encoding="utf-8")
+            self.assertEqual(len(self._score(root)["issues"]), 2)
+            agents.write_text("Gate 2, Gate 4 and BDD\n", encoding="utf-8")
+            self.assertEqual(len(self._score(root)["issues"]), 1)
+            (root / "features").mkdir()
+            scored = self._score(root)
+        self.assertEqual(scored["issues"], [])
+        self.assertEqual(scored["primitives"]["acceptance_criteria"]["passed"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
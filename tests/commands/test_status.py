@@ -189,6 +189,42 @@ class TestStatusCommand(unittest.TestCase):
                 ["ADR-0.2.0", "ADR-0.9.0", "ADR-0.10.0"],
             )
 
+    def test_status_ndjson_streams_adr_records_then_summary(self) -> None:
+        """status --ndjson emits one record per ADR in status order, then a summary."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            config = GzkitConfig.load(Path(".gzkit.json"))
+            ledger = Ledger(Path(".gzkit/ledger.jsonl"))
+            for adr_id in ("ADR-0.10.0", "ADR-0.2.0"):
+                adr_path = Path(config.paths.adrs) / f"{adr_id}.md"
+                adr_path.parent.mkdir(parents=True, exist_ok=True)
+                adr_path.write_text(f"---\nid: {adr_id}\n---\n\n# {adr_id}\n")
+                ledger.append(adr_created_event(adr_id, "", "lite"))
+
+            result = runner.invoke(main, ["status", "--ndjson"])
+
+            self.assertEqual(result.exit_code, 0)
+            records = [json.loads(line) for line in result.output.splitlines()]
+            self.assertEqual(
+                [(r["record"], r.get("id")) for r in records],
+                [("adr", "ADR-0.2.0"), ("adr", "ADR-0.10.0"), ("summary", None)],
+            )
+            self.assertEqual(records[-1]["adrs"], 2)
+            self.assertNotIn("obpis", records[0])
+
+    def test_status_rejects_conflicting_output_modes(self) -> None:
+        """--ndjson cannot be combined with --json or --watch."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            both = runner.invoke(main, ["status", "--json", "--ndjson"])
+            self.assertEqual(both.exit_code, 2)
+            self.assertIn("not allowed with argument", both.output)
+            watch = runner.invoke(main, ["status", "--ndjson", "--watch"])
+            self.assertNotEqual(watch.exit_code, 0)
+            self.assertIn("--ndjson cannot be combined with --watch", watch.output)
+
     def test_status_shows_obpi_completion_summary(self) -> None:
         """status renders OBPI completion as the primary unit."""
         runner = CliRunner()
@@ -0,0 +1,111 @@
+"""Tests for the resident ``gz status --watch`` recomputation."""
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit.cli import main
+from gzkit.commands import status_watch
+from gzkit.commands.status_watch import StatusWatcher
+from gzkit.config import GzkitConfig
+from gzkit.ledger import (
+    Ledger,
+    adr_created_event,
+    artifact_renamed_event,
+    gate_checked_event,
+    obpi_created_event,
+)
+from tests.commands.common import CliRunner, _quick_init, _write_obpi
+
+
+class TestStatusWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self._fs = CliRunner().isolated_filesystem()
+        self._fs.__enter__()
+        _quick_init()
+        self.root = Path.cwd()
+        self.config = GzkitConfig.load(Path(".gzkit.json"))
+        self.ledger = Ledger(self.root / ".gzkit" / "ledger.jsonl")
+        for adr_id in ("ADR-0.1.0", "ADR-0.2.0"):
+            adr_path = Path(self.config.paths.adrs) / f"{adr_id}.md"
+            adr_path.parent.mkdir(parents=True, exist_ok=True)
+            adr_path.write_text(f"---\nid: {adr_id}\n---\n\n# {adr_id}\n")
+            self.ledger.append(adr_created_event(adr_id, "", "lite"))
+
+    def tearDown(self) -> None:
+        self._fs.__exit__(None, None, None)
+
+    def _built(self, watcher: StatusWatcher) -> tuple[set[str] | None, list[str]]:
+        real_build = status_watch._build_adr_status_entry
+        with patch.object(status_watch, "_build_adr_status_entry", side_effect=real_build) as build:
+            affected = watcher.poll()
+        return affected, sorted(call.args[3] for call in build.call_args_list)
+
+    def test_initial_state_covers_every_adr(self) -> None:
+        watcher = StatusWatcher(self.root, self.config)
+        self.assertEqual(list(watcher.adrs), ["ADR-0.1.0", "ADR-0.2.0"])
+
+    def test_idle_poll_recomputes_nothing(self) -> None:
+        watcher = StatusWatcher(self.root, self.config)
+        self.assertEqual(self._built(watcher), (set(), []))
+
+    def test_ledger_append_recomputes_only_named_adr(self) -> None:
+        watcher = StatusWatcher(self.root, self.config)
+        self.ledger.append(gate_checked_event("ADR-0.2.0", 2, "pass", "test", 0))
+        self.assertEqual(self._built(watcher), ({"ADR-0.2.0"}, ["ADR-0.2.0"]))
+        self.assertEqual(watcher.adrs["ADR-0.2.0"]["gates"]["2"], "pass")
+        self.assertEqual(watcher.adrs["ADR-0.1.0"]["gates"]["2"], "pending")
+
+    def test_brief_edit_recomputes_parent_adr(self) -> None:
+        self.ledger.append(obpi_created_event("OBPI-0.1.0-01-demo", "ADR-0.1.0"))
+        obpi_path = Path(self.config.paths.adrs) / "obpis" / "OBPI-0.1.0-01-demo.md"
+        obpi_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_obpi(obpi_path, "Draft", "Draft", "- Files created/modified: src/module.py")
+        watcher = StatusWatcher(self.root, self.config)
+
+        _write_obpi(obpi_path, "Completed", "Completed", "- Files created/modified: src/a.py")
+        affected, built = self._built(watcher)
+        self.assertEqual((affected, built), ({"ADR-0.1.0"}, ["ADR-0.1.0"]))
+
+    def test_rename_event_rebuilds_everything(self) -> None:
+        watcher = StatusWatcher(self.root, self.config)
+        self.ledger.append(artifact_renamed_event("ADR-0.2.0", "ADR-0.2.1"))
+        affected, built = self._built(watcher)
+        self.assertIsNone(affected)
+        self.assertIn("ADR-0.2.1", built)
+
+
+class TestWatchInterval(unittest.TestCase):
+    def test_non_positive_interval_is_rejected_before_watching(self) -> None:
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            with patch.object(status_watch, "watch_status") as watch:
+                for value in ("0", "-1", "nan"):
+                    with self.subTest(interval=value):
+                        result = runner.invoke(main, ["status", "--watch", "--interval", value])
+                        self.assertNotEqual(result.exit_code, 0)
+                        self.assertIn("--interval must be a positive number", result.output)
+            watch.assert_not_called()
+
+
+class TestLedgerReadNew(unittest.TestCase):
+    def test_tails_appended_events_and_detects_rewrite(self) -> None:
+        with CliRunner().isolated_filesystem():
+            ledger_path = Path("ledger.jsonl")
+            writer = Ledger(ledger_path)
+            writer.append(obpi_created_event("OBPI-1", "ADR-0.1.0"))
+            reader = Ledger(ledger_path)
+            self.assertIsNone(reader.read_new())
+            reader.read_all()
+            writer.append(obpi_created_event("OBPI-2", "ADR-0.1.0"))
+            self.assertEqual([e.id for e in reader.read_new() or []], ["OBPI-2"])
+            self.assertEqual([e.id for e in reader.read_all()], ["OBPI-1", "OBPI-2"])
+            self.assertEqual(reader.read_new(), [])
+
+            ledger_path.write_text("", encoding="utf-8")
+            self.assertIsNone(reader.read_new())
+
+
+if __name__ == "__main__":
+    unittest.main()
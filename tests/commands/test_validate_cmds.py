@@ -1,3 +1,4 @@
+import json
 import subprocess
 import unittest
 from pathlib import Path
@@ -157,6 +158,31 @@ Do the thing.
             self.assertIn("REQ", result.output)
             self.assertIn("OBPI-0.0.99-01-thing", result.output)
 
+    def test_validate_ndjson_streams_errors_per_scope(self) -> None:
+        """--ndjson emits each scope's errors as it finishes, then one summary."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _quick_init()
+            obpi_dir = Path("docs/design/adr/pre-release/ADR-0.0.99-test/obpis")
+            obpi_dir.mkdir(parents=True, exist_ok=True)
+            (obpi_dir / "OBPI-0.0.99-01-thing.md").write_text(
+                "---\nid: OBPI-0.0.99-01-thing\nparent: ADR-0.0.99-test\n---\n\n"
+                "## REQUIREMENTS (FAIL-CLOSED)\n\n1. The thing must happen\n",
+                encoding="utf-8",
+            )
+            result = runner.invoke(main, ["validate", "--requirements", "--interviews", "--ndjson"])
+            self.assertEqual(result.exit_code, 0)
+            records = [json.loads(line) for line in result.output.splitlines()]
+            self.assertEqual(
+                [(r["record"], r.get("scope")) for r in records if r["record"] != "error"],
+                [("scope", "interviews"), ("scope", "requirements"), ("summary", None)],
+            )
+            errors = [r for r in records if r["record"] == "error"]
+            self.assertTrue(errors)
+            self.assertEqual(
+                records[-1], {"record": "summary", "valid": False, "errors": len(errors)}
+            )
+
     def test_validate_requirements_passes_when_req_ids_present(self) -> None:
         """OBPI with REQUIREMENTS section and at least one REQ-ID passes."""
         runner = CliRunner()
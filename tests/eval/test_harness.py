@@ -8,9 +8,12 @@ Verifies that:
 - run_eval() returns a QualityResult
 """
 
+import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from gzkit.eval import runner
 from gzkit.eval.datasets import KNOWN_SURFACES, load_dataset
 from gzkit.eval.runner import EvalSuiteScore, SurfaceScore, run_eval_suite
 from gzkit.eval.scorer import CaseScore, DimensionResult, score_case
@@ -160,5 +163,35 @@ class TestDeterminism(unittest.TestCase):
             self.assertEqual(s1.overall, s2.overall)
 
 
+class TestCaseResultCache(unittest.TestCase):
+    """Verify content-addressed case reuse and pooled scoring."""
+
+    def test_warm_run_scores_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "eval_cases.json"
+            cold = run_eval_suite(data_dir=_DATA_DIR, cache_path=cache_path)
+            self.assertTrue(cache_path.is_file())
+            with patch.object(runner, "score_case", side_effect=AssertionError("scored")):
+                warm = run_eval_suite(data_dir=_DATA_DIR, cache_path=cache_path)
+            self.assertEqual(cold, warm)
+
+    def test_scorer_version_change_invalidates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "eval_cases.json"
+            run_eval_suite(surfaces=["rules"], data_dir=_DATA_DIR, cache_path=cache_path)
+            with (
+                patch.object(runner, "SCORER_VERSION", "next"),
+                patch.object(runner, "score_case", wraps=runner.score_case) as scored,
+            ):
+                run_eval_suite(surfaces=["rules"], data_dir=_DATA_DIR, cache_path=cache_path)
+            self.assertGreater(scored.call_count, 0)
+
+    def test_pooled_results_keep_dataset_order(self) -> None:
+        inline = run_eval_suite(data_dir=_DATA_DIR, max_workers=1)
+        with patch.object(runner, "PARALLEL_MIN_CASES", 1):
+            pooled = run_eval_suite(data_dir=_DATA_DIR, max_workers=2)
+        self.assertEqual(inline, pooled)
+
+
 if __name__ == "__main__":
     unittest.main()
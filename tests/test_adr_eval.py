@@ -12,7 +12,9 @@ from gzkit.adr_eval import (
     RedTeamChallengeResult,
     _passes_to_score,
     compute_verdict,
+    discover_adr_packages,
     evaluate_adr,
+    evaluate_adr_packages,
     render_scorecard_markdown,
     resolve_adr_package,
     score_adr_deterministic,
@@ -409,5 +411,60 @@ class TestEvaluateAdr(unittest.TestCase):
         self.assertEqual(result.verdict, EvalVerdict.NO_GO)
 
 
+class TestBatchEvaluation(unittest.TestCase):
+    def _make_portfolio(self) -> Path:
+        tmp_ctx = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_ctx.cleanup)
+        root = Path(tmp_ctx.name)
+        adr_root = root / "docs" / "design" / "adr"
+        for bucket, slug, obpis in (
+            ("pre-release", "ADR-0.10.0-later", [_STRONG_OBPI]),
+            ("pre-release", "ADR-0.1.0-first", [_STRONG_OBPI, _STRONG_OBPI]),
+            ("foundation", "ADR-0.0.2-base", [_SCAFFOLD_OBPI]),
+        ):
+            adr_dir = adr_root / bucket / slug
+            (adr_dir / "obpis").mkdir(parents=True)
+            (adr_dir / f"{slug}.md").write_text(_STRONG_ADR, encoding="utf-8")
+            version = slug.split("-")[1]
+            for i, content in enumerate(obpis, 1):
+                brief = adr_dir / "obpis" / f"OBPI-{version}-{i:02d}-item.md"
+                brief.write_text(content, encoding="utf-8")
+        (adr_root / "pre-release" / "ADR-0.3.0-empty").mkdir()
+        (adr_root / "pool").mkdir()
+        (adr_root / "pool" / "ADR-pool.idea.md").write_text("# idea\n", encoding="utf-8")
+        return root
+
+    def test_discovers_packages_in_version_order(self) -> None:
+        root = self._make_portfolio()
+        ids = [adr_id for adr_id, _dir in discover_adr_packages(root)]
+        self.assertEqual(ids, ["ADR-0.0.2", "ADR-0.1.0", "ADR-0.3.0", "ADR-0.10.0"])
+
+    def test_batch_matches_single_evaluations(self) -> None:
+        root = self._make_portfolio()
+        packages = discover_adr_packages(root)
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                report = evaluate_adr_packages(packages, workers=workers)
+                self.assertEqual(
+                    [r.adr_id for r in report.results], ["ADR-0.0.2", "ADR-0.1.0", "ADR-0.10.0"]
+                )
+                self.assertEqual({r.timestamp for r in report.results}, {report.timestamp})
+                for result in report.results:
+                    single = evaluate_adr(root, result.adr_id)
+                    self.assertEqual(
+                        result.model_dump(exclude={"timestamp"}),
+                        single.model_dump(exclude={"timestamp"}),
+                    )
+                self.assertIn("ADR markdown not found", report.errors["ADR-0.3.0"])
+                self.assertEqual(sum(report.verdict_counts.values()), 3)
+
+    def test_single_resolution_matches_whole_id(self) -> None:
+        root = self._make_portfolio()
+        path, _content, _obpis = resolve_adr_package(root, "ADR-0.10.0")
+        self.assertEqual(path.parent.name, "ADR-0.10.0-later")
+        with self.assertRaises(FileNotFoundError):
+            resolve_adr_package(root, "ADR-0.1")  # a bare prefix of ADR-0.1.0 and ADR-0.10.0
+
+
 if __name__ == "__main__":
     unittest.main()
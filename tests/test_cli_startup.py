@@ -0,0 +1,122 @@
+"""Tests for the two-stage gz parser and the ``gz status`` startup budget."""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Any
+
+from gzkit.cli.main import _build_parser, _get_parser_for, _peek_command
+
+_SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+# Generous ceilings: they catch order-of-magnitude regressions (a handler or
+# yaml sneaking back into the parse path), not scheduler noise. Wall clock still
+# depends on the machine, so they are only checked when explicitly requested.
+_IMPORT_BUDGET_S = 1.5
+_PARSE_BUDGET_S = 0.1
+_GUARDRAIL_ENABLED = os.environ.get("GZKIT_STARTUP_GUARDRAIL") == "1"
+
+_STARTUP_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from gzkit.cli.main import _get_parser_for
+t1 = time.perf_counter()
+_get_parser_for(["status", "--json"]).parse_args(["status", "--json"])
+t2 = time.perf_counter()
+heavy = ["yaml", "gzkit.commands.common", "gzkit.commands.status", "gzkit.sync"]
+print(json.dumps({
+    "import_s": t1 - t0,
+    "parse_s": t2 - t1,
+    "loaded": [name for name in heavy if name in sys.modules],
+}))
+"""
+
+
+def _top_level_choices(parser: argparse.ArgumentParser) -> list[str]:
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return list(action.choices)
+    return []
+
+
+class TestPeekCommand(unittest.TestCase):
+    """The first stage routes on the first positional token."""
+
+    def test_returns_command_token(self) -> None:
+        self.assertEqual(_peek_command(["status", "--json"]), "status")
+
+    def test_skips_root_common_flags(self) -> None:
+        self.assertEqual(_peek_command(["-v", "--debug", "adr", "status"]), "adr")
+
+    def test_skips_root_profile_flags_and_values(self) -> None:
+        argv = ["--profile", "--profile-output", "p.json", "--profile-cprofile=x.prof", "status"]
+        self.assertEqual(_peek_command(argv), "status")
+
+    def test_root_help_and_version_need_full_tree(self) -> None:
+        self.assertIsNone(_peek_command(["--help"]))
+        self.assertIsNone(_peek_command(["-q", "--version"]))
+        self.assertIsNone(_peek_command([]))
+
+
+class TestSelectiveParserTree(unittest.TestCase):
+    """The second stage builds only the requested command's subtree."""
+
+    def test_builds_only_target_command(self) -> None:
+        parser = _build_parser("status")
+        self.assertEqual(_top_level_choices(parser), ["status"])
+
+    def test_unknown_command_falls_back_to_full_tree(self) -> None:
+        parser = _build_parser("no-such-command")
+        self.assertIn("status", _top_level_choices(parser))
+        self.assertIn("arb", _top_level_choices(parser))
+
+    def test_root_help_uses_full_tree(self) -> None:
+        self.assertGreater(len(_top_level_choices(_get_parser_for(["--help"]))), 1)
+
+    def test_targeted_parse_matches_full_parse(self) -> None:
+        full = _build_parser()
+        for argv in (
+            ["status", "--json", "--verbose"],
+            ["adr", "status", "ADR-0.1.0", "--json"],
+            ["obpi", "lock", "claim", "OBPI-0.1.0-01"],
+            ["arb", "advise", "--limit", "5"],
+        ):
+            with self.subTest(argv=argv):
+                targeted = vars(_build_parser(argv[0]).parse_args(argv))
+                expected = vars(full.parse_args(argv))
+                targeted.pop("func", None)
+                expected.pop("func", None)
+                self.assertEqual(targeted, expected)
+
+
+def _run_startup_probe() -> dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, "-c", _STARTUP_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(_SRC_ROOT)},
+    )
+    return json.loads(result.stdout)
+
+
+class TestStatusStartupBudget(unittest.TestCase):
+    """``gz status`` import and parse cost stays within budget in a cold process."""
+
+    def test_status_parse_path_skips_handler_dependencies(self) -> None:
+        probe = _run_startup_probe()
+        self.assertEqual(probe["loaded"], [], "parse path imported handler dependencies")
+
+    @unittest.skipUnless(_GUARDRAIL_ENABLED, "set GZKIT_STARTUP_GUARDRAIL=1 to run")
+    def test_status_import_and_parse_budget(self) -> None:
+        probe = _run_startup_probe()
+        self.assertLess(probe["import_s"], _IMPORT_BUDGET_S)
+        self.assertLess(probe["parse_s"], _PARSE_BUDGET_S)
+
+
+if __name__ == "__main__":
+    unittest.main()
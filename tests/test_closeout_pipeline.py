@@ -257,3 +257,69 @@ class TestCloseoutExitCodes(unittest.TestCase):
             runner.invoke(main, ["plan", "create", "0.1.0"])
             result = runner.invoke(main, ["closeout", "ADR-0.1.0"])
             self.assertEqual(result.exit_code, 1)
+
+
+class TestCloseoutGateReuse(unittest.TestCase):
+    """Gates proven on the identical tree are reused on a repeated closeout."""
+
+    def _aborted_then_retried(self, *retry_args: str) -> tuple[int, int, str]:
+        runner = CliRunner()
+        with (
+            runner.isolated_filesystem(),
+            patch("gzkit.cli.main.run_command", return_value=_make_qr()) as mock_run,
+        ):
+            _init_git_repo(Path.cwd())
+            _quick_init()
+            runner.invoke(main, ["plan", "create", "0.1.0"])
+            with patch("builtins.input", side_effect=EOFError):
+                runner.invoke(main, ["closeout", "ADR-0.1.0"])
+            first = mock_run.call_count
+            with patch("builtins.input", return_value="1"):
+                result = runner.invoke(main, ["closeout", "ADR-0.1.0", *retry_args])
+            self.assertEqual(result.exit_code, 0, result.output)
+            ledger_text = Path(".gzkit/ledger.jsonl").read_text(encoding="utf-8")
+            return first, mock_run.call_count - first, ledger_text
+
+    def test_retry_reuses_passing_gates(self):
+        first, retried, ledger_text = self._aborted_then_retried()
+        self.assertGreater(first, 0)
+        self.assertEqual(retried, 0)
+        events = [json.loads(line) for line in ledger_text.splitlines() if line.strip()]
+        reused = [
+            e
+            for e in events
+            if e["event"] == "gate_checked" and str(e.get("evidence", "")).startswith("reused ")
+        ]
+        self.assertEqual(len(reused), first)
+
+    def test_rerun_gates_executes_everything(self):
+        first, retried, _ledger = self._aborted_then_retried("--rerun-gates")
+        self.assertEqual(retried, first)
+
+    def test_tree_change_invalidates_reuse(self):
+        from gzkit.commands.closeout_gates import GateResultCache
+
+        with CliRunner().isolated_filesystem():
+            root = Path.cwd()
+            _init_git_repo(root)
+            cache = GateResultCache(root)
+            cache.record_pass("uv run gz test", 0)
+            self.assertIsNotNone(GateResultCache(root).lookup("uv run gz test"))
+            self.assertIsNone(GateResultCache(root).lookup("uv run gz lint"))
+            Path("new_module.py").write_text("x = 1\n", encoding="utf-8")
+            self.assertIsNone(GateResultCache(root).lookup("uv run gz test"))
+
+    def test_dirty_gzkit_source_invalidates_reuse(self):
+        from gzkit.commands.closeout_gates import GateResultCache
+
+        with CliRunner().isolated_filesystem():
+            root = Path.cwd()
+            _init_git_repo(root)
+            GateResultCache(root).record_pass("uv run gz test", 0)
+            Path(".gzkit").mkdir(exist_ok=True)
+            Path(".gzkit/ledger.jsonl").write_text("{}\n", encoding="utf-8")
+            self.assertIsNotNone(GateResultCache(root).lookup("uv run gz test"))
+            skill = Path(".gzkit/skills/gz-demo/SKILL.md")
+            skill.parent.mkdir(parents=True)
+            skill.write_text("# demo\n", encoding="utf-8")
+            self.assertIsNone(GateResultCache(root).lookup("uv run gz test"))
@@ -101,6 +101,57 @@ class TestReachability(unittest.TestCase):
             self.assertEqual(len(errors), 1)
             self.assertIn("missing/**", errors[0].message)
 
+    def test_walk_matches_path_glob_semantics(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            inst = root / ".github" / "instructions"
+            inst.mkdir(parents=True)
+            patterns = "src/**/*.py, src/pkg, docs/*/index.md, src/pk?/[a-c]*.py, src/**/*.rs"
+            (inst / "mix.instructions.md").write_text(_instruction_file(patterns, "# Mix"))
+            (root / "src" / "pkg" / "deep").mkdir(parents=True)
+            (root / "src" / "pkg" / "deep" / "mod.py").write_text("")
+            (root / "src" / "pkg" / "app.py").write_text("")
+            (root / "docs" / "user").mkdir(parents=True)
+            (root / "docs" / "user" / "index.md").write_text("")
+
+            errors = audit_instruction_reachability(root)
+
+            globbed = [p.strip() for p in patterns.split(",")]
+            expected = [p for p in globbed if not list(root.glob(p))]
+            self.assertEqual([e.message.split("'")[1] for e in errors], expected)
+            self.assertEqual(expected, ["src/**/*.rs"])
+
+    def test_pruned_directories_do_not_satisfy_patterns(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            inst = root / ".github" / "instructions"
+            inst.mkdir(parents=True)
+            (inst / "venv.instructions.md").write_text(
+                _instruction_file("node_modules/**/*.js", "# Vendored")
+            )
+            (root / "node_modules" / "lib").mkdir(parents=True)
+            (root / "node_modules" / "lib" / "index.js").write_text("")
+
+            errors = audit_instruction_reachability(root)
+
+            self.assertEqual(len(errors), 1)
+
+    def test_shared_pattern_reported_for_each_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            inst = root / ".github" / "instructions"
+            inst.mkdir(parents=True)
+            for name in ("a", "b"):
+                (inst / f"{name}.instructions.md").write_text(
+                    _instruction_file("missing/**", "# Shared")
+                )
+
+            errors = audit_instruction_reachability(root)
+
+            self.assertEqual(
+                [e.artifact for e in errors], ["a.instructions.md", "b.instructions.md"]
+            )
+
 
 class TestForeignReferences(unittest.TestCase):
     """Test audit_foreign_references()."""
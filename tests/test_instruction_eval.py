@@ -2,8 +2,11 @@
 
 import tempfile
 import unittest
+from collections import Counter
 from pathlib import Path
+from unittest.mock import patch
 
+from gzkit import instruction_eval
 from gzkit.instruction_eval import (
     BASELINE_CASES,
     EvalCase,
@@ -202,3 +205,25 @@ class TestExtensibility(unittest.TestCase):
             _scaffold_project(root)
             result = run_eval_suite(root, cases=extended)
             self.assertEqual(result.total, 11)
+
+
+class TestSharedAuditContext(unittest.TestCase):
+    """Each shared instruction audit runs once per suite run."""
+
+    def test_each_audit_computed_once(self) -> None:
+        calls: Counter[str] = Counter()
+        wrapped = {}
+        for name, fn in instruction_eval._AUDITS.items():
+
+            def counting(root: Path, _name: str = name, _fn=fn) -> list:
+                calls[_name] += 1
+                return _fn(root)
+
+            wrapped[name] = counting
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _scaffold_project(root)
+            with patch.dict(instruction_eval._AUDITS, wrapped):
+                result = run_eval_suite(root)
+        self.assertTrue(result.success)
+        self.assertEqual(calls, Counter({"reachability": 1, "foreign": 1, "surface_drift": 1}))
@@ -2,6 +2,7 @@
 
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -202,6 +203,69 @@ class TestLedger(unittest.TestCase):
             self.assertEqual(events[0].id, "PRD-1")
             self.assertEqual(events[1].id, "OBPI-1")
 
+    def test_append_many_writes_batch_and_refreshes_cache(self) -> None:
+        """append_many writes every event in order and invalidates cached reads."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "ledger.jsonl"
+            ledger = Ledger(ledger_path)
+            ledger.append(prd_created_event("PRD-1"))
+            self.assertEqual(len(ledger.read_all()), 1)
+
+            written = ledger.append_many(
+                [obpi_created_event(f"OBPI-{i}", "ADR-0.1.0") for i in range(3)],
+                fsync=True,
+            )
+
+            self.assertEqual(written, 3)
+            self.assertEqual(
+                [e.id for e in ledger.read_all()], ["PRD-1", "OBPI-0", "OBPI-1", "OBPI-2"]
+            )
+            self.assertEqual(ledger.append_many([]), 0)
+
+    def test_transaction_commits_on_clean_exit(self) -> None:
+        """Events staged in a transaction land only when the block exits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "ledger.jsonl"
+            ledger = Ledger(ledger_path)
+
+            with ledger.transaction() as txn:
+                txn.append(adr_created_event("ADR-0.1.0", "", "lite"))
+                txn.extend([obpi_created_event("OBPI-1", "ADR-0.1.0")])
+                self.assertEqual(ledger.read_all(), [])
+
+            self.assertEqual([e.id for e in ledger.read_all()], ["ADR-0.1.0", "OBPI-1"])
+
+    def test_transaction_discards_batch_on_error(self) -> None:
+        """An exception inside the transaction block writes nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "ledger.jsonl"
+            ledger = Ledger(ledger_path)
+
+            with self.assertRaises(RuntimeError), ledger.transaction() as txn:
+                txn.append(prd_created_event("PRD-1"))
+                raise RuntimeError("abort")
+
+            self.assertEqual(ledger.read_all(), [])
+
+    def test_concurrent_batches_do_not_interleave(self) -> None:
+        """Parallel writers produce intact lines with each batch kept contiguous."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = Path(tmpdir) / "ledger.jsonl"
+
+            def write_batch(writer: int) -> None:
+                Ledger(ledger_path).append_many(
+                    [obpi_created_event(f"OBPI-{writer}-{i}", "ADR-0.1.0") for i in range(50)]
+                )
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(write_batch, range(8)))
+
+            ids = [e.id for e in Ledger(ledger_path).read_all()]
+            self.assertEqual(len(ids), 400)
+            for start in range(0, 400, 50):
+                writers = {artifact_id.split("-")[1] for artifact_id in ids[start : start + 50]}
+                self.assertEqual(len(writers), 1)
+
     def test_query_by_type(self) -> None:
         """Ledger queries events by type."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
 import unittest
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -11,8 +12,11 @@ from unittest.mock import patch
 
 from pydantic import ValidationError
 
+from gzkit import lock_manager
 from gzkit.lock_manager import (
     LockData,
+    _branch_for,
+    claim_lock,
     current_branch,
     delete_lock,
     list_locks,
@@ -20,6 +24,7 @@ from gzkit.lock_manager import (
     lock_path,
     read_lock,
     reap_expired_locks,
+    renew_lock,
     resolve_agent,
     write_lock,
 )
@@ -158,6 +163,10 @@ class TestResolveAgent(unittest.TestCase):
 class TestCurrentBranch(unittest.TestCase):
     """Unit tests for current_branch()."""
 
+    def setUp(self):
+        _branch_for.cache_clear()
+        self.addCleanup(_branch_for.cache_clear)
+
     @covers("REQ-0.0.14-01-01")
     def test_returns_nonempty_string(self):
         branch = current_branch()
@@ -175,6 +184,13 @@ class TestCurrentBranch(unittest.TestCase):
         with patch("subprocess.run", return_value=mock_result):
             self.assertEqual(current_branch(), "unknown")
 
+    def test_cached_per_process(self):
+        mock_result = unittest.mock.MagicMock(returncode=0, stdout="feature\n")
+        with patch("subprocess.run", return_value=mock_result) as run:
+            self.assertEqual(current_branch(), "feature")
+            self.assertEqual(current_branch(), "feature")
+        self.assertEqual(run.call_count, 1)
+
 
 # ---------------------------------------------------------------------------
 # lock_dir / lock_path
@@ -390,5 +406,133 @@ class TestReapExpiredLocks(unittest.TestCase):
             self.assertEqual(reap_expired_locks(root), [])
 
 
+# ---------------------------------------------------------------------------
+# claim_lock / renew_lock
+# ---------------------------------------------------------------------------
+
+
+class TestClaimLock(unittest.TestCase):
+    """Unit tests for claim_lock()."""
+
+    def test_claims_free_obpi(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.assertIsNone(claim_lock(root, _make_lock(agent="a")))
+            self.assertEqual(read_lock(root, "OBPI-0.0.14-01").agent, "a")
+
+    def test_returns_live_holder_on_conflict(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            claim_lock(root, _make_lock(agent="a"))
+            holder = claim_lock(root, _make_lock(agent="b"))
+            self.assertEqual(holder.agent, "a")
+            self.assertEqual(read_lock(root, "OBPI-0.0.14-01").agent, "a")
+
+    def test_takes_over_expired_lock(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            old_time = (datetime.now(UTC) - timedelta(minutes=200)).isoformat()
+            write_lock(root, _make_lock(agent="a", claimed_at=old_time))
+            self.assertIsNone(claim_lock(root, _make_lock(agent="b")))
+            self.assertEqual(read_lock(root, "OBPI-0.0.14-01").agent, "b")
+
+    def test_concurrent_claims_have_one_winner(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            lock_dir(root)
+            barrier = threading.Barrier(24)
+            results: dict[str, LockData | None] = {}
+
+            def claim(agent: str) -> None:
+                barrier.wait()
+                results[agent] = claim_lock(root, _make_lock(agent=agent))
+
+            threads = [threading.Thread(target=claim, args=(f"agent-{n}",)) for n in range(24)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            winners = [agent for agent, holder in results.items() if holder is None]
+            self.assertEqual(len(winners), 1)
+            self.assertEqual(read_lock(root, "OBPI-0.0.14-01").agent, winners[0])
+            self.assertTrue(all(h is None or h.agent == winners[0] for h in results.values()))
+
+    def test_exclusive_create_without_fcntl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            with patch.object(lock_manager, "fcntl", None):
+                self.assertIsNone(claim_lock(root, _make_lock(agent="a")))
+                self.assertEqual(claim_lock(root, _make_lock(agent="b")).agent, "a")
+                self.assertEqual([lock.agent for lock in list_locks(root)], ["a"])
+
+
+class TestRenewLock(unittest.TestCase):
+    """Unit tests for renew_lock()."""
+
+    def test_moves_only_the_heartbeat(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            old_time = (datetime.now(UTC) - timedelta(minutes=100)).isoformat()
+            original = _make_lock(agent="a", claimed_at=old_time, ttl_minutes=120)
+            write_lock(root, original)
+
+            renewed = renew_lock(root, "OBPI-0.0.14-01", "a")
+
+            self.assertIsNotNone(renewed.heartbeat_at)
+            self.assertEqual(
+                renewed.model_dump(exclude={"heartbeat_at", "is_expired", "elapsed_minutes"}),
+                original.model_dump(exclude={"heartbeat_at", "is_expired", "elapsed_minutes"}),
+            )
+            self.assertEqual(read_lock(root, "OBPI-0.0.14-01"), renewed)
+
+    def test_heartbeat_extends_the_lease(self):
+        old_claim = (datetime.now(UTC) - timedelta(minutes=200)).isoformat()
+        recent = (datetime.now(UTC) - timedelta(minutes=10)).isoformat()
+        lock = _make_lock(claimed_at=old_claim, ttl_minutes=120)
+        self.assertTrue(lock.is_expired)
+        renewed = lock.model_copy(update={"heartbeat_at": recent})
+        self.assertFalse(renewed.is_expired)
+        self.assertGreaterEqual(renewed.elapsed_minutes, 199)
+
+    def test_refuses_foreign_missing_and_expired_locks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.assertIsNone(renew_lock(root, "OBPI-0.0.14-01", "a"))
+            write_lock(root, _make_lock(agent="a"))
+            self.assertIsNone(renew_lock(root, "OBPI-0.0.14-01", "b"))
+            old_time = (datetime.now(UTC) - timedelta(minutes=200)).isoformat()
+            write_lock(root, _make_lock("OBPI-0.0.14-02", agent="a", claimed_at=old_time))
+            self.assertIsNone(renew_lock(root, "OBPI-0.0.14-02", "a"))
+
+
+# ---------------------------------------------------------------------------
+# Outside changes
+# ---------------------------------------------------------------------------
+
+
+class TestOutsideChanges(unittest.TestCase):
+    """Locks added, removed or rewritten by hand are seen by the next read."""
+
+    def test_hand_edits_are_listed_and_reaped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_lock(root, _make_lock("OBPI-0.0.14-01"))
+            write_lock(root, _make_lock("OBPI-0.0.14-02"))
+            lock_path(root, "OBPI-0.0.14-02").unlink()
+            path = lock_path(root, "OBPI-0.0.14-01")
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload["agent"] = "hand-edited-agent"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            self.assertEqual([lock.agent for lock in list_locks(root)], ["hand-edited-agent"])
+
+            payload["claimed_at"] = (datetime.now(UTC) - timedelta(minutes=200)).isoformat()
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            self.assertEqual(
+                [lock.agent for lock in reap_expired_locks(root)], ["hand-edited-agent"]
+            )
+            self.assertEqual(list_locks(root), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,157 @@
+"""Tests for stat manifests and link materialization of skill mirrors."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit.config import GzkitConfig
+from gzkit.mirror_manifest import load_mirror_manifest, manifest_path
+from gzkit.skills import audit_skills
+from gzkit.sync_skills import sync_skill_mirror
+
+_SOURCE = ".gzkit/skills"
+_TARGET = ".claude/skills"
+
+
+def _write_canonical(root: Path, rel: str, text: str) -> Path:
+    path = root / _SOURCE / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestSyncSkillMirrorManifest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _write_canonical(self.root, "demo/SKILL.md", "# demo\n")
+        _write_canonical(self.root, "demo/assets/template.md", "asset\n")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_manifest_records_every_mirrored_file(self) -> None:
+        updated = sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        self.assertEqual(
+            updated, [f"{_TARGET}/demo/SKILL.md", f"{_TARGET}/demo/assets/template.md"]
+        )
+        manifest = load_mirror_manifest(self.root, _TARGET)
+        self.assertEqual(sorted(manifest), ["demo/SKILL.md", "demo/assets/template.md"])
+        self.assertTrue(manifest_path(self.root, _TARGET).is_file())
+
+    def test_unchanged_files_are_not_read_on_resync(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("read")):
+            self.assertEqual(sync_skill_mirror(self.root, _SOURCE, _TARGET), [])
+
+    def test_changed_source_is_resynced(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        _write_canonical(self.root, "demo/SKILL.md", "# demo, revised\n")
+        updated = sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        self.assertEqual(updated, [f"{_TARGET}/demo/SKILL.md"])
+        mirrored = self.root / _TARGET / "demo" / "SKILL.md"
+        self.assertEqual(mirrored.read_text(encoding="utf-8"), "# demo, revised\n")
+
+    def test_touched_but_identical_source_is_not_rewritten(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        source = self.root / _SOURCE / "demo" / "SKILL.md"
+        st = source.stat()
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        self.assertEqual(sync_skill_mirror(self.root, _SOURCE, _TARGET), [])
+
+    def test_corrupt_manifest_falls_back_to_content_compare(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        path = manifest_path(self.root, _TARGET)
+        path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(sync_skill_mirror(self.root, _SOURCE, _TARGET), [])
+        self.assertIn("demo/SKILL.md", load_mirror_manifest(self.root, _TARGET))
+
+    def test_hardlink_mode_shares_inode_and_replaces_copies(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        updated = sync_skill_mirror(self.root, _SOURCE, _TARGET, mode="hardlink")
+        self.assertEqual(len(updated), 2)
+        source = self.root / _SOURCE / "demo" / "SKILL.md"
+        mirrored = self.root / _TARGET / "demo" / "SKILL.md"
+        self.assertTrue(os.path.samefile(source, mirrored))
+        self.assertEqual(sync_skill_mirror(self.root, _SOURCE, _TARGET, mode="hardlink"), [])
+
+    def test_copy_mode_never_writes_through_a_hardlink(self) -> None:
+        sync_skill_mirror(self.root, _SOURCE, _TARGET, mode="hardlink")
+        source = self.root / _SOURCE / "demo" / "SKILL.md"
+        mirrored = self.root / _TARGET / "demo" / "SKILL.md"
+        mirrored.unlink()
+        sync_skill_mirror(self.root, _SOURCE, _TARGET)
+        self.assertFalse(os.path.samefile(source, mirrored))
+        self.assertEqual(source.read_text(encoding="utf-8"), "# demo\n")
+
+
+class TestMirrorParityUsesManifest(unittest.TestCase):
+    def _project(self, tmpdir: str, *, mode: str = "copy") -> tuple[Path, GzkitConfig]:
+        root = Path(tmpdir)
+        config = GzkitConfig.model_validate(
+            {"project_name": "gzkit-test", "skills": {"mirror_mode": mode}}
+        )
+        _write_canonical(
+            root,
+            "demo-skill/SKILL.md",
+            "---\nname: demo-skill\ndescription: Demo skill.\n---\n\n# demo-skill\n",
+        )
+        _write_canonical(root, "demo-skill/assets/template.md", "canonical asset\n")
+        for target in (
+            config.paths.codex_skills,
+            config.paths.claude_skills,
+            config.paths.copilot_skills,
+        ):
+            sync_skill_mirror(root, config.paths.skills, target, mode=config.skills.mirror_mode)
+        return root, config
+
+    def _drift_codes(self, root: Path, config: GzkitConfig) -> list[str]:
+        report = audit_skills(root, config)
+        return [i.code for i in report.issues if i.code == "SKA-MIRROR-ASSET-DRIFT"]
+
+    def test_synced_assets_are_accepted_without_reading(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = self._project(tmpdir)
+            real_read = Path.read_bytes
+
+            def guarded(path: Path) -> bytes:
+                if path.name == "template.md":
+                    raise AssertionError(f"asset read: {path}")
+                return real_read(path)
+
+            with patch.object(Path, "read_bytes", guarded):
+                self.assertEqual(self._drift_codes(root, config), [])
+
+    def test_mirror_edit_after_sync_is_still_drift(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = self._project(tmpdir)
+            asset = root / config.paths.claude_skills / "demo-skill" / "assets" / "template.md"
+            asset.write_text("edited in the mirror\n", encoding="utf-8")
+            self.assertEqual(self._drift_codes(root, config), ["SKA-MIRROR-ASSET-DRIFT"])
+
+    def test_hardlinked_mirrors_have_parity(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = self._project(tmpdir, mode="hardlink")
+            manifest_path(root, config.paths.claude_skills).unlink()
+            self.assertEqual(self._drift_codes(root, config), [])
+
+
+class TestSkillsConfig(unittest.TestCase):
+    def test_default_mirror_mode_is_not_saved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / ".gzkit.json"
+            GzkitConfig().save(path)
+            self.assertNotIn("skills", json.loads(path.read_text(encoding="utf-8")))
+
+    def test_mirror_mode_roundtrips(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / ".gzkit.json"
+            GzkitConfig.model_validate({"skills": {"mirror_mode": "hardlink"}}).save(path)
+            self.assertEqual(GzkitConfig.load(path).skills.mirror_mode, "hardlink")
+
+
+if __name__ == "__main__":
+    unittest.main()
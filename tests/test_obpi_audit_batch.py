@@ -0,0 +1,121 @@
+"""Tests for the single-run ADR-wide OBPI audit.
+
+@covers ADR-0.19.0
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit.commands import obpi_audit_cmd
+from gzkit.commands.obpi_audit_cmd import _audit_obpis, _scan_tests
+
+_ADR = "ADR-9.1.0"
+
+
+def _make_project(root: Path) -> None:
+    adr_dir = root / "docs" / "design" / "adr" / "pre-release" / f"{_ADR}-demo"
+    (adr_dir / "obpis").mkdir(parents=True)
+    for n in ("01", "02"):
+        (adr_dir / "obpis" / f"OBPI-9.1.0-{n}-demo.md").write_text(
+            "---\nstatus: Draft\nlane: Lite\n---\n", encoding="utf-8"
+        )
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "__init__.py").write_text("", encoding="utf-8")
+    (tests / "test_one.py").write_text(
+        '"""OBPI-9.1.0-01"""\nimport unittest\n\n\n'
+        "class T(unittest.TestCase):\n"
+        "    def test_a(self):\n        pass\n\n"
+        "    def test_b(self):\n        pass\n",
+        encoding="utf-8",
+    )
+    (tests / "test_two.py").write_text(
+        '"""OBPI-9.1.0-02"""\nimport unittest\n\n\n'
+        "class T(unittest.TestCase):\n"
+        "    def test_fails(self):\n        self.fail('boom')\n",
+        encoding="utf-8",
+    )
+    (tests / "helpers.py").write_text(f'# @covers("{_ADR}")\n', encoding="utf-8")
+
+
+class TestScanTests(unittest.TestCase):
+    def test_one_walk_groups_tests_and_collects_covers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _make_project(root)
+            by_obpi, covers = _scan_tests(root, _ADR, ["OBPI-9.1.0-01", "OBPI-9.1.0-02"])
+        self.assertEqual(by_obpi["OBPI-9.1.0-01"], [Path("tests/test_one.py")])
+        self.assertEqual(by_obpi["OBPI-9.1.0-02"], [Path("tests/test_two.py")])
+        self.assertEqual(covers, [f'# @covers("{_ADR}")'])
+
+
+class TestRunner(unittest.TestCase):
+    def test_runner_reports_per_module_results(self) -> None:
+        runner = Path(obpi_audit_cmd.__file__).with_name("obpi_audit_runner.py")
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _make_project(root)
+            spec = root / "spec.json"
+            out = root / "out.json"
+            groups = {"OBPI-9.1.0-01": ["tests.test_one"], "OBPI-9.1.0-02": ["tests.test_two"]}
+            spec.write_text(json.dumps({"groups": groups}), encoding="utf-8")
+            subprocess.run(
+                [sys.executable, str(runner), str(spec), str(out)],
+                cwd=root,
+                capture_output=True,
+                check=True,
+            )
+            payload = json.loads(out.read_text(encoding="utf-8"))
+        self.assertEqual(payload["modules"]["tests.test_one"], {"run": 2, "ok": True})
+        self.assertEqual(payload["modules"]["tests.test_two"], {"run": 1, "ok": False})
+        self.assertEqual(set(payload["coverage"]), set(groups))
+
+
+class TestAuditObpis(unittest.TestCase):
+    def test_adr_audit_runs_tests_once_and_splits_results(self) -> None:
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str], **_kwargs: object) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            spec = json.loads(Path(cmd[-2]).read_text(encoding="utf-8"))
+            self.assertEqual(
+                spec["groups"],
+                {"OBPI-9.1.0-01": ["tests.test_one"], "OBPI-9.1.0-02": ["tests.test_two"]},
+            )
+            Path(cmd[-1]).write_text(
+                json.dumps(
+                    {
+                        "modules": {
+                            "tests.test_one": {"run": 2, "ok": True},
+                            "tests.test_two": {"run": 1, "ok": False},
+                        },
+                        "coverage": {"OBPI-9.1.0-01": 55.0, "OBPI-9.1.0-02": 12.5},
+                    }
+                ),
+                encoding="utf-8",
+            )
+            return subprocess.CompletedProcess(cmd, 0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _make_project(root)
+            with patch.object(obpi_audit_cmd.subprocess, "run", side_effect=fake_run):
+                entries = _audit_obpis(root, _ADR, ["OBPI-9.1.0-01", "OBPI-9.1.0-02"])
+            ledger = next(root.rglob("obpi-audit.jsonl")).read_text(encoding="utf-8")
+
+        self.assertEqual(len(calls), 1)
+        first, second = (entry["evidence"] for entry in entries)
+        self.assertEqual((first["tests_passed"], first["test_count"]), (True, 2))
+        self.assertEqual(first["coverage_percent"], 55.0)
+        self.assertEqual((second["tests_passed"], second["test_count"]), (False, 1))
+        self.assertEqual(second["coverage_percent"], 12.5)
+        self.assertEqual(len(ledger.splitlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -381,6 +381,43 @@ class TestLockClaim(unittest.TestCase):
             data = json.loads(lf.read_text(encoding="utf-8"))
             self.assertEqual(data["ttl_minutes"], 240)
 
+    @patch("gzkit.commands.obpi_lock.get_project_root")
+    @patch("gzkit.commands.obpi_lock.ensure_initialized")
+    def test_renew_refreshes_heartbeat_without_ledger_event(self, mock_init, mock_root):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = _setup_project(tmp)
+            mock_root.return_value = root
+            mock_init.return_value = _mock_config()
+
+            obpi_lock_claim_cmd(
+                obpi_id="OBPI-0.0.14-01", ttl_minutes=120, as_json=False, agent="me"
+            )
+            ledger_path = root / ".gzkit" / "ledger.jsonl"
+            events_before = ledger_path.read_text(encoding="utf-8")
+            obpi_lock_claim_cmd(
+                obpi_id="OBPI-0.0.14-01", ttl_minutes=5, as_json=False, agent="me", renew=True
+            )
+
+            lock = read_lock(root, "OBPI-0.0.14-01")
+            self.assertIsNotNone(lock.heartbeat_at)
+            self.assertEqual(lock.ttl_minutes, 120)
+            self.assertEqual(ledger_path.read_text(encoding="utf-8"), events_before)
+
+    @patch("gzkit.commands.obpi_lock.get_project_root")
+    @patch("gzkit.commands.obpi_lock.ensure_initialized")
+    def test_renew_exits_1_when_not_held(self, mock_init, mock_root):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = _setup_project(tmp)
+            mock_root.return_value = root
+            mock_init.return_value = _mock_config()
+
+            with self.assertRaises(SystemExit) as ctx:
+                obpi_lock_claim_cmd(
+                    obpi_id="OBPI-0.0.14-01", ttl_minutes=120, as_json=True, renew=True
+                )
+            self.assertEqual(ctx.exception.code, 1)
+            self.assertIsNone(read_lock(root, "OBPI-0.0.14-01"))
+
     @patch("gzkit.commands.obpi_lock.get_project_root")
     @patch("gzkit.commands.obpi_lock.ensure_initialized")
     @covers("REQ-0.0.14-01-02")
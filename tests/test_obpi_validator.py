@@ -9,8 +9,9 @@ from datetime import date
 from pathlib import Path
 from unittest.mock import patch
 
+from gzkit.git_sync import assess_git_sync_readiness
 from gzkit.hooks.core import record_artifact_edit
-from gzkit.hooks.obpi import ObpiValidator
+from gzkit.hooks.obpi import ObpiValidator, collect_changed_files, section_body
 from gzkit.ledger import (
     Ledger,
     adr_created_event,
@@ -737,3 +738,57 @@ status: {status}
             "Changed-files audit found no modified paths. Completion requires live scope evidence.",
             errors,
         )
+
+    def _completed_briefs(self) -> list[Path]:
+        paths = [
+            self._create_obpi(
+                adr_id,
+                status="Completed",
+                summary="- Task: Finished implementation",
+                proof="Works as expected",
+                allowed_paths=[f"OBPI-{adr_id}-01.md", "src/**"],
+                commit=False,
+            )
+            for adr_id in ("ADR-0.1.0", "ADR-0.2.0", "ADR-0.3.0")
+        ]
+        outside = self.project_root / "docs" / "outside.md"
+        outside.parent.mkdir(parents=True, exist_ok=True)
+        outside.write_text("out of scope\n", encoding="utf-8")
+        return paths
+
+    def test_validate_files_matches_per_file_results(self):
+        paths = self._completed_briefs()
+        expected = {path: ObpiValidator(self.project_root).validate_file(path) for path in paths}
+        self.assertEqual(ObpiValidator(self.project_root).validate_files(paths), expected)
+
+    def test_validate_files_snapshots_repository_state_once(self):
+        paths = self._completed_briefs()
+        with (
+            patch(
+                "gzkit.hooks.obpi.collect_changed_files",
+                wraps=collect_changed_files,
+            ) as changed,
+            patch(
+                "gzkit.hooks.obpi.assess_git_sync_readiness",
+                wraps=assess_git_sync_readiness,
+            ) as readiness,
+        ):
+            results = self.validator.validate_files(paths)
+            self.assertEqual(changed.call_count, 1)
+            self.assertEqual(readiness.call_count, 1)
+            # Outside a batch every validation sees live state again.
+            self.validator.validate_file(paths[0])
+            self.assertEqual(changed.call_count, 2)
+        self.assertEqual(list(results), paths)
+
+
+class TestSectionBody(unittest.TestCase):
+    def test_first_nonempty_h2_then_h3(self):
+        content = (
+            "## Notes\n\n## Scope\nfirst\n### Scope\nnested\n## Scope\nsecond\n"
+            "### Notes\nh3 notes\n---\n## Tail\n"
+        )
+        self.assertEqual(section_body(content, "Scope"), "first\n### Scope\nnested")
+        self.assertEqual(section_body(content, "Notes"), "h3 notes")
+        self.assertIsNone(section_body(content, "Tail"))
+        self.assertIsNone(section_body(content, "Missing"))
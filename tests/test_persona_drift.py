@@ -7,16 +7,17 @@
 import json
 import tempfile
 import unittest
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
-from gzkit.personas import (
+from gzkit.ledger import Ledger
+from gzkit.persona_drift import (
+    PROXY_ACCUMULATORS,
     TRAIT_PROXY_REGISTRY,
-    _check_trait,
-    _completion_quality_proxy,
-    _evidence_quality_proxy,
-    _governance_activity_proxy,
-    _plan_discipline_proxy,
-    _test_evidence_proxy,
+    _AuditFinding,
+    _trait_result,
     evaluate_persona_drift,
 )
 from gzkit.traceability import covers
@@ -51,6 +52,19 @@ def _write_ledger(root: Path, events: list[dict]) -> None:
     ledger_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def _run_proxy(
+    proxy_name: str,
+    events: list[dict[str, object]] | None = None,
+    audits: list[dict[str, object]] | None = None,
+) -> tuple[str, str]:
+    accumulator = PROXY_ACCUMULATORS[proxy_name]()
+    for event in events or []:
+        accumulator.add_event(event)
+    for record in audits or []:
+        accumulator.add_audit(record)
+    return accumulator.result()
+
+
 def _write_audit_log(root: Path, records: list[dict]) -> None:
     log_dir = root / "docs" / "design" / "adr" / "test-adr" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -59,7 +73,7 @@ def _write_audit_log(root: Path, records: list[dict]) -> None:
 
 
 class TestTraitProxyRegistry(unittest.TestCase):
-    """Verify proxy registry maps known traits to functions."""
+    """Verify proxy registry maps known traits to proxy accumulators."""
 
     GOVERNANCE_TRAITS = ["governance-aware", "governance-fidelity", "evidence-anchoring"]
     TEST_TRAITS = ["test-first", "thorough", "architectural-rigor"]
@@ -72,16 +86,14 @@ class TestTraitProxyRegistry(unittest.TestCase):
         for trait in self.GOVERNANCE_TRAITS:
             with self.subTest(trait=trait):
                 self.assertIn(trait, TRAIT_PROXY_REGISTRY)
-                name, _fn = TRAIT_PROXY_REGISTRY[trait]
-                self.assertEqual(name, "governance_activity")
+                self.assertEqual(TRAIT_PROXY_REGISTRY[trait], "governance_activity")
 
     @covers("REQ-0.0.13-05-01")
     def test_test_traits_mapped(self) -> None:
         for trait in self.TEST_TRAITS:
             with self.subTest(trait=trait):
                 self.assertIn(trait, TRAIT_PROXY_REGISTRY)
-                name, _fn = TRAIT_PROXY_REGISTRY[trait]
-                self.assertEqual(name, "test_evidence")
+                self.assertEqual(TRAIT_PROXY_REGISTRY[trait], "test_evidence")
 
     @covers("REQ-0.0.13-05-01")
     def test_evidence_traits_mapped(self) -> None:
@@ -101,12 +113,22 @@ class TestTraitProxyRegistry(unittest.TestCase):
             with self.subTest(trait=trait):
                 self.assertIn(trait, TRAIT_PROXY_REGISTRY)
 
+    @covers("REQ-0.0.13-05-01")
+    def test_every_mapped_proxy_has_an_accumulator(self) -> None:
+        self.assertLessEqual(set(TRAIT_PROXY_REGISTRY.values()), set(PROXY_ACCUMULATORS))
+
     @covers("REQ-0.0.13-05-01")
     def test_unmapped_trait_returns_no_evidence(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            result = _check_trait("some-unknown-trait", Path(tmp), [], [])
-            self.assertEqual(result.status, "no_evidence")
-            self.assertEqual(result.proxy, "unmapped")
+        result = _trait_result("some-unknown-trait", None)
+        self.assertEqual(result.status, "no_evidence")
+        self.assertEqual(result.proxy, "unmapped")
+
+    def test_accumulator_without_override_fails_at_creation(self) -> None:
+        class _Incomplete(_AuditFinding):
+            _missing = "never"
+
+        with self.assertRaises(TypeError):
+            _Incomplete()
 
 
 class TestGovernanceActivityProxy(unittest.TestCase):
@@ -118,19 +140,19 @@ class TestGovernanceActivityProxy(unittest.TestCase):
             {"event": "gate_checked", "ts": "2026-01-01T00:00:00Z"},
             {"event": "attested", "ts": "2026-01-02T00:00:00Z"},
         ]
-        status, detail = _governance_activity_proxy(Path("."), events, [])
+        status, detail = _run_proxy("governance_activity", events)
         self.assertEqual(status, "pass")
         self.assertIn("2", detail)
 
     @covers("REQ-0.0.13-05-01")
     def test_fail_when_no_events(self) -> None:
-        status, _detail = _governance_activity_proxy(Path("."), [], [])
+        status, _detail = _run_proxy("governance_activity")
         self.assertEqual(status, "fail")
 
     @covers("REQ-0.0.13-05-01")
     def test_ignores_non_governance_events(self) -> None:
         events: list[dict[str, object]] = [{"event": "adr_created", "ts": "2026-01-01T00:00:00Z"}]
-        status, _detail = _governance_activity_proxy(Path("."), events, [])
+        status, _detail = _run_proxy("governance_activity", events)
         self.assertEqual(status, "fail")
 
 
@@ -142,7 +164,7 @@ class TestTestEvidenceProxy(unittest.TestCase):
         audits: list[dict[str, object]] = [
             {"evidence": {"test_count": 10, "tests_passed": True}},
         ]
-        status, detail = _test_evidence_proxy(Path("."), [], audits)
+        status, detail = _run_proxy("test_evidence", audits=audits)
         self.assertEqual(status, "pass")
         self.assertIn("10", detail)
 
@@ -151,12 +173,12 @@ class TestTestEvidenceProxy(unittest.TestCase):
         audits: list[dict[str, object]] = [
             {"evidence": {"test_count": 0, "tests_passed": True}},
         ]
-        status, _detail = _test_evidence_proxy(Path("."), [], audits)
+        status, _detail = _run_proxy("test_evidence", audits=audits)
         self.assertEqual(status, "fail")
 
     @covers("REQ-0.0.13-05-02")
     def test_fail_with_no_audits(self) -> None:
-        status, _detail = _test_evidence_proxy(Path("."), [], [])
+        status, _detail = _run_proxy("test_evidence")
         self.assertEqual(status, "fail")
 
 
@@ -174,13 +196,13 @@ class TestEvidenceQualityProxy(unittest.TestCase):
                 },
             },
         ]
-        status, _detail = _evidence_quality_proxy(Path("."), [], audits)
+        status, _detail = _run_proxy("evidence_quality", audits=audits)
         self.assertEqual(status, "pass")
 
     @covers("REQ-0.0.13-05-02")
     def test_fail_without_criteria(self) -> None:
         audits: list[dict[str, object]] = [{"evidence": {}}]
-        status, _detail = _evidence_quality_proxy(Path("."), [], audits)
+        status, _detail = _run_proxy("evidence_quality", audits=audits)
         self.assertEqual(status, "fail")
 
 
@@ -190,13 +212,13 @@ class TestCompletionQualityProxy(unittest.TestCase):
     @covers("REQ-0.0.13-05-02")
     def test_pass_with_completed_brief(self) -> None:
         audits: list[dict[str, object]] = [{"brief_status_after": "Completed"}]
-        status, _detail = _completion_quality_proxy(Path("."), [], audits)
+        status, _detail = _run_proxy("completion_quality", audits=audits)
         self.assertEqual(status, "pass")
 
     @covers("REQ-0.0.13-05-02")
     def test_pass_with_attestation(self) -> None:
         audits: list[dict[str, object]] = [{"action_taken": "attestation_recorded"}]
-        status, _detail = _completion_quality_proxy(Path("."), [], audits)
+        status, _detail = _run_proxy("completion_quality", audits=audits)
         self.assertEqual(status, "pass")
 
 
@@ -209,7 +231,7 @@ class TestPlanDisciplineProxy(unittest.TestCase):
             {"event": "adr_created", "ts": "2026-01-01T00:00:00Z"},
             {"event": "gate_checked", "ts": "2026-01-02T00:00:00Z"},
         ]
-        status, _detail = _plan_discipline_proxy(Path("."), events, [])
+        status, _detail = _run_proxy("plan_discipline", events)
         self.assertEqual(status, "pass")
 
     @covers("REQ-0.0.13-05-02")
@@ -217,7 +239,7 @@ class TestPlanDisciplineProxy(unittest.TestCase):
         events: list[dict[str, object]] = [
             {"event": "gate_checked", "ts": "2026-01-02T00:00:00Z"},
         ]
-        status, _detail = _plan_discipline_proxy(Path("."), events, [])
+        status, _detail = _run_proxy("plan_discipline", events)
         self.assertEqual(status, "fail")
 
 
@@ -229,7 +251,8 @@ class TestAntiTraitInversion(unittest.TestCase):
         events: list[dict[str, object]] = [
             {"event": "gate_checked", "ts": "2026-01-01T00:00:00Z"},
         ]
-        result = _check_trait("governance-aware", Path("."), events, [], is_anti_trait=True)
+        outcome = _run_proxy("governance_activity", events)
+        result = _trait_result("governance-aware", outcome, is_anti_trait=True)
         self.assertTrue(result.is_anti_trait)
         self.assertEqual(result.status, "pass")
         self.assertIn("inverse", result.detail)
@@ -302,3 +325,55 @@ class TestEvaluatePersonaDrift(unittest.TestCase):
             self.assertIn("total_checks", data)
             self.assertIn("drift_count", data)
             self.assertIn("scan_timestamp", data)
+
+
+class TestSinglePassEvaluation(unittest.TestCase):
+    """Drift evidence is streamed once and audit logs come from known paths."""
+
+    def _project(self, tmp: str) -> Path:
+        root = Path(tmp)
+        personas_dir = root / ".gzkit" / "personas"
+        personas_dir.mkdir(parents=True)
+        _write_persona(
+            personas_dir, "alpha", ["methodical", "governance-aware", "thorough"], ["scope-creep"]
+        )
+        _write_persona(personas_dir, "beta", ["plan-then-write", "complete-units"], [])
+        _write_ledger(
+            root,
+            [
+                {"event": "adr_created", "id": "ADR-0.1.0", "ts": "2026-01-01T00:00:00Z"},
+                {"event": "gate_checked", "id": "ADR-0.1.0", "ts": "2026-01-02T00:00:00Z"},
+            ],
+        )
+        return root
+
+    def test_ledger_streamed_once_for_all_proxies_and_personas(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._project(tmp)
+            original = Ledger.iter_records
+            calls: list[Path] = []
+
+            def counting(ledger: Ledger) -> Iterator[dict[str, Any]]:
+                calls.append(ledger.path)
+                return original(ledger)
+
+            with patch.object(Ledger, "iter_records", counting):
+                report = evaluate_persona_drift(root)
+        self.assertEqual(len(calls), 1)
+        statuses = {c.trait: c.status for p in report.personas for c in p.checks}
+        self.assertEqual(statuses["methodical"], "pass")
+        self.assertEqual(statuses["governance-aware"], "pass")
+        self.assertEqual(statuses["thorough"], "fail")
+
+    def test_audit_logs_read_from_adr_log_dirs_without_rglob(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = self._project(tmp)
+            log_dir = root / "docs" / "design" / "adr" / "pre-release" / "ADR-0.1.0-x" / "logs"
+            log_dir.mkdir(parents=True)
+            record = {"evidence": {"test_count": 3, "tests_passed": True}}
+            (log_dir / "obpi-audit.jsonl").write_text(json.dumps(record) + "\n", encoding="utf-8")
+            with patch.object(Path, "rglob", side_effect=AssertionError("rglob")):
+                report = evaluate_persona_drift(root, persona_name="alpha")
+        checks = {c.trait: c for c in report.personas[0].checks}
+        self.assertEqual(checks["thorough"].status, "pass")
+        self.assertIn("3 tests", checks["thorough"].detail)
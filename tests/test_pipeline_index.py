@@ -0,0 +1,99 @@
+"""Tests for the plan/brief pipeline index."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit.pipeline_index import PipelineIndex
+from gzkit.pipeline_runtime import find_obpi_brief, find_plan_for_obpi
+
+
+class TestPlanIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project_root = Path(self._tmp.name) / "proj"
+        self.plans = self.project_root / ".claude" / "plans"
+        self.plans.mkdir(parents=True)
+        home = Path(self._tmp.name) / "home"
+        (home / ".claude" / "plans").mkdir(parents=True)
+        self._env = patch.dict("os.environ", {"GZKIT_CLAUDE_HOME": str(home)})
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_warm_lookup_reads_no_plan(self) -> None:
+        (self.plans / "a.md").write_text("Plan for OBPI-0.25.0-26\n", encoding="utf-8")
+        (self.plans / "b.md").write_text("Plan for OBPI-0.25.0-27\n", encoding="utf-8")
+        self.assertEqual(find_plan_for_obpi(self.project_root, "OBPI-0.25.0-26").name, "a.md")
+        with patch("gzkit.pipeline_index._plan_tokens", side_effect=AssertionError("plan read")):
+            found = find_plan_for_obpi(self.project_root, "OBPI-0.25.0-27")
+        self.assertEqual(found, self.plans / "b.md")
+
+    def test_new_and_edited_plans_are_picked_up(self) -> None:
+        plan = self.plans / "a.md"
+        plan.write_text("Plan for OBPI-0.25.0-26\n", encoding="utf-8")
+        self.assertIsNone(find_plan_for_obpi(self.project_root, "OBPI-0.25.0-30"))
+        (self.plans / "b.md").write_text("Plan for OBPI-0.25.0-30\n", encoding="utf-8")
+        self.assertEqual(find_plan_for_obpi(self.project_root, "OBPI-0.25.0-30").name, "b.md")
+        plan.write_text("Revised plan for OBPI-0.25.0-31 and more\n", encoding="utf-8")
+        self.assertEqual(find_plan_for_obpi(self.project_root, "OBPI-0.25.0-31"), plan)
+
+    def test_whole_id_mentions_match_like_substring_search(self) -> None:
+        (self.plans / "a.md").write_text("Plan for (OBPI-0.25.0-26).\n", encoding="utf-8")
+        index = PipelineIndex(self.project_root)
+        self.assertEqual(len(index.plans_mentioning(self.plans, "OBPI-0.25.0-2")), 1)
+        self.assertEqual(index.plans_mentioning(self.plans, "OBPI-0.25.0-3"), [])
+
+
+class TestBriefIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project_root = Path(self._tmp.name)
+        (self.project_root / ".gzkit").mkdir()
+        self.docs = self.project_root / "docs" / "design" / "adr"
+        self.obpis = self.docs / "pre-release" / "ADR-0.1.0-demo" / "obpis"
+        self.obpis.mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matches_sorted_rglob(self) -> None:
+        (self.obpis / "OBPI-0.1.0-01-b.md").write_text("", encoding="utf-8")
+        (self.obpis / "OBPI-0.1.0-01-a.md").write_text("", encoding="utf-8")
+        expected = sorted(self.docs.rglob("OBPI-0.1.0-01*.md"))[0]
+        self.assertEqual(find_obpi_brief(self.docs, "OBPI-0.1.0-01"), expected)
+
+    def test_unchanged_tree_is_not_listed_again(self) -> None:
+        (self.obpis / "OBPI-0.1.0-01-a.md").write_text("", encoding="utf-8")
+        find_obpi_brief(self.docs, "OBPI-0.1.0-01")
+        with patch("gzkit.pipeline_index.os.scandir", side_effect=AssertionError("listed")):
+            found = find_obpi_brief(self.docs, "OBPI-0.1.0-01")
+        self.assertEqual(found, self.obpis / "OBPI-0.1.0-01-a.md")
+
+    def test_added_renamed_and_removed_briefs(self) -> None:
+        first = self.obpis / "OBPI-0.1.0-01-a.md"
+        first.write_text("", encoding="utf-8")
+        self.assertIsNone(find_obpi_brief(self.docs, "OBPI-0.2.0-01"))
+
+        other = self.docs / "pre-release" / "ADR-0.2.0-next" / "obpis"
+        other.mkdir(parents=True)
+        (other / "OBPI-0.2.0-01-x.md").write_text("", encoding="utf-8")
+        self.assertEqual(find_obpi_brief(self.docs, "OBPI-0.2.0-01"), other / "OBPI-0.2.0-01-x.md")
+
+        renamed = self.obpis / "OBPI-0.1.0-01-renamed.md"
+        os.rename(first, renamed)
+        self.assertEqual(find_obpi_brief(self.docs, "OBPI-0.1.0-01"), renamed)
+
+        for path in other.iterdir():
+            path.unlink()
+        other.rmdir()
+        other.parent.rmdir()
+        self.assertIsNone(find_obpi_brief(self.docs, "OBPI-0.2.0-01"))
+
+
+if __name__ == "__main__":
+    unittest.main()
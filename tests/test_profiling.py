@@ -0,0 +1,116 @@
+"""Tests for the ``gz --profile`` phase profiler."""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit import profiling
+from gzkit.cli.main import main
+
+
+class TestProfilerInactive(unittest.TestCase):
+    def test_span_and_count_are_noops_without_profiler(self) -> None:
+        self.assertIsNone(profiling.active_profiler())
+        with profiling.span("ledger.load"):
+            profiling.count("file_reads")
+        self.assertIsNone(profiling.active_profiler())
+
+
+class TestProfilerReport(unittest.TestCase):
+    def tearDown(self) -> None:
+        profiling.stop_profiling()
+
+    def test_nested_spans_merge_same_named_siblings(self) -> None:
+        profiler = profiling.start_profiling("abc123", command="gz status")
+        with profiling.span("status.collect"):
+            for _ in range(3):
+                with profiling.span("git", subcommand="log"):
+                    profiling.count("git_calls")
+        with profiling.span("render"):
+            pass
+        profiling.stop_profiling()
+
+        report = profiler.report()
+        self.assertEqual(report["correlation_id"], "abc123")
+        self.assertEqual(report["totals"], {"git_calls": 3})
+        tree = report["tree"]
+        self.assertEqual(tree["name"], "gz status")
+        self.assertEqual([c["name"] for c in tree["children"]], ["status.collect", "render"])
+        git = tree["children"][0]["children"][0]
+        self.assertEqual(git["calls"], 3)
+        self.assertEqual(git["counts"], {"git_calls": 3})
+        self.assertNotIn("attrs", git)
+
+    def test_single_span_keeps_attrs(self) -> None:
+        profiler = profiling.start_profiling("x")
+        with profiling.span("git", subcommand="rev-parse"):
+            pass
+        self.assertEqual(
+            profiler.report()["tree"]["children"][0]["attrs"], {"subcommand": "rev-parse"}
+        )
+
+    def test_span_closes_when_block_raises(self) -> None:
+        profiler = profiling.start_profiling("x")
+        with self.assertRaises(RuntimeError), profiling.span("validate.ledger"):
+            raise RuntimeError
+        self.assertIs(profiler.current, profiler.root)
+
+    def test_other_threads_do_not_open_spans(self) -> None:
+        profiler = profiling.start_profiling("x")
+
+        def worker() -> None:
+            with profiling.span("worker"):
+                profiling.count("file_reads")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        report = profiler.report()
+        self.assertNotIn("children", report["tree"])
+        self.assertEqual(report["totals"], {"file_reads": 1})
+
+    def test_span_works_as_decorator(self) -> None:
+        @profiling.span("artifact_scan")
+        def scan() -> int:
+            return 7
+
+        profiler = profiling.start_profiling("x")
+        self.assertEqual(scan(), 7)
+        self.assertEqual(scan(), 7)
+        self.assertEqual(profiler.report()["tree"]["children"][0]["calls"], 2)
+
+
+class TestProfileFlag(unittest.TestCase):
+    def _run(self, argv: list[str]) -> int:
+        def handler(**_kwargs: object) -> None:
+            with profiling.span("ledger.load"):
+                profiling.count("ledger_events", 5)
+
+        with patch.dict("gzkit.cli.parser_governance._HANDLER_CACHE", {"status": handler}):
+            return main(argv)
+
+    def test_profile_output_writes_timing_tree(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "profile.json"
+            self.assertEqual(self._run(["status", "--profile-output", str(output)]), 0)
+            report = json.loads(output.read_text(encoding="utf-8"))
+        self.assertEqual(report["tree"]["name"], "gz status")
+        self.assertEqual(report["totals"], {"ledger_events": 5})
+        self.assertTrue(report["correlation_id"])
+        self.assertIsNone(profiling.active_profiler())
+
+    def test_root_flag_position_and_cprofile_dump(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "profile.json"
+            stats = Path(tmp) / "gz.prof"
+            argv = ["--profile-output", str(output), "--profile-cprofile", str(stats), "status"]
+            self.assertEqual(self._run(argv), 0)
+            self.assertTrue(output.exists())
+            self.assertGreater(stats.stat().st_size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,13 @@
 @covers ADR-0.17.0  OBPI-0.17.0-04 json-schemas-and-validation
 """
 
+import json
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from typing import Literal, get_args, get_origin
+from unittest.mock import patch
 
 from pydantic import BaseModel
 
@@ -30,7 +35,14 @@ from gzkit.models.frontmatter import (
     ObpiFrontmatter,
     PrdFrontmatter,
 )
-from gzkit.schemas import get_schema_path, load_schema
+from gzkit.schemas import (
+    compiled_validator,
+    get_schema_path,
+    load_schema,
+    load_schema_file,
+    schema_file_validator,
+    schema_validator,
+)
 from gzkit.traceability import covers  # noqa: F401
 
 # ---------------------------------------------------------------------------
@@ -307,6 +319,66 @@ class TestSchemaLoading(unittest.TestCase):
             load_schema("nonexistent_schema_xyz")
 
 
+class TestSchemaRegistry(unittest.TestCase):
+    """Schemas and compiled validators are built once per process."""
+
+    def test_load_schema_is_parsed_once(self) -> None:
+        self.assertIs(load_schema("ledger"), load_schema("ledger"))
+
+    def test_validator_checks_schema_once(self) -> None:
+        from jsonschema import Draft202012Validator
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "demo.schema.json"
+            path.write_text(json.dumps({"type": "object", "required": ["id"]}), encoding="utf-8")
+            with patch.object(
+                Draft202012Validator,
+                "check_schema",
+                side_effect=Draft202012Validator.check_schema,
+            ) as check:
+                first = schema_file_validator(path)
+                second = schema_file_validator(path)
+            self.assertIs(first, second)
+            self.assertEqual(check.call_count, 1)
+            self.assertFalse(first.is_valid({}))
+
+    def test_schema_file_reloads_after_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "demo.schema.json"
+            path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+            before = schema_file_validator(path)
+            path.write_text(json.dumps({"type": "array"}), encoding="utf-8")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(load_schema_file(path), {"type": "array"})
+            after = schema_file_validator(path)
+            self.assertIsNot(before, after)
+            self.assertTrue(after.is_valid([]))
+
+    def test_reloads_and_ad_hoc_schemas_do_not_accumulate(self) -> None:
+        import gzkit.schemas as registry
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "demo.schema.json"
+            for n in range(3):
+                path.write_text(json.dumps({"type": "object", "title": f"v{n}"}), encoding="utf-8")
+                st = path.stat()
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + n * 1_000_000_000))
+                schema_file_validator(path)
+            entries = [p for p in registry._file_schemas if p == path.resolve()]
+            self.assertEqual(len(entries), 1)
+            self.assertEqual(registry._file_schemas[path.resolve()][1]["title"], "v2")
+        before = len(registry._schema_validators)
+        for _ in range(3):
+            self.assertTrue(compiled_validator({"type": "array"}).is_valid([]))
+        self.assertEqual(len(registry._schema_validators), before)
+
+    def test_packaged_schemas_compile(self) -> None:
+        for name in ("manifest", "persona"):
+            with self.subTest(schema=name):
+                self.assertIs(schema_validator(name), schema_validator(name))
+
+
 # ---------------------------------------------------------------------------
 # Control-surface model <-> .gzkit/schemas/ cross-validation
 # ---------------------------------------------------------------------------
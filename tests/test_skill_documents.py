@@ -0,0 +1,101 @@
+"""Tests for shared, cached SKILL.md parses in the skill audit."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gzkit import skill_documents
+from gzkit.config import GzkitConfig
+from gzkit.skill_documents import SkillDocuments
+from gzkit.skills import audit_skills
+
+_SKILL = """---
+name: demo-skill
+description: Demo skill.
+lifecycle_state: active
+owner: gzkit
+last_reviewed: 2099-01-01
+---
+
+# demo-skill
+
+Body.
+"""
+
+
+def _project(tmpdir: str) -> tuple[Path, GzkitConfig]:
+    root = Path(tmpdir)
+    config = GzkitConfig(project_name="gzkit-test")
+    for rel in (
+        config.paths.skills,
+        config.paths.codex_skills,
+        config.paths.claude_skills,
+        config.paths.copilot_skills,
+    ):
+        skill_file = root / rel / "demo-skill" / "SKILL.md"
+        skill_file.parent.mkdir(parents=True, exist_ok=True)
+        skill_file.write_text(_SKILL, encoding="utf-8")
+    return root, config
+
+
+class TestSkillDocuments(unittest.TestCase):
+    def test_identical_content_is_parsed_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, _config = _project(tmpdir)
+            real_parse = skill_documents.parse_skill_document
+            with patch.object(
+                skill_documents, "parse_skill_document", side_effect=real_parse
+            ) as parse:
+                docs = SkillDocuments(root)
+                parsed = [docs.get(path) for path in sorted(root.rglob("SKILL.md"))]
+            self.assertEqual(len(parsed), 4)
+            self.assertEqual(parse.call_count, 1)
+            self.assertEqual(parsed[0].frontmatter["name"], "demo-skill")
+
+    def test_missing_file_parses_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            doc = SkillDocuments(Path(tmpdir)).get(Path(tmpdir) / "nope" / "SKILL.md")
+            self.assertEqual(doc.frontmatter, {})
+
+    def test_stat_change_invalidates_cached_parse(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = _project(tmpdir)
+            skill_file = root / config.paths.skills / "demo-skill" / "SKILL.md"
+            docs = SkillDocuments(root)
+            docs.get(skill_file)
+            docs.save()
+            skill_file.write_text(_SKILL.replace("Demo skill.", "Changed skill."), "utf-8")
+            fresh = SkillDocuments(root).get(skill_file)
+            self.assertEqual(fresh.frontmatter["description"], "Changed skill.")
+
+
+class TestAuditReusesParses(unittest.TestCase):
+    def test_repeat_audit_reads_no_skill_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = _project(tmpdir)
+            first = audit_skills(root, config)
+            real_read = Path.read_bytes
+
+            def guarded(path: Path) -> bytes:
+                if path.name == "SKILL.md":
+                    raise AssertionError(f"SKILL.md read: {path}")
+                return real_read(path)
+
+            with patch.object(Path, "read_bytes", guarded):
+                second = audit_skills(root, config)
+            self.assertEqual(first.issues, second.issues)
+
+    def test_mirror_body_drift_detected_after_warm_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root, config = _project(tmpdir)
+            audit_skills(root, config)
+            mirror = root / config.paths.claude_skills / "demo-skill" / "SKILL.md"
+            mirror.write_text(_SKILL.replace("Body.", "Drifted body."), encoding="utf-8")
+            report = audit_skills(root, config)
+            codes = {i.code for i in report.issues if i.path.startswith(".claude/")}
+            self.assertIn("SKA-MIRROR-BODY-DRIFT", codes)
+
+
+if __name__ == "__main__":
+    unittest.main()
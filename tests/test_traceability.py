@@ -953,6 +953,18 @@ class TestCoversCLIOutput(unittest.TestCase):
         self.assertIn("entries", data)
         self.assertIn("summary", data)
 
+    def test_ndjson_streams_records_then_summary(self):
+        import json
+
+        code, output = self._run_covers(["--ndjson"])
+        self.assertEqual(code, 0)
+        records = [json.loads(line) for line in output.splitlines()]
+        kinds = [r["record"] for r in records]
+        self.assertEqual(kinds[-1], "summary")
+        self.assertEqual(kinds.count("summary"), 1)
+        self.assertEqual(kinds.count("req"), 2)
+        self.assertEqual(records[-1]["covered_reqs"], 1)
+
     def test_json_shows_coverage_data(self):
         import json
 
@@ -1119,6 +1119,37 @@ class TestDriftCmdExitCodes(unittest.TestCase):
             self.assertEqual(cm.exception.code, 1)
 
 
+class TestDriftNdjson(unittest.TestCase):
+    def test_ndjson_streams_findings_then_summary(self) -> None:
+        from unittest.mock import patch as _patch
+
+        from gzkit.commands.drift import drift_cmd
+
+        with tempfile.TemporaryDirectory() as tmp:
+            adr_dir = Path(tmp) / "adrs"
+            adr_dir.mkdir()
+            test_dir = Path(tmp) / "tests"
+            test_dir.mkdir()
+            (adr_dir / "OBPI-0.1.0-01-test.md").write_text(
+                _make_brief("OBPI-0.1.0-01-test", [("REQ-0.1.0-01-01", False, "Criterion")]),
+                encoding="utf-8",
+            )
+            out = io.StringIO()
+            with (
+                _patch("gzkit.commands.drift.get_changed_files", return_value=[]),
+                contextlib.redirect_stdout(out),
+                self.assertRaises(SystemExit),
+            ):
+                drift_cmd(as_ndjson=True, adr_dir=str(adr_dir), test_dir=str(test_dir))
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(
+            records[0], {"record": "finding", "kind": "unlinked", "id": "REQ-0.1.0-01-01"}
+        )
+        self.assertEqual(records[-1]["record"], "summary")
+        self.assertEqual(records[-1]["total_drift_count"], 1)
+
+
 class TestDriftHelpText(unittest.TestCase):
     """@covers REQ-0.20.0-04-06
     @covers OBPI-0.20.0-04-gz-drift-cli-surface
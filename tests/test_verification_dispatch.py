@@ -9,6 +9,7 @@ and edge cases (zero reqs, single req, all overlap, timeout/error).
 from __future__ import annotations
 
 import json
+import random
 import unittest
 
 from gzkit.pipeline_runtime import (
@@ -200,6 +201,28 @@ class TestComputePathOverlap(unittest.TestCase):
         overlaps = compute_path_overlap(scopes)
         self.assertEqual(overlaps, {})
 
+    def test_matches_pairwise_reference(self) -> None:
+        """Inverted-index overlaps equal the pairwise intersection, key order included."""
+        rng = random.Random(7)
+        paths = [f"tests/test_{n}.py" for n in range(12)]
+        scopes = [
+            _make_scope(req_index=i, test_paths=rng.sample(paths, rng.randint(0, 4)))
+            for i in range(1, 30)
+        ]
+        expected: dict[tuple[int, int], list[str]] = {}
+        for i, scope_a in enumerate(scopes):
+            for scope_b in scopes[i + 1 :]:
+                shared = sorted(set(scope_a.test_paths) & set(scope_b.test_paths))
+                if shared:
+                    expected[(scope_a.req_index, scope_b.req_index)] = shared
+        overlaps = compute_path_overlap(scopes)
+        self.assertEqual(overlaps, expected)
+        self.assertEqual(list(overlaps), list(expected))
+
+    def test_duplicate_path_within_scope_is_not_an_overlap(self) -> None:
+        scopes = [_make_scope(req_index=1, test_paths=["tests/test_a.py", "tests/test_a.py"])]
+        self.assertEqual(compute_path_overlap(scopes), {})
+
 
 # ---------------------------------------------------------------------------
 # partition_independent_groups
@@ -256,6 +279,18 @@ class TestPartitionIndependentGroups(unittest.TestCase):
         self.assertEqual(len(groups), 1)
         self.assertEqual(sorted(groups[0]), [1, 2, 3])
 
+    def test_index_partition_matches_overlap_partition(self) -> None:
+        rng = random.Random(11)
+        paths = [f"tests/test_{n}.py" for n in range(40)]
+        scopes = [
+            _make_scope(req_index=i, test_paths=rng.sample(paths, rng.randint(0, 2)))
+            for i in range(1, 50)
+        ]
+        self.assertEqual(
+            partition_independent_groups(scopes),
+            partition_independent_groups(scopes, compute_path_overlap(scopes)),
+        )
+
     def test_empty_scopes(self) -> None:
         groups = partition_independent_groups([], {})
         self.assertEqual(groups, [])
@@ -184,5 +184,31 @@ class TestShortFlags(unittest.TestCase):
         self.assertEqual(ctx.exception.code, 2)
 
 
+class TestProfileFlags(unittest.TestCase):
+    """--profile flags are registered with suppressed defaults."""
+
+    def test_profile_flags_parse(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_common_flags(parser)
+        ns = parser.parse_args(["--profile", "--profile-output", "p.json"])
+        self.assertTrue(ns.profile)
+        self.assertEqual(ns.profile_output, "p.json")
+
+    def test_profile_defaults_are_suppressed(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_common_flags(parser)
+        ns = parser.parse_args([])
+        self.assertFalse(hasattr(ns, "profile"))
+        self.assertFalse(hasattr(ns, "profile_cprofile"))
+
+    def test_root_value_survives_subparser(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_common_flags(parser)
+        sub = parser.add_subparsers(dest="command")
+        add_common_flags(sub.add_parser("status"))
+        self.assertTrue(parser.parse_args(["--profile", "status"]).profile)
+        self.assertTrue(parser.parse_args(["status", "--profile"]).profile)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ from gzkit.cli.helpers.standard_options import (
     add_dry_run_flag,
     add_force_flag,
     add_json_flag,
+    add_json_output_flags,
     add_table_flag,
 )
 from gzkit.traceability import covers
@@ -230,6 +231,31 @@ class TestAddAdrOption(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestAddJsonOutputFlags(unittest.TestCase):
+    """add_json_output_flags registers mutually exclusive --json and --ndjson."""
+
+    def test_dests(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_json_output_flags(parser)
+        self.assertTrue(parser.parse_args(["--ndjson"]).as_ndjson)
+        self.assertTrue(parser.parse_args(["--json"]).as_json)
+        ns = parser.parse_args([])
+        self.assertFalse(ns.as_json)
+        self.assertFalse(ns.as_ndjson)
+
+    def test_flags_are_mutually_exclusive(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_json_output_flags(parser)
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parser.parse_args(["--json", "--ndjson"])
+
+    def test_double_call_does_not_raise(self) -> None:
+        parser = argparse.ArgumentParser(prog="test")
+        add_json_output_flags(parser)
+        add_json_output_flags(parser, ndjson_help="Custom NDJSON help")
+        self.assertIn("Stream one JSON record per line", parser.format_help())
+
+
 class TestAddJsonFlagDest(unittest.TestCase):
     """add_json_flag must use dest='as_json'."""
 